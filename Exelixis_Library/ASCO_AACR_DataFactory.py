@@ -7,15 +7,26 @@ from selenium.webdriver.common.by import By
 from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException,NoSuchElementException,StaleElementReferenceException
 from selenium.webdriver.common.by import By
 import pandas as pd 
-from bs4 import BeautifulSoup
+import numpy as np
 from s2iTurbokit.s2iHelperFunctions import getReturnArray
-from s2iExtensions.Exelixis.AACRConfig import WEBSITE_CONFIG
+from s2iTurbokit.s2iMetrics import timed_function
+from s2iTurbokit.s2iWebKit import wait_until_present, snapshot_xpaths, snapshot_page_source, capture_page_source, get_snapshot_nodes, get_snapshot_section_nodes
+from Exelixis_Library.ASCO_AACR_DateTime import parse_date_time, parse_time_range, get_time_zone
 from logging import getLogger
 import re
 
-def initialize_combined_data():
+logger = getLogger(__name__)
+
+# Config keys that locate elements on the listing page rather than on a session page
+LISTING_CONFIG_KEYS = ('findelements', 'findelementss', 'session_link')
+
+def initialize_combined_data(row_type=False):
     """
     Initializes a dictionary with empty lists for storing combined event data.
+
+    Args:
+    row_type (bool): Add the 'Row Type' column normalize_session_times uses to tell sessions from presentations.
+                     Default is False.
  
     Returns:
     dict: Dictionary with keys for different event attributes and empty lists as values.
@@ -35,6 +46,7 @@ def initialize_combined_data():
           - 'Authors': List of authors.
           - 'Affiliations': List of affiliations.
           - 'Source': List of sources.
+          - 'Row Type': 'Session' or 'Presentation', only with row_type.
     """
     combined_data = {
         "Event Type": [],
@@ -54,6 +66,8 @@ def initialize_combined_data():
         "Details": [],
         "Source": []
     }
+    if row_type:
+        combined_data["Row Type"] = []
  
     presentation_variables = {
         "presentation_link_text": "",
@@ -64,73 +78,444 @@ def initialize_combined_data():
     return combined_data
 
 
-def convert_mutiple_dateformats(driver, xpath):
+class SessionRecord:
+    """
+    One scraped session (one date/time slot of a session page) and its presentations.
+
+    Rows in the initialize_combined_data() column layout are produced only when rows() is called,
+    so the session fields shared by every presentation row are stored once.
+    """
+
+    __slots__ = ('event_type', 'date', 'time', 'start_time', 'end_time', 'timezone', 'locations',
+                 'session_type', 'title', 'link', 'disease', 'authors', 'affiliations', 'url', 'presentations')
+
+    def __init__(self, event_type="", date="", time="", start_time="", end_time="", timezone="", locations=(),
+                 session_type="", title="", link="", disease="", authors="", affiliations="", url=""):
+        self.event_type = event_type
+        self.date = date
+        self.time = time
+        self.start_time = start_time
+        self.end_time = end_time
+        self.timezone = timezone
+        self.locations = list(locations)
+        # extract_session_type returns a list; journals written before it was joined still hold one
+        self.session_type = ";".join(session_type) if isinstance(session_type, (list, tuple)) else session_type
+        self.title = title
+        self.link = link
+        self.disease = disease
+        self.authors = authors
+        self.affiliations = affiliations
+        self.url = url
+        self.presentations = []
+
+    def add_presentation(self, **fields):
+        """Adds a presentation of this session. Takes the PresentationRecord fields as keyword arguments."""
+        presentation = PresentationRecord(self, **fields)
+        self.presentations.append(presentation)
+        return presentation
+
+    def row(self, row_type=False):
+        """Returns the session's own row in the initialize_combined_data(row_type) column order."""
+        location = ";".join(self.locations)
+        row = (self.event_type, self.date, self.time, self.start_time, self.end_time, self.timezone,
+               location, self.session_type, f"{self.session_type};{location};{self.title}", self.title,
+               self.link, self.disease, self.authors, self.affiliations, "No Details Found", self.url)
+        return row + ("Session",) if row_type else row
+
+    def rows(self, row_type=False):
+        """Yields the session row followed by one row per presentation."""
+        yield self.row(row_type)
+        for presentation in self.presentations:
+            yield presentation.row(row_type)
+
+    def to_dict(self):
+        """Returns a JSON-serializable dictionary of the session and its presentations, e.g. for the checkpoint journal."""
+        data = {name: getattr(self, name) for name in self.__slots__ if name != 'presentations'}
+        data['presentations'] = [presentation.to_dict() for presentation in self.presentations]
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuilds a session and its presentations from to_dict() output."""
+        data = dict(data)
+        presentations = data.pop('presentations', [])
+        session = cls(**data)
+        for presentation in presentations:
+            session.add_presentation(**presentation)
+        return session
+
+
+class PresentationRecord:
+    """A presentation of a session. Session-level columns are read from the parent SessionRecord."""
+
+    __slots__ = ('session', 'time', 'start_time', 'end_time', 'timezone', 'title', 'link', 'authors', 'affiliations', 'url')
+
+    def __init__(self, session, time="", start_time="", end_time="", timezone="", title="", link="",
+                 authors="", affiliations="", url=""):
+        self.session = session
+        self.time = time
+        self.start_time = start_time
+        self.end_time = end_time
+        self.timezone = timezone
+        self.title = title
+        self.link = link
+        self.authors = authors
+        self.affiliations = affiliations
+        self.url = url
+
+    def row(self, row_type=False):
+        """Returns the presentation's row in the initialize_combined_data(row_type) column order."""
+        session = self.session
+        row = (session.event_type, session.date, self.time, self.start_time, self.end_time, self.timezone,
+               ";".join(session.locations), session.session_type, f"{session.session_type};{session.locations};{self.title}",
+               self.title, self.link, session.disease, self.authors, self.affiliations, "No Details Found", self.url)
+        return row + ("Presentation",) if row_type else row
+
+    def to_dict(self):
+        """Returns a JSON-serializable dictionary of the presentation's own fields."""
+        return {name: getattr(self, name) for name in self.__slots__ if name != 'session'}
+
+
+def iter_session_rows(sessions, row_type=False):
+    """
+    Yields the rows of session records in the initialize_combined_data(row_type) column order, for the streaming row writers.
+
+    Args:
+    sessions (list): SessionRecord instances.
+    row_type (bool): End every row with its 'Row Type'. Default is False.
+
+    Returns:
+    iterator: One tuple per session and per presentation row.
+    """
+    for session in sessions:
+        yield from session.rows(row_type)
+
+
+HYPERLINK_PATTERN = re.compile(r'^=HYPERLINK\("(?P<url>[^"]*)",\s*"(?P<text>[^"]*)"\)$')
+
+
+def split_hyperlink(value):
+    """
+    Splits an Excel =HYPERLINK("url", "text") formula into its URL and text.
+
+    Args:
+    value (str): Cell value; anything that is not a HYPERLINK formula is returned as the text.
+
+    Returns:
+    tuple: (url or None, text)
+    """
+    match = HYPERLINK_PATTERN.match(value or "")
+    if match:
+        return match.group('url'), match.group('text')
+    return None, value
+
+
+def get_combined_data_arrow_schema():
+    """
+    Returns the typed Arrow schema of the combined data rows written by combined_rows_to_arrow.
+
+    Returns:
+    pyarrow.Schema: Schema with date and timestamp columns, dictionary-encoded categorical
+                    columns and plain URL columns in place of HYPERLINK formulas.
+    """
+    import pyarrow as pa
+
+    # Columns with few distinct values are dictionary-encoded
+    category = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ('Conference', category),
+        ('Date', pa.date32()),
+        ('Start', pa.timestamp('us')),
+        ('End', pa.timestamp('us')),
+        ('Time', pa.string()),
+        ('Time Zone', category),
+        ('Event Type', category),
+        ('Location', category),
+        ('Session Type', category),
+        ('Session Details', pa.string()),
+        ('Title', pa.string()),
+        ('Abs URL', pa.string()),
+        ('Abs Text', pa.string()),
+        ('Disease', category),
+        ('Authors', pa.string()),
+        ('Affiliations', pa.string()),
+        ('Details', pa.string()),
+        ('Source URL', pa.string()),
+    ])
+
+
+def combined_rows_to_arrow(columns, rows, conference=None):
+    """
+    Converts a batch of combined data rows into a typed Arrow table for Parquet output.
+
+    Args:
+    columns (list): Column names of the rows, as in initialize_combined_data().
+    rows (list): Rows in column order.
+    conference (str): Conference name used to partition the output. Default is each row's Event Type.
+
+    Returns:
+    pyarrow.Table: Table with the schema of get_combined_data_arrow_schema().
+    """
+    import pyarrow as pa
+
+    # Every source column is text: list cells (e.g. session types) are joined, other values stringified
+    rows = [[value if value is None or isinstance(value, str)
+             else ";".join(str(item) for item in value) if isinstance(value, (list, tuple))
+             else str(value) for value in row] for row in rows]
+    df = pd.DataFrame(rows, columns=columns).fillna("")
+    abs_links = df['Abs'].map(split_hyperlink)
+
+    typed = pd.DataFrame({
+        'Conference': conference if conference else df['Event Type'],
+        'Date': pd.to_datetime(df['Date'], errors='coerce', format='mixed').dt.date,
+        'Start': pd.to_datetime(df['Date'] + " " + df['Start Time'], errors='coerce', format='mixed'),
+        'End': pd.to_datetime(df['Date'] + " " + df['End Time'], errors='coerce', format='mixed'),
+        'Time': df['Time'],
+        'Time Zone': df['Time Zone'],
+        'Event Type': df['Event Type'],
+        'Location': df['Location'],
+        'Session Type': df['Session Type'],
+        'Session Details': df['Session Details'],
+        'Title': df['Title'],
+        'Abs URL': abs_links.str[0],
+        'Abs Text': abs_links.str[1],
+        'Disease': df['Disease'],
+        'Authors': df['Authors'],
+        'Affiliations': df['Affiliations'],
+        'Details': df['Details'],
+        'Source URL': df['Source'],
+    })
+    return pa.Table.from_pandas(typed, schema=get_combined_data_arrow_schema(), preserve_index=False)
+
+
+def open_combined_dataset(path):
+    """
+    Opens a Parquet dataset written with combined_rows_to_arrow and partitioned by Conference and Date.
+
+    The partition schema is given explicitly so Date reads back as a date and sessions without a
+    parseable date (the __HIVE_DEFAULT_PARTITION__ directory) read back as nulls.
+
+    Args:
+    path (str): Dataset root directory.
+
+    Returns:
+    pyarrow.dataset.Dataset: Dataset supporting filtered, column-pruned reads, e.g.
+                             dataset.to_table(columns=[...], filter=pyarrow.dataset.field('Conference') == '...').
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    partitioning = ds.partitioning(pa.schema([('Conference', pa.string()), ('Date', pa.date32())]), flavor='hive')
+    return ds.dataset(path, format='parquet', partitioning=partitioning)
+
+
+CLOCK_TIME_PATTERN = r'^\s*(?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?\s*(?P<meridiem>[AaPp])?'
+
+
+def _parse_clock_times(values):
+    """Vectorized clock time ('1:30 PM', '13:00:00') to timedelta since midnight; NaT where not a time."""
+    texts = values.fillna("").astype(str)
+    unique_texts = pd.Series(texts.unique())
+    parts = unique_texts.str.extract(CLOCK_TIME_PATTERN)
+
+    hours = pd.to_numeric(parts['hour'], errors='coerce').to_numpy(dtype=float)
+    meridiem = parts['meridiem'].fillna("").str.upper().to_numpy(dtype=str)
+    hours = np.where(meridiem == "", hours, hours % 12 + np.where(meridiem == "P", 12, 0))
+    seconds = (hours * 3600 + pd.to_numeric(parts['minute'], errors='coerce').to_numpy(dtype=float) * 60
+               + pd.to_numeric(parts['second'], errors='coerce').fillna(0).to_numpy(dtype=float))
+
+    clock_times = pd.Series(pd.to_timedelta(seconds, unit='s'), index=unique_texts.to_numpy())
+    return pd.Series(clock_times.reindex(texts.to_numpy()).to_numpy(), index=values.index)
+
+
+def _utc_offsets(values, local_times, default_timezone=None):
+    """
+    Vectorized time zone text ('CDT', 'GMT-5', 'CT') to UTC offset; default_timezone's offset (or NaT) where unknown.
+    Zones without daylight/standard (ET, CT, ...) take the offset in effect at the row's local time.
+    """
+    zones = values.fillna("").astype(str).str.strip()
+    default_tzinfo = get_time_zone(default_timezone)
+
+    offsets = {}
+    dated_zones = {}
+    for zone in zones.unique():
+        tzinfo = get_time_zone(zone) or default_tzinfo
+        offset = tzinfo.utcoffset(None) if tzinfo else pd.NaT
+        if offset is None:
+            dated_zones[zone] = tzinfo
+            offset = pd.NaT
+        offsets[zone] = offset
+    result = pd.to_timedelta(zones.map(offsets))
+
+    for zone, tzinfo in dated_zones.items():
+        rows = zones.eq(zone) & local_times.notna()
+        times = local_times[rows]
+        zone_offsets = {time: tzinfo.utcoffset(time.to_pydatetime()) for time in times.unique()}
+        result[rows] = pd.to_timedelta(times.map(zone_offsets))
+    return result
+
+
+def normalize_session_times(df, default_timezone=None):
+    """
+    Adds UTC start/end timestamps, a duration and an overlap flag to a combined data DataFrame, then sorts it by time.
+
+    Every step is a whole-column pandas operation; free-text values are parsed once per distinct value.
+
+    Args:
+    df (DataFrame): Rows in the initialize_combined_data() layout. With a 'Row Type' column (row_type=True),
+                    only session rows are checked for overlaps; otherwise every row is.
+    default_timezone (str): Time zone for rows without a recognized one, e.g. 'CDT'. Default is None (such rows get NaT).
+
+    Returns:
+    DataFrame: Copy of df sorted by 'Start UTC' (rows without a time last, original order kept for ties), with
+               the added columns 'Start UTC' and 'End UTC' (timezone-aware UTC), 'Duration (min)' and 'Overlap'
+               (True for sessions whose time overlaps another session of the same Event Type).
+    """
+    df = df.copy()
+
+    dates = df['Date'].fillna("").astype(str)
+    unique_dates = dates.unique()
+    parsed_dates = pd.Series(pd.to_datetime(pd.Series(unique_dates), errors='coerce', format='mixed').to_numpy(), index=unique_dates)
+    dates = pd.Series(parsed_dates.reindex(dates.to_numpy()).to_numpy(), index=df.index)
+
+    local_start = dates + _parse_clock_times(df['Start Time'])
+    offsets = _utc_offsets(df['Time Zone'], local_start, default_timezone)
+    start = local_start - offsets
+    end = dates + _parse_clock_times(df['End Time']) - offsets
+    end = end.where(~(end < start), end + pd.Timedelta(days=1))  # Ranges past midnight
+
+    df['Start UTC'] = start.dt.tz_localize('UTC')
+    df['End UTC'] = end.dt.tz_localize('UTC')
+    df['Duration (min)'] = (end - start).dt.total_seconds() / 60
+
+    df = df.sort_values('Start UTC', kind='stable', na_position='last')
+
+    # A session overlaps another if it starts before an earlier-starting one has ended, or ends after the next one starts
+    is_session = df['Row Type'].eq('Session') if 'Row Type' in df else True
+    sessions = df[is_session & df['Start UTC'].notna()]
+    conference = sessions['Event Type']
+    previous_end = sessions.groupby(conference, sort=False)['End UTC'].cummax().groupby(conference, sort=False).shift()
+    next_start = sessions.groupby(conference, sort=False)['Start UTC'].shift(-1)
+    overlap = (sessions['Start UTC'] < previous_end) | (sessions['End UTC'] > next_start)
+
+    df['Overlap'] = False
+    df.loc[overlap.index, 'Overlap'] = overlap
+    return df
+
+
+def get_session_xpaths(config):
+    """
+    Splits the session page XPaths of a conference config into document-level and section-relative XPaths.
+
+    Args:
+    config (dict): Conference configuration, e.g. the settings of load_config('asco').
+
+    Returns:
+    tuple: (document-level XPaths, presentation section XPath, section-relative XPaths).
+    """
+    section_xpath = config.get('presentation_section')
+    xpaths = []
+    section_xpaths = []
+    for key, value in config.items():
+        if key in LISTING_CONFIG_KEYS or not isinstance(value, str) or not value.startswith(('/', '.', '(')):
+            continue
+        if value.startswith('.'):
+            if value not in section_xpaths:
+                section_xpaths.append(value)
+        elif value != section_xpath and value not in xpaths:
+            xpaths.append(value)
+    return xpaths, section_xpath, section_xpaths
+
+
+@timed_function('extract')
+def take_session_snapshot(driver, config, source='script'):
+    """
+    Captures every session page XPath in config with a single browser round-trip.
+
+    Document-level XPaths are evaluated once; section-relative XPaths (starting with '.')
+    are evaluated inside every presentation section.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance showing a session detail page.
+    config (dict): Conference configuration, e.g. the settings of load_config('asco').
+    source (str): 'script' evaluates the XPaths inside the page with execute_script;
+                  'page_source' transfers the rendered DOM once and evaluates them with lxml in-process.
+
+    Returns:
+    dict: Dictionary containing status, message, and data (snapshot dictionary accepted by the
+          snapshot argument of the extractors in this module).
+    """
+    xpaths, section_xpath, section_xpaths = get_session_xpaths(config)
+
+    if source == 'page_source':
+        page_result = capture_page_source(driver)
+        if not page_result["status"]:
+            return page_result
+        page = page_result["data"][0]
+        return snapshot_page_source(page["html"], xpaths, section_xpath, section_xpaths, url=page["url"])
+
+    return snapshot_xpaths(driver, xpaths, section_xpath, section_xpaths)
+
+
+def parse_date_time_text(text):
+    """
+    Converts one website date/time string into structured date, start time, end time, and timezone.
+
+    The formats are registered in ASCO_AACR_DateTime; results are cached on the raw text.
+
+    Args:
+    text (str): Date/time text as displayed on the session page.
+
+    Returns:
+    dict: Dictionary with 'date' (ISO date str), 'start_time', 'end_time', 'timezone', 'time' (display strings)
+          and 'start', 'end' (datetime), or {'original_text': text} if the format is not recognized.
+    """
+    parsed = parse_date_time(text)
+    if parsed is None:
+        logger.warning(f"Unrecognized date/time format: {text!r}")
+        return {
+            'original_text': text.strip()  # Include original text if structured data cannot be parsed
+        }
+
+    return {
+        'date': parsed['date'].isoformat(),
+        'start_time': parsed['start_text'],
+        'end_time': parsed['end_text'],
+        'timezone': parsed['timezone'],
+        'time': parsed['start_text'] + "-" + parsed['end_text'],
+        'start': parsed['start'],
+        'end': parsed['end']
+    }
+
+
+@timed_function('extract')
+def convert_mutiple_dateformats(driver, xpath, snapshot=None):
     """
     Converts website time format into structured date, start time, end time, and timezone.
     
     Args:
     driver (WebDriver): Initialized WebDriver instance.
     xpath (str or list): XPath to locate elements or list of WebElement elements.
+    snapshot (dict): Optional page snapshot from take_session_snapshot; used instead of the live DOM when it covers xpath.
     
     Returns:
     dict: Dictionary containing status, message, and data (list of dictionaries with structured time information).
     """
     try:
-        if isinstance(xpath, str):
-            elements = driver.find_elements(By.XPATH, xpath)
+        nodes = get_snapshot_nodes(snapshot, xpath) if isinstance(xpath, str) else None
+        if nodes is not None:
+            texts = [node['text'] for node in nodes]
+        elif isinstance(xpath, str):
+            texts = [element.text for element in driver.find_elements(By.XPATH, xpath)]
         elif isinstance(xpath, list):
-            elements = xpath
+            texts = [element.text for element in xpath]
         else:
             return getReturnArray(False, "Invalid type for xpath", [])
 
-        if not elements:
+        if not texts:
             return getReturnArray(False, f"No elements found using XPath: {xpath}", [])
 
-        date_time_text = []
-        for element in elements:
-            text = element.text.strip()
-            parts = text.split()
-
-            try:
-                # Check for Format 1: "31 May 2024 13:00 – 14:15 GMT-5"
-                if len(parts) >= 9 and parts[-1].startswith(('PST', 'GMT', 'CDT')):
-                    date = parts[1].strip(',') + "-" + parts[0] + "-" + parts[2]
-                    start_time = parts[3] + " " + parts[4]
-                    end_time = parts[6] + " " + parts[7]
-                    timezone = parts[8]
-                    time = start_time + "-" + end_time
-
-                # Check for Format 2: "2024-05-31 13:00 – 14:15"
-                elif len(parts) >= 5 and parts[1].count('-') == 2 and parts[2].count(':') == 2:
-                    date = parts[1]
-                    start_time = parts[2]
-                    end_time = parts[4]
-                    timezone = None
-                    time = start_time + "-" + end_time
-
-                # Check for New Format: "April 7, 2024, 1:30 PM - 5:00 PM"
-                elif len(parts) >= 7 and ',' in parts[1]:
-                    month_day_year = parts[1].strip(',')
-                    date = month_day_year.replace(',', '-') + "-" + parts[0]
-                    start_time = parts[3] + " " + parts[4]
-                    end_time = parts[6] + " " + parts[7]
-                    timezone = None
-                    time = start_time + "-" + end_time
-
-                else:
-                    raise ValueError("Unrecognized format")
-
-                date_time_text.append({
-                    'date': date,
-                    'start_time': start_time,
-                    'end_time': end_time,
-                    'timezone': timezone,
-                    'time': time
-                })
-            except Exception as e:
-                date_time_text.append({
-                    'original_text': text  # Include original text if structured data cannot be parsed
-                })
+        date_time_text = [parse_date_time_text(text) for text in texts]
 
         return getReturnArray(True, "Time extraction successful", date_time_text)
 
@@ -141,13 +526,15 @@ def convert_mutiple_dateformats(driver, xpath):
         return getReturnArray(False, f"Error while extracting time: {e}", [])
     
 
-def extract_locations(driver, xpath):
+@timed_function('extract')
+def extract_locations(driver, xpath, snapshot=None):
     """
     Extracts location information from elements found by XPath.
     
     Args:
     driver (WebDriver): Initialized WebDriver instance.
     xpath (str): XPath to locate location elements.
+    snapshot (dict): Optional page snapshot from take_session_snapshot; used instead of the live DOM when it covers xpath.
     
     Returns:
     dict: Dictionary containing status, message, and data (list of location texts extracted from elements, or None if there's an error).
@@ -156,8 +543,15 @@ def extract_locations(driver, xpath):
         if not xpath:
             return getReturnArray(False, "No location XPath provided", None)
        
+        nodes = get_snapshot_nodes(snapshot, xpath)
+        if nodes is not None:
+            if not nodes:
+                return getReturnArray(False, f"No location elements in page snapshot for XPath: {xpath}", None)
+            location_texts = [node['text'].strip().replace("Location", "").strip() for node in nodes]
+            return getReturnArray(True, "Locations extracted successfully", location_texts)
+
         # Wait for all location elements to be present
-        locations = WebDriverWait(driver, 10).until(EC.presence_of_all_elements_located((By.XPATH, xpath)))
+        locations = wait_until_present(driver, xpath, 10, 'locations')
         location_texts = [location_element.text.strip().replace("Location", "").strip() for location_element in locations]
        
         return getReturnArray(True, "Locations extracted successfully", location_texts)
@@ -168,19 +562,27 @@ def extract_locations(driver, xpath):
         return getReturnArray(False, f"Error while extracting locations: {e}", None)
     
 
-def extract_event_type(driver, xpath):
+@timed_function('extract')
+def extract_event_type(driver, xpath, snapshot=None):
     """
     Extracts event types from elements found by XPath.
     
     Args:
     driver (WebDriver): Initialized WebDriver instance.
     xpath (str): XPath to locate event type elements.
+    snapshot (dict): Optional page snapshot from take_session_snapshot; used instead of the live DOM when it covers xpath.
     
     Returns:
     dict: Dictionary containing status, message, and data (list of event types extracted from elements, or empty list if not found or on error).
     """
     try:
-        event_type_elements = WebDriverWait(driver, 10).until(EC.presence_of_all_elements_located((By.XPATH, xpath)))
+        nodes = get_snapshot_nodes(snapshot, xpath)
+        if nodes is not None:
+            if not nodes:
+                return getReturnArray(False, "Event type elements not found in page snapshot", [])
+            return getReturnArray(True, "Event types extracted successfully", [node['text'].strip() for node in nodes])
+
+        event_type_elements = wait_until_present(driver, xpath, 10, 'event_type')
         event_types = [event_type_element.text.strip() for event_type_element in event_type_elements]
         return getReturnArray(True, "Event types extracted successfully", event_types)
    
@@ -192,19 +594,27 @@ def extract_event_type(driver, xpath):
         return getReturnArray(False, f"Error while extracting event type: {e}", [])
     
 
-def extract_session_type(driver, xpath):
+@timed_function('extract')
+def extract_session_type(driver, xpath, snapshot=None):
     """
     Extracts session types from elements found by XPath.
  
     Args:
     driver (WebDriver): Initialized WebDriver instance.
     xpath (str): XPath to locate session type elements.
+    snapshot (dict): Optional page snapshot from take_session_snapshot; used instead of the live DOM when it covers xpath.
  
     Returns:
     list: List of session types extracted from elements, or empty list if not found or on error.
     """
     try:
-        session_type_elements = WebDriverWait(driver, 10).until(EC.presence_of_all_elements_located((By.XPATH, xpath)))
+        nodes = get_snapshot_nodes(snapshot, xpath)
+        if nodes is not None:
+            if not nodes:
+                return getReturnArray(False, "Session type elements not found in page snapshot", [])
+            return getReturnArray(True, "Session types extracted successfully", [node['text'].strip() for node in nodes])
+
+        session_type_elements = wait_until_present(driver, xpath, 10, 'session_type')
         session_types = [session_type_element.text.strip() for session_type_element in session_type_elements]
         return getReturnArray(True, "Session types extracted successfully", session_types)
         
@@ -217,19 +627,27 @@ def extract_session_type(driver, xpath):
         return getReturnArray(False, f"Error while extracting session type: {e}", [])
 
 
-def extract_disease(driver, xpath):
+@timed_function('extract')
+def extract_disease(driver, xpath, snapshot=None):
     """
     Extracts disease information from elements found by XPath.
     
     Args:
     driver (WebDriver): Initialized WebDriver instance.
     xpath (str): XPath to locate disease elements.
+    snapshot (dict): Optional page snapshot from take_session_snapshot; used instead of the live DOM when it covers xpath.
     
     Returns:
     dict: Dictionary containing status, message, and data (list of diseases extracted from elements, or empty list if not found or on error).
     """
     try:
-        disease_elements = WebDriverWait(driver, 10).until(EC.presence_of_all_elements_located((By.XPATH, xpath)))
+        nodes = get_snapshot_nodes(snapshot, xpath)
+        if nodes is not None:
+            if not nodes:
+                return getReturnArray(False, "Disease elements not found in page snapshot", [])
+            return getReturnArray(True, "Diseases extracted successfully", [node['text'].strip().replace("Track", "").strip() for node in nodes])
+
+        disease_elements = wait_until_present(driver, xpath, 10, 'disease')
         diseases = [disease_element.text.strip().replace("Track", "").strip() for disease_element in disease_elements]
         return getReturnArray(True, "Diseases extracted successfully", diseases)
     
@@ -241,44 +659,64 @@ def extract_disease(driver, xpath):
         return getReturnArray(False, f"Error while extracting disease: {e}", [])
     
     
-def extract_presentation_time(driver, xpath):
+def parse_presentation_time_text(presentation_time_text):
+    """
+    Converts one presentation time string into start time, end time and time zone.
+
+    Args:
+    presentation_time_text (str): Presentation time text, e.g. "1:30 PM – 1:42 PM CDT".
+
+    Returns:
+    dict: Dictionary with 'p_time', 'p_start_time', 'p_end_time' and 'p_time_zone' keys, plus
+          'p_start' and 'p_end' (datetime.time, None if no time was found).
+    """
+    parsed = parse_time_range(presentation_time_text)
+
+    if parsed:
+        p_start_time = parsed['start_text']
+        p_end_time = parsed['end_text']
+        p_time_zone = parsed['timezone'] or "No Time Zone"
+        p_time = f"{p_start_time} - {p_end_time}"
+    else:
+        p_time = "No Time"
+        p_start_time = "No Time"
+        p_end_time = "No Time"
+        p_time_zone = "No Time Zone"
+
+    return {
+        'p_time': p_time,
+        'p_start_time': p_start_time,
+        'p_end_time': p_end_time,
+        'p_time_zone': p_time_zone,
+        'p_start': parsed['start'] if parsed else None,
+        'p_end': parsed['end'] if parsed else None
+    }
+
+
+@timed_function('extract')
+def extract_presentation_time(driver, xpath, snapshot=None):
     """
     Extracts presentation time information from elements found by XPath.
     
     Args:
     driver (WebDriver): Initialized WebDriver instance.
     xpath (str): XPath to locate presentation time elements.
+    snapshot (dict): Optional page snapshot from take_session_snapshot; used instead of the live DOM when it covers xpath.
     
     Returns:
     dict: Dictionary containing status, message, and data (list of dictionaries with presentation time details,
           or empty list if not found or on error).
     """
     try:
-        presentation_time_elements = WebDriverWait(driver, 10).until(EC.presence_of_all_elements_located((By.XPATH, xpath)))
-        presentation_times = []
-        
-        for presentation_time_element in presentation_time_elements:
-            presentation_time_text = presentation_time_element.text.strip()
-            pattern = r'(\d{1,2}:\d{2} [AP]M) – (\d{1,2}:\d{2} [AP]M) (PST|GMT|CDT)'
-            matches = re.search(pattern, presentation_time_text)
-            
-            if matches:
-                p_start_time = matches.group(1)
-                p_end_time = matches.group(2)
-                p_time_zone = matches.group(3)
-                p_time = f"{p_start_time} - {p_end_time}"
-            else:
-                p_time = "No Time"
-                p_start_time = "No Time"
-                p_end_time = "No Time"
-                p_time_zone = "No Time Zone"
-            
-            presentation_times.append({
-                'p_time': p_time,
-                'p_start_time': p_start_time,
-                'p_end_time': p_end_time,
-                'p_time_zone': p_time_zone
-            })
+        nodes = get_snapshot_nodes(snapshot, xpath)
+        if nodes is not None:
+            if not nodes:
+                return getReturnArray(False, "Presentation time elements not found in page snapshot", [])
+            presentation_times = [parse_presentation_time_text(node['text']) for node in nodes]
+            return getReturnArray(True, "Presentation times extracted successfully", presentation_times)
+
+        presentation_time_elements = wait_until_present(driver, xpath, 10, 'presentation_time')
+        presentation_times = [parse_presentation_time_text(element.text) for element in presentation_time_elements]
         return getReturnArray(True, "Presentation times extracted successfully", presentation_times)
     
     except TimeoutException:
@@ -289,20 +727,28 @@ def extract_presentation_time(driver, xpath):
         return getReturnArray(False, f"Error while extracting presentation time: {e}", [])
     
 
-def extract_session_authors(driver, xpath):
+@timed_function('extract')
+def extract_session_authors(driver, xpath, snapshot=None):
     """
     Extracts session authors from elements located by XPath.
     
     Args:
     driver (WebDriver): Initialized WebDriver instance.
     xpath (str): XPath to locate session authors.
+    snapshot (dict): Optional page snapshot from take_session_snapshot; used instead of the live DOM when it covers xpath.
     
     Returns:
     dict: Dictionary containing status, message, and data (semi-colon separated string of session authors' names,
           or empty list if not found or on error).
     """
     try:
-        session_authors_elements = WebDriverWait(driver, 20).until(EC.presence_of_all_elements_located((By.XPATH, xpath)))
+        nodes = get_snapshot_nodes(snapshot, xpath)
+        if nodes is not None:
+            if not nodes:
+                return getReturnArray(False, "Session authors elements not found in page snapshot", "")
+            return getReturnArray(True, "Session authors extracted successfully", '; '.join([node['text'].strip() for node in nodes]))
+
+        session_authors_elements = wait_until_present(driver, xpath, 20, 'session_authors')
         
         session_authors = '; '.join([author.text.strip() for author in session_authors_elements])
         return getReturnArray(True, "Session authors extracted successfully", session_authors)
@@ -315,20 +761,28 @@ def extract_session_authors(driver, xpath):
         return getReturnArray(False, f"Error extracting session authors: {e}", "")
     
 
-def extract_session_authors_affiliations(driver, xpath):
+@timed_function('extract')
+def extract_session_authors_affiliations(driver, xpath, snapshot=None):
     """
     Extracts session authors' affiliations from elements located by XPath.
     
     Args:
     driver (WebDriver): Initialized WebDriver instance.
     xpath (str): XPath to locate session authors' affiliations.
+    snapshot (dict): Optional page snapshot from take_session_snapshot; used instead of the live DOM when it covers xpath.
     
     Returns:
     dict: Dictionary containing status, message, and data (semi-colon separated string of session authors' affiliations,
           or empty list if not found or on error).
     """
     try:
-        session_authors_affiliations_elements = WebDriverWait(driver, 20).until(EC.presence_of_all_elements_located((By.XPATH, xpath)))
+        nodes = get_snapshot_nodes(snapshot, xpath)
+        if nodes is not None:
+            if not nodes:
+                return getReturnArray(False, "Session authors' affiliations elements not found in page snapshot", "")
+            return getReturnArray(True, "Session authors' affiliations extracted successfully", '; '.join([node['text'].strip() for node in nodes]))
+
+        session_authors_affiliations_elements = wait_until_present(driver, xpath, 20, 'session_authors_affiliations')
         
         session_authors_affiliations = '; '.join([affiliation.text.strip() for affiliation in session_authors_affiliations_elements])
         return getReturnArray(True, "Session authors' affiliations extracted successfully", session_authors_affiliations)
@@ -341,169 +795,36 @@ def extract_session_authors_affiliations(driver, xpath):
         return getReturnArray(False, f"Error extracting session authors' affiliations: {e}", "")
 
 
-# Add the corrected extract_presentation_titles function here
-
-def extract_presentation_titles(driver, xpath):
-    """
-    Extracts presentation titles from elements located by XPath.
-    
-    Args:
-    driver (WebDriver): Initialized WebDriver instance.
-    xpath (str): XPath to locate presentation titles.
-    
-    Returns:
-    dict: Dictionary containing status, message, and data (list of presentation titles,
-          or empty list if not found or on error).
-    """
-    presentation_titles = []
-    
-    try:
-        extract_presentation_section = WEBSITE_CONFIG['asco'].get('presentation_section')
-        presentation_sections = WebDriverWait(driver, 20).until(EC.presence_of_all_elements_located((By.XPATH, extract_presentation_section)))
-        
-        for section in presentation_sections:
-            try:
-                # Get Presentation Title
-                presentation_title = section.find_element(By.XPATH, xpath).text.strip()
-                presentation_titles.append(presentation_title)
-                
-            except NoSuchElementException as e:
-               return getReturnArray(False, f"No presentation titles found using XPath: {xpath}", [])
-            except Exception as e:
-            
-               return getReturnArray(False, f"Error while extracting presentation titles: {e}", [])
-            
-        return getReturnArray(True, "Presentation titles extracted successfully", presentation_titles)
-    
-    except TimeoutException:
-        return getReturnArray(False, "Timeout while locating presentation sections", [])
-    except Exception as e:
-        return getReturnArray(False, f"Error while extracting presentation titles: {e}", [])
- 
- 
- 
-
-def extract_presentation_authors(driver, xpath):
-    """
-    Extracts presentation authors from elements located by XPath.
-    
-    Args:
-    driver (WebDriver): Initialized WebDriver instance.
-    xpath (str): XPath to locate presentation authors.
-    
-    Returns:
-    dict: Dictionary containing status, message, and data (list of strings representing authors for each presentation,
-          or empty list if not found or on error).
-    """
-    authors_list = []
-    
-    try:
-        # Get the XPath for the presentation section from configuration
-        extract_presentation_section = WEBSITE_CONFIG['asco'].get('presentation_section')
-        if not extract_presentation_section:
-
-            return getReturnArray(False, "Presentation section XPath not configured", [])
- 
-        # Locate all presentation sections
-        presentation_sections = WebDriverWait(driver, 20).until(EC.presence_of_all_elements_located((By.XPATH, extract_presentation_section)))
-       
-        for section in presentation_sections:
-            try:
-                # Get Authors
-                authors = section.find_elements(By.XPATH, xpath)
-
-                if not authors:
-                    raise NoSuchElementException(f"No presentation authors found using XPath: {xpath}")
-               
-                # Ensure each author's text is a string
-                authors_text = ';'.join([str(author.text).strip() for author in authors if author.text.strip()])
-                if not authors_text:
-                    authors_text = "No authors found"
- 
-                authors_list.append(authors_text)
-               
-            except NoSuchElementException as e:
-                authors_list.append("No authors found")
-            except Exception as e:
-                authors_list.append(f"Error: {str(e)}")
-       
-        return getReturnArray(True, "Presentation authors extracted successfully", authors_list)
-   
-    except TimeoutException:
-        return getReturnArray(False, "Timeout while locating presentation sections", [])
-    except Exception as e:
-        return getReturnArray(False, f"Error while extracting presentation authors: {e}", [])
-    
-    
-
-def extract_presentation_affiliations(driver, xpath):
-    """
-    Extracts presentation affiliations from elements located by XPath.
-    
-    Args:
-    driver (WebDriver): Initialized WebDriver instance.
-    xpath (str): XPath to locate presentation affiliations.
-    
-    Returns:
-    dict: Dictionary containing status, message, and data (list of strings representing affiliations for each presentation,
-          or empty list if not found or on error).
-    """
-    affiliations_list = []
-    
-    try:
-        extract_presentation_section = WEBSITE_CONFIG['asco'].get('presentation_section')
-        if not extract_presentation_section:
-            return getReturnArray(False, "Presentation section XPath not configured", [])
- 
-        presentation_sections = WebDriverWait(driver, 20).until(EC.presence_of_all_elements_located((By.XPATH, extract_presentation_section)))
-       
-        for section in presentation_sections:
-            try:
-                # Get Affiliations
-                affiliations = section.find_elements(By.XPATH, xpath)
-                if not affiliations:
-                    raise NoSuchElementException("No presentation affiliations found using XPath: {xpath}")
-       
-                affiliations_text = ';'.join([affiliation.text.strip() for affiliation in affiliations])
-                affiliations_list.append(affiliations_text)
- 
-            except NoSuchElementException as e:
-                affiliations_list.append("No affiliations found")
-            except Exception as e:
-                affiliations_list.append(f"Error: {str(e)}")
-       
-        return getReturnArray(True, "Presentation affiliations extracted successfully", affiliations_list)
-   
-    except TimeoutException:
-        return getReturnArray(False, "Timeout while locating presentation sections", [])
-    except Exception as e:
-        return getReturnArray(False, f"Error while extracting presentation affiliations: {e}", [])
-    
-
-def get_presentationLink(driver, xpath):
+@timed_function('extract')
+def get_presentationLink(driver, xpath, snapshot=None):
     """
     Extracts presentation link and associated text from elements located by XPath.
     
     Args:
     driver (WebDriver): Initialized WebDriver instance.
     xpath (str): XPath to locate the presentation links.
+    snapshot (dict): Optional page snapshot from take_session_snapshot; used instead of the live DOM when it covers xpath.
     
     Returns:
     dict: Dictionary containing status, message, and data (list of dictionaries containing presentation link text values and texts,
           or a list with one dictionary with "No Presentations" if not found).
     """
     try:
-        presentation_link_elements = driver.find_elements(By.XPATH, xpath)
-        if not presentation_link_elements:
+        nodes = get_snapshot_nodes(snapshot, xpath)
+        if nodes is not None:
+            links = [(node['href'], node['text']) for node in nodes]
+        else:
+            links = [(element.get_attribute('href'), element.text) for element in driver.find_elements(By.XPATH, xpath)]
+
+        if not links:
             return getReturnArray(True, "No presentations found", [{
                 'presentation_link_text_value': "No Presentations",
                 'presentation_link_text': "No Presentations"
             }])
        
         presentation_links = []
-        for element in presentation_link_elements:
-            presentation_link_text_value = element.get_attribute('href')
-            link_text = element.text.strip()
+        for presentation_link_text_value, link_text in links:
+            link_text = link_text.strip()
             presentation_link_text = f'=HYPERLINK("{presentation_link_text_value}", "{link_text}")'
             presentation_links.append({
                 'presentation_link_text_value': presentation_link_text_value,
@@ -524,6 +845,80 @@ def get_presentationLink(driver, xpath):
         }])
 
 
+# Config keys of the section-relative XPaths read by extract_presentation_sections
+PRESENTATION_SECTION_FIELDS = {
+    'title': 'presentation_title',
+    'authors': 'presentation_authors',
+    'affiliations': 'presentation_affiliations',
+    'time': 'presentation_section_time',
+    'link': 'presentation_section_link',
+}
+
+
+@timed_function('extract')
+def extract_presentation_sections(driver, config, snapshot=None, timeout=20):
+    """
+    Extracts title, authors, affiliations, time and link of every presentation section in one pass.
+
+    The sections are located once and every field is read relative to its own section, so the values of
+    one presentation can never shift onto another. Without a snapshot covering the sections, the page is
+    read with one wait for the sections and one execute_script call.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance showing a session detail page.
+    config (dict): Conference configuration with 'presentation_section' and the section-relative XPaths
+                   named in PRESENTATION_SECTION_FIELDS.
+    snapshot (dict): Optional page snapshot from take_session_snapshot.
+    timeout (float): Seconds to wait for the presentation sections on the live page. Default is 20.
+
+    Returns:
+    dict: Dictionary containing status, message, and data (list with one dictionary per section holding
+          'title', 'authors', 'affiliations', 'link' (href or None), 'link_text' (HYPERLINK formula) and the
+          parse_presentation_time_text keys).
+    """
+    section_xpath = config.get('presentation_section')
+    if not section_xpath:
+        return getReturnArray(False, "Presentation section XPath not configured", [])
+    field_xpaths = {field: config.get(key) for field, key in PRESENTATION_SECTION_FIELDS.items() if config.get(key)}
+
+    try:
+        if not snapshot or snapshot.get("sections") is None:
+            wait_until_present(driver, section_xpath, timeout, 'presentation_sections')
+            snapshot_result = snapshot_xpaths(driver, [], section_xpath, list(field_xpaths.values()))
+            if not snapshot_result["status"]:
+                return getReturnArray(False, snapshot_result["message"], [])
+            snapshot = snapshot_result["data"][0]
+
+        sections = []
+        for section in snapshot["sections"]:
+            nodes = {field: section.get(xpath, []) for field, xpath in field_xpaths.items()}
+            titles = [node['text'].strip() for node in nodes.get('title', [])]
+            authors = [node['text'].strip() for node in nodes.get('authors', []) if node['text'].strip()]
+            affiliations = [node['text'].strip() for node in nodes.get('affiliations', [])]
+            times = nodes.get('time', [])
+            links = nodes.get('link', [])
+
+            link = links[0]['href'] if links else None
+            presentation = {
+                'title': titles[0] if titles else "",
+                'authors': ';'.join(authors) or "No authors found",
+                'affiliations': ';'.join(affiliations) or "No affiliations found",
+                'link': link,
+                'link_text': f'=HYPERLINK("{link}", "{links[0]["text"].strip()}")' if link else "",
+            }
+            presentation.update(parse_presentation_time_text(times[0]['text'] if times else ""))
+            sections.append(presentation)
+
+        if not sections:
+            return getReturnArray(False, "No presentation sections found", [])
+        return getReturnArray(True, f"Extracted {len(sections)} presentation sections", sections)
+
+    except TimeoutException:
+        return getReturnArray(False, "Timeout while locating presentation sections", [])
+    except Exception as e:
+        return getReturnArray(False, f"Error while extracting presentation sections: {e}", [])
+
+
 def get_Presentation_title_elements(driver, xpath):
     """
     Retrieves presentation title elements located by XPath.
@@ -553,6 +948,199 @@ def get_Presentation_title_elements(driver, xpath):
         return getReturnArray(False, f"Error extracting presentation title elements: {e}", [])
     
 
+# Blank line (<br><br>) or ';<br>' between the author list and the affiliation list
+AUTHORS_AFFILIATIONS_SPLIT = re.compile(r'<br\s*/?>\s*<br\s*/?>|;\s*<br\s*/?>', re.I)
+AFFILIATION_INDEX_LIST = re.compile(r'\d+(?:\s*-\s*\d+)?')
+TRAILING_AFFILIATION_INDEXES = re.compile(r'^(?P<name>.*?\D)\s*(?P<indexes>\d+(?:\s*[,-]\s*\d+)*)\s*$')
+AFFILIATION_INDEX_ONLY = re.compile(r'^\d+(?:\s*-\s*\d+)?$')
+LEADING_AFFILIATION_INDEX = re.compile(r'^\s*(?P<index>\d+)\s*[.)]?\s*(?P<name>.+)$', re.S)
+AUTHOR_SEPARATOR = re.compile(r'\s*[,;]\s*')
+WHITESPACE = re.compile(r'\s+')
+
+
+def _affiliation_indexes(text):
+    """Expands superscript text such as '1,3' or '2-4' into [1, 3] or [2, 3, 4]."""
+    indexes = []
+    for part in AFFILIATION_INDEX_LIST.findall(text):
+        if '-' in part:
+            first, last = (int(bound) for bound in part.split('-'))
+            indexes.extend(range(first, last + 1))
+        else:
+            indexes.append(int(part))
+    return indexes
+
+
+def _iter_text_and_superscripts(fragment):
+    """Yields ('text', str), ('sup', str) and ('break', '') items of an lxml fragment in document order."""
+    if fragment.text:
+        yield 'text', fragment.text
+    for element in fragment:
+        tag = element.tag if isinstance(element.tag, str) else ''
+        if tag == 'sup':
+            # The whole subtree is the index, including the text and tails of markup nested in it
+            yield 'sup', element.text_content()
+        elif tag == 'br':
+            yield 'break', ''
+        elif tag:
+            yield from _iter_text_and_superscripts(element)
+        if element.tail:
+            yield 'text', element.tail
+
+
+def _clean_text(text):
+    return WHITESPACE.sub(' ', text).strip(' ,;')
+
+
+def parse_authors_html(authors_html):
+    """
+    Parses an author list such as 'A. Smith<sup>1,2</sup>, B. Jones<sup>2</sup>' into names and affiliation indexes.
+
+    Authors without <sup> markup but with trailing digits ('A. Smith1, B. Jones2') are handled too.
+
+    Args:
+    authors_html (str): Inner HTML of the author list.
+
+    Returns:
+    list: One dictionary per author with 'name' (str) and 'affiliation_indexes' (list of int).
+    """
+    from lxml import html as lxml_html
+
+    authors = []
+    name_parts = []
+
+    def finish_author():
+        name = _clean_text(''.join(name_parts))
+        name_parts.clear()
+        if AFFILIATION_INDEX_ONLY.match(name) and authors:
+            # '1,3' of 'Smith1,3' was split off at the comma
+            authors[-1]['name'] += f",{name}"
+        elif any(character.isalnum() for character in name):
+            authors.append({'name': name, 'affiliation_indexes': []})
+
+    fragment = lxml_html.fragment_fromstring(authors_html or '', create_parent='div')
+    for kind, value in _iter_text_and_superscripts(fragment):
+        if kind == 'sup':
+            finish_author()
+            if authors:
+                authors[-1]['affiliation_indexes'].extend(_affiliation_indexes(value))
+        elif kind == 'break':
+            finish_author()
+        else:
+            segments = AUTHOR_SEPARATOR.split(value)
+            for segment in segments[:-1]:
+                name_parts.append(segment)
+                finish_author()
+            name_parts.append(segments[-1])
+    finish_author()
+
+    for author in authors:
+        if not author['affiliation_indexes']:
+            match = TRAILING_AFFILIATION_INDEXES.match(author['name'])
+            if match:
+                author['name'] = _clean_text(match.group('name'))
+                author['affiliation_indexes'] = _affiliation_indexes(match.group('indexes'))
+    return authors
+
+
+def parse_affiliations_html(affiliations_html):
+    """
+    Parses an affiliation list such as '<sup>1</sup>MD Anderson; <sup>2</sup>Mayo Clinic' into indexed affiliations.
+
+    Affiliations numbered in plain text ('1 MD Anderson<br>2 Mayo Clinic') are handled too; unnumbered
+    affiliations are numbered in order.
+
+    Args:
+    affiliations_html (str): Inner HTML of the affiliation list.
+
+    Returns:
+    list: One dictionary per affiliation with 'index' (int) and 'name' (str).
+    """
+    from lxml import html as lxml_html
+
+    affiliations = []
+    current = {'index': None, 'parts': []}
+
+    def finish_affiliation():
+        name = _clean_text(''.join(current['parts']))
+        if name:
+            affiliations.append({'index': current['index'], 'name': name})
+        current['index'] = None
+        current['parts'] = []
+
+    fragment = lxml_html.fragment_fromstring(affiliations_html or '', create_parent='div')
+    for kind, value in _iter_text_and_superscripts(fragment):
+        if kind == 'sup':
+            finish_affiliation()
+            indexes = _affiliation_indexes(value)
+            current['index'] = indexes[0] if indexes else None
+        elif kind == 'break':
+            finish_affiliation()
+        else:
+            segments = value.split(';')
+            for segment in segments[:-1]:
+                current['parts'].append(segment)
+                finish_affiliation()
+            current['parts'].append(segments[-1])
+    finish_affiliation()
+
+    for position, affiliation in enumerate(affiliations, start=1):
+        if affiliation['index'] is None:
+            match = LEADING_AFFILIATION_INDEX.match(affiliation['name'])
+            if match:
+                affiliation['index'] = int(match.group('index'))
+                affiliation['name'] = _clean_text(match.group('name'))
+            else:
+                affiliation['index'] = position
+    return affiliations
+
+
+def parse_authors_affiliations_html(authors_html, abstract_html=None):
+    """
+    Parses the author/affiliation block of an abstract page into plain records.
+
+    Args:
+    authors_html (str): Inner HTML holding the author list and, after a blank line, the affiliation list.
+    abstract_html (str): Optional inner HTML of the abstract body.
+
+    Returns:
+    dict: Dictionary with
+          - 'authors': list of {'name', 'affiliation_indexes', 'affiliations'}, affiliations resolved to names
+          - 'affiliations': list of {'index', 'name'}
+          - 'authors_text': 'A. Smith 1,2;B. Jones 2' and 'affiliations_text': '1 MD Anderson;2 Mayo Clinic'
+          - 'abstract': abstract text ('' if abstract_html is None)
+    """
+    from lxml import html as lxml_html
+
+    parts = AUTHORS_AFFILIATIONS_SPLIT.split(authors_html.strip(), maxsplit=1)
+    if len(parts) < 2:
+        raise ValueError("Expected at least two parts (authors and affiliations) in the HTML content")
+
+    authors = parse_authors_html(parts[0])
+    affiliations = parse_affiliations_html(parts[1])
+    names_by_index = {affiliation['index']: affiliation['name'] for affiliation in affiliations}
+    if len(affiliations) == 1 and not any(author['affiliation_indexes'] for author in authors):
+        # One unnumbered affiliation shared by every author
+        for author in authors:
+            author['affiliation_indexes'] = [affiliations[0]['index']]
+    for author in authors:
+        author['affiliations'] = [names_by_index[index] for index in author['affiliation_indexes'] if index in names_by_index]
+
+    abstract = ''
+    if abstract_html:
+        abstract_fragment = lxml_html.fragment_fromstring(abstract_html, create_parent='div')
+        abstract = _clean_text(' '.join(text.strip() for text in abstract_fragment.itertext() if text.strip()))
+
+    return {
+        'authors': authors,
+        'affiliations': affiliations,
+        'authors_text': ';'.join(f"{author['name']} {','.join(map(str, author['affiliation_indexes']))}".strip()
+                                 for author in authors),
+        'affiliations_text': ';'.join(f"{affiliation['index']} {affiliation['name']}" for affiliation in affiliations),
+        'abstract': abstract,
+    }
+
+
+@timed_function('extract')
 def extract_presentation_authors_affiliations(driver, authors_xpath, abstract_xpath):
     """
     Extracts presentation authors, affiliations, and abstract from elements located by XPath.
@@ -563,7 +1151,7 @@ def extract_presentation_authors_affiliations(driver, authors_xpath, abstract_xp
     abstract_xpath (str): XPath to locate abstract element.
 
     Returns:
-    dict: Dictionary containing status, message, and data (DataFrame with authors, affiliations, and abstract,
+    dict: Dictionary containing status, message, and data (record from parse_authors_affiliations_html,
           or None if extraction fails).
     """
     try:
@@ -571,67 +1159,15 @@ def extract_presentation_authors_affiliations(driver, authors_xpath, abstract_xp
         authors_element = WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.XPATH, authors_xpath))
         )
-        authors_html = authors_element.get_attribute('innerHTML').strip()
-
-        # Split authors and affiliations using possible delimiters
-        parts = re.split(r'<br\s*/?>\s*<br\s*/?>|;\s*<br\s*/?>', authors_html, flags=re.I)
-
-        # Ensure we have at least two parts (authors and affiliations)
-        if len(parts) < 2:
-            raise ValueError("Expected at least two parts (authors and affiliations) in the HTML content")
-
-        authors_part = parts[0].strip()
-        affiliations_part = parts[1].strip()
-
-        # Extract authors and their numbers without HTML tags
-        authors_soup = BeautifulSoup(authors_part, "html.parser")
-        authors_text = authors_soup.get_text(separator=" ")
-        authors_with_sup = re.findall(r'(.*?)\s*(\d+)', authors_text)
-        if not authors_with_sup:
-            authors_list = re.split(r',\s*', authors_text)
-            authors_with_sup = [(author.strip(), '') for author in authors_list]
-
-        # Extract affiliations
-        affiliations_soup = BeautifulSoup(affiliations_part, "html.parser")
-        affiliations_text = affiliations_soup.get_text(separator="; ")
-        affiliations_list = re.split(r'(\d+)\s*;', affiliations_text)
-
-        # Remove empty strings from affiliations list
-        affiliations_list = [affiliation.strip() for affiliation in affiliations_list if affiliation.strip()]
-
-        # Combine authors and their respective numbers correctly
-        authors_cleaned = [f"{name.strip()} {number.strip()}" for name, number in authors_with_sup]
-
-        # Combine affiliations correctly
-        affiliations_cleaned = []
-        for i in range(0, len(affiliations_list), 2):
-            number = affiliations_list[i]
-            name = affiliations_list[i + 1] if (i + 1) < len(affiliations_list) else ''
-            affiliations_cleaned.append(f"{number} {name.strip()}")
-
-        if not any(number for name, number in authors_with_sup):
-            affiliations_cleaned = [f"{affiliations_part}"]
-
-        # Extract the abstract
         abstract_element = WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.XPATH, abstract_xpath))
         )
-        abstract_html = abstract_element.get_attribute('innerHTML').strip()
-        abstract_soup = BeautifulSoup(abstract_html, "html.parser")
-        abstract_text = abstract_soup.get_text(separator=" ", strip=True)
-
-        # Create a DataFrame with authors, affiliations, and abstract
-        authors_str = '; '.join(authors_cleaned).replace(", ;", ";").replace("; ,", ";").replace("; ", ";").strip(",; ")
-        affiliations_str = '; '.join(affiliations_cleaned).replace(", ;", ";").replace("; ,", ";").replace(";;", ";").strip(",; ")
-        abstract_str = abstract_text
+        # Both blocks in one round-trip
+        authors_html, abstract_html = driver.execute_script(
+            "return [arguments[0].innerHTML, arguments[1].innerHTML];", authors_element, abstract_element)
 
-        p_df = pd.DataFrame({
-            'Authors': [authors_str],
-            'Affiliations': [affiliations_str],
-            'Abstract': [abstract_str]
-        })
-
-        return getReturnArray(True, "Successfully extracted presentation data", p_df)
+        record = parse_authors_affiliations_html(authors_html, abstract_html)
+        return getReturnArray(True, "Successfully extracted presentation data", record)
 
     except TimeoutException as te:
         return getReturnArray(False, f"Timeout waiting for element: {te}", None)
@@ -672,13 +1208,15 @@ def navigate_back(driver):
         return getReturnArray(False, f"An error occurred during navigation: {e}", None)
 
 
-def get_element_text(driver, xpath):
+@timed_function('extract')
+def get_element_text(driver, xpath, snapshot=None):
     """
     Retrieve the text of an element identified by XPath.
 
     Args:
     - driver (WebDriver): The Selenium WebDriver instance.
     - xpath (str): XPath expression to locate the element.
+    - snapshot (dict): Optional page snapshot from take_session_snapshot; used instead of the live DOM when it covers xpath.
 
     Returns:
     - dict: Dictionary containing 'status' (bool), 'message' (str), and 'data' (str).
@@ -687,6 +1225,12 @@ def get_element_text(driver, xpath):
             'data' will contain the text content of the located element, or an empty string if element is not found.
     """
     try:
+        nodes = get_snapshot_nodes(snapshot, xpath)
+        if nodes is not None:
+            if not nodes:
+                return getReturnArray(False, f"Element not found in page snapshot with XPath: {xpath}", "")
+            return getReturnArray(True, "Successfully retrieved element text", nodes[0]['text'].strip())
+
         # Wait up to 10 seconds for the element to be present in the DOM
         element = WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.XPATH, xpath)))
         element_text = element.text.strip()  # Get the text and strip any leading/trailing whitespace
@@ -0,0 +1,294 @@
+import datetime
+import functools
+import re
+from collections import namedtuple
+
+# UTC offsets (hours) of the time zone abbreviations conference sites print. GMT-5 / UTC+02:00 style
+# offsets are parsed directly.
+TIME_ZONE_OFFSETS = {
+    'UTC': 0, 'GMT': 0, 'WET': 0, 'BST': 1, 'CET': 1, 'CEST': 2, 'EET': 2, 'EEST': 3,
+    'EST': -5, 'EDT': -4, 'CST': -6, 'CDT': -5, 'MST': -7, 'MDT': -6, 'PST': -8, 'PDT': -7,
+    'AKST': -9, 'AKDT': -8, 'HST': -10, 'AEST': 10, 'AEDT': 11, 'JST': 9, 'SGT': 8,
+}
+
+# Standard UTC offsets (hours) of US time zones printed without daylight/standard, e.g. '8:00 AM ET'.
+# Their offset depends on the date, see USTimeZone.
+US_TIME_ZONE_OFFSETS = {'ET': -5, 'CT': -6, 'MT': -7, 'PT': -8, 'AKT': -9}
+
+# Building blocks of the registered patterns
+TIME_PATTERN = r'\d{1,2}:\d{2}(?::\d{2})?(?:\s*[AaPp]\.?[Mm]\.?)?'
+# Case-sensitive even in IGNORECASE patterns, so words such as 'Room' are not taken for a zone
+TIME_ZONE_PATTERN = r'(?-i:(?:GMT|UTC)\s*[+-]\s*\d{1,2}(?::?\d{2})?|[A-Z]{2,5})\b'
+RANGE_SEPARATOR_PATTERN = r'\s*(?:[-–—]|to)\s*'
+WEEKDAY_PATTERN = r'(?:[A-Za-z]+\.?,?\s+)?'
+
+TIME_FORMATS = ('%I:%M %p', '%I:%M:%S %p', '%H:%M', '%H:%M:%S')
+
+DateTimeFormat = namedtuple('DateTimeFormat', ['name', 'regex', 'date_formats'])
+TimeRangeFormat = namedtuple('TimeRangeFormat', ['name', 'regex'])
+
+# Session date/time formats, tried in order. Each pattern must define the named groups 'date',
+# 'start' and 'end', and may define 'tz'.
+DATE_TIME_FORMATS = []
+
+# Presentation time range formats, searched in order. Each pattern must define 'start' and 'end', and may define 'tz'.
+TIME_RANGE_FORMATS = []
+
+
+def _range_pattern():
+    """Time range with an optional trailing time zone, shared by the registered formats."""
+    return (rf'(?P<start>{TIME_PATTERN}){RANGE_SEPARATOR_PATTERN}(?P<end>{TIME_PATTERN})'
+            rf'(?:\s*\(?(?P<tz>{TIME_ZONE_PATTERN})\)?)?')
+
+
+def register_date_time_format(name, pattern, date_formats, first=False):
+    """
+    Registers a session date/time format.
+
+    Args:
+    name (str): Format name, reported in the parse result.
+    pattern (str): Regular expression matched at the start of the whitespace-normalized text; trailing text
+                   such as ', Room 5' is ignored. Must define the named groups 'date', 'start' and 'end', and may define 'tz'.
+    date_formats (list): strptime formats tried on the 'date' group, with commas removed.
+    first (bool): Try this format before the registered ones. Default is False.
+    """
+    entry = DateTimeFormat(name, re.compile(pattern, re.IGNORECASE), tuple(date_formats))
+    if first:
+        DATE_TIME_FORMATS.insert(0, entry)
+    else:
+        DATE_TIME_FORMATS.append(entry)
+    parse_date_time.cache_clear()
+
+
+def register_time_range_format(name, pattern, first=False):
+    """
+    Registers a presentation time range format.
+
+    Args:
+    name (str): Format name.
+    pattern (str): Regular expression searched in the text. Must define 'start' and 'end', and may define 'tz'.
+    first (bool): Try this format before the registered ones. Default is False.
+    """
+    entry = TimeRangeFormat(name, re.compile(pattern, re.IGNORECASE))
+    if first:
+        TIME_RANGE_FORMATS.insert(0, entry)
+    else:
+        TIME_RANGE_FORMATS.append(entry)
+    parse_time_range.cache_clear()
+
+
+def _nth_sunday(year, month, n):
+    first = datetime.datetime(year, month, 1)
+    return first + datetime.timedelta(days=(6 - first.weekday()) % 7 + 7 * (n - 1))
+
+
+class USTimeZone(datetime.tzinfo):
+    """
+    US time zone following daylight saving time, from 2:00 on the second Sunday of March to 2:00 on the
+    first Sunday of November. utcoffset(None) is None, since the offset depends on the date.
+
+    Args:
+    hours (int): Standard UTC offset in hours, e.g. -8 for PT.
+    name (str): Abbreviation, e.g. 'PT'.
+    """
+
+    def __init__(self, hours, name):
+        self.standard = datetime.timedelta(hours=hours)
+        self.name = name
+
+    def dst(self, dt):
+        if dt is None:
+            return None
+        local = dt.replace(tzinfo=None)
+        start = _nth_sunday(local.year, 3, 2) + datetime.timedelta(hours=2)
+        end = _nth_sunday(local.year, 11, 1) + datetime.timedelta(hours=2)
+        return datetime.timedelta(hours=1) if start <= local < end else datetime.timedelta(0)
+
+    def utcoffset(self, dt):
+        if dt is None:
+            return None
+        return self.standard + self.dst(dt)
+
+    def tzname(self, dt):
+        return self.name
+
+    def __repr__(self):
+        return f"USTimeZone({self.standard.total_seconds() / 3600:+.0f}, {self.name!r})"
+
+
+@functools.lru_cache(maxsize=256)
+def get_time_zone(abbreviation):
+    """
+    Returns the tzinfo of a time zone abbreviation or GMT/UTC offset.
+
+    Args:
+    abbreviation (str): e.g. 'CDT', 'GMT-5', 'UTC+02:00', or 'CT' for Central Time on whatever date it is used with.
+
+    Returns:
+    datetime.timezone, USTimeZone or None: A fixed offset, a USTimeZone for ET, CT, MT, PT and AKT,
+                                           or None if the abbreviation is unknown.
+    """
+    if not abbreviation:
+        return None
+    abbreviation = abbreviation.replace(' ', '').upper()
+
+    match = re.fullmatch(r'(?:GMT|UTC)([+-])(\d{1,2})(?::?(\d{2}))?', abbreviation)
+    if match:
+        sign = -1 if match.group(1) == '-' else 1
+        offset = datetime.timedelta(hours=int(match.group(2)), minutes=int(match.group(3) or 0))
+        return datetime.timezone(sign * offset, abbreviation)
+
+    if abbreviation in TIME_ZONE_OFFSETS:
+        return datetime.timezone(datetime.timedelta(hours=TIME_ZONE_OFFSETS[abbreviation]), abbreviation)
+    if abbreviation in US_TIME_ZONE_OFFSETS:
+        return USTimeZone(US_TIME_ZONE_OFFSETS[abbreviation], abbreviation)
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_clock_time(text):
+    """
+    Parses a clock time such as '1:30 PM', '1:30 p.m.' or '13:00:00'.
+
+    Args:
+    text (str): Clock time text.
+
+    Returns:
+    datetime.time or None: None if the text is not a recognized time.
+    """
+    text = re.sub(r'\s*([AaPp])\.?[Mm]\.?$', r' \1M', text.strip()).upper()
+    for time_format in TIME_FORMATS:
+        try:
+            return datetime.datetime.strptime(text, time_format).time()
+        except ValueError:
+            continue
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(text, date_formats):
+    text = re.sub(r'\s+', ' ', text.replace(',', ' ').replace('.', ' ')).strip()
+    # strptime's %b only knows 'Sep'
+    text = re.sub(r'\bSept\b', 'Sep', text, flags=re.IGNORECASE)
+    for date_format in date_formats:
+        try:
+            return datetime.datetime.strptime(text, date_format).date()
+        except ValueError:
+            continue
+    return None
+
+
+@functools.lru_cache(maxsize=65536)
+def parse_date_time(text):
+    """
+    Parses a session date/time string against the registered formats.
+
+    Identical strings repeat thousands of times across a conference, so results are cached on the raw text.
+    The returned dictionary is shared by the cache and must not be modified.
+
+    Args:
+    text (str): Date/time text as displayed on the session page.
+
+    Returns:
+    dict or None: Dictionary with 'date' (datetime.date), 'start' and 'end' (datetime.datetime, time zone aware
+                  when the time zone is known; 'end' moves to the next day for ranges past midnight),
+                  'start_text', 'end_text', 'timezone' (str or None) and 'format' (str), or None if no format matches.
+    """
+    normalized = re.sub(r'\s+', ' ', text).strip()
+
+    for entry in DATE_TIME_FORMATS:
+        match = entry.regex.match(normalized)
+        if not match:
+            continue
+
+        date = _parse_date(match.group('date'), entry.date_formats)
+        start_time = parse_clock_time(match.group('start'))
+        end_time = parse_clock_time(match.group('end'))
+        if date is None or start_time is None or end_time is None:
+            continue
+
+        timezone_text = match.groupdict().get('tz')
+        tzinfo = get_time_zone(timezone_text)
+        start = datetime.datetime.combine(date, start_time, tzinfo)
+        end = datetime.datetime.combine(date, end_time, tzinfo)
+        if end < start:
+            end += datetime.timedelta(days=1)
+
+        return {
+            'date': date,
+            'start': start,
+            'end': end,
+            'start_text': match.group('start'),
+            'end_text': match.group('end'),
+            'timezone': timezone_text.replace(' ', '') if timezone_text else None,
+            'format': entry.name,
+        }
+
+    return None
+
+
+@functools.lru_cache(maxsize=65536)
+def parse_time_range(text):
+    """
+    Finds a presentation time range such as '1:30 PM – 1:42 PM CDT' in a string.
+
+    Results are cached on the raw text. The returned dictionary is shared by the cache and must not be modified.
+
+    Args:
+    text (str): Presentation time text.
+
+    Returns:
+    dict or None: Dictionary with 'start' and 'end' (datetime.time), 'start_text', 'end_text', 'timezone'
+                  (str or None) and 'format' (str), or None if no format matches.
+    """
+    normalized = re.sub(r'\s+', ' ', text).strip()
+
+    for entry in TIME_RANGE_FORMATS:
+        match = entry.regex.search(normalized)
+        if not match:
+            continue
+
+        start_time = parse_clock_time(match.group('start'))
+        end_time = parse_clock_time(match.group('end'))
+        if start_time is None or end_time is None:
+            continue
+
+        timezone_text = match.groupdict().get('tz')
+        return {
+            'start': start_time,
+            'end': end_time,
+            'start_text': match.group('start'),
+            'end_text': match.group('end'),
+            'timezone': timezone_text.replace(' ', '') if timezone_text else None,
+            'format': entry.name,
+        }
+
+    return None
+
+
+# ASCO meetings: "Friday, 31 May 2024 1:30 PM – 2:45 PM CDT", "31 May 2024 13:00 – 14:15 GMT-5"
+register_date_time_format(
+    'day_month_year',
+    rf'{WEEKDAY_PATTERN}(?P<date>\d{{1,2}}\s+[A-Za-z]{{3,9}}\.?,?\s+\d{{4}}),?\s+{_range_pattern()}',
+    ['%d %B %Y', '%d %b %Y'])
+
+# AACR / abstractsonline: "Sunday, April 7, 2024, 1:30 PM - 5:00 PM", "Apr 7, 2024 1:30 PM - 5:00 PM EDT"
+register_date_time_format(
+    'month_day_year',
+    rf'{WEEKDAY_PATTERN}(?P<date>[A-Za-z]{{3,9}}\.?\s+\d{{1,2}},?\s+\d{{4}}),?\s+{_range_pattern()}',
+    ['%B %d %Y', '%b %d %Y'])
+
+# ISO dates: "Friday 2024-05-31 13:00:00 – 14:15:00"
+register_date_time_format(
+    'iso',
+    rf'{WEEKDAY_PATTERN}(?P<date>\d{{4}}-\d{{2}}-\d{{2}})[ T]{_range_pattern()}',
+    ['%Y-%m-%d'])
+
+# abstractsonline exports: "4/7/2024 1:30:00 PM - 5:00:00 PM"
+register_date_time_format(
+    'us_numeric',
+    rf'{WEEKDAY_PATTERN}(?P<date>\d{{1,2}}/\d{{1,2}}/\d{{4}}),?\s+{_range_pattern()}',
+    ['%m/%d/%Y'])
+
+# Presentation times: "1:30 PM – 1:42 PM CDT", "13:30 - 13:42"
+register_time_range_format('time_range', _range_pattern())
@@ -1,6 +1,8 @@
 # Module1/some_module1_script.py
 import sys
 import os
+import argparse
+import functools
 import logging
 import pandas as pd
 import time
@@ -20,254 +22,800 @@ logger = logging.getLogger(__name__)
 # Add the parent directory to the system path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from Exelixis_Library.config_AACR_DataFactory import initialize_combined_data, extract_event_type, convert_mutiple_dateformats, extract_session_type, extract_locations, extract_disease, extract_session_authors, extract_session_authors_affiliations, get_Presentation_title_elements, extract_presentation_titles,extract_presentation_authors,extract_presentation_affiliations,extract_presentation_time
+from Exelixis_Library.ASCO_AACR_DataFactory import LISTING_CONFIG_KEYS, initialize_combined_data, SessionRecord, iter_session_rows, combined_rows_to_arrow, normalize_session_times, take_session_snapshot, get_element_text, extract_event_type, convert_mutiple_dateformats, extract_session_type, extract_locations, extract_disease, extract_session_authors, extract_session_authors_affiliations, extract_presentation_sections
 from s2iTurbokit.s2iHelperFunctions import getDomainName, getReturnArray, loadJSON, getPrompt, unpackDict2Str, checkPath
-from s2iTurbokit.s2iWebKit import initialize_webdriver, scrape_url, find_elements, click_element_multiple_retries
-from s2iExtensions.Exelixis.AACRConfig import WEBSITE_CONFIG
+from s2iTurbokit.s2iWebKit import initialize_webdriver, create_webdriver, prespawn_webdrivers, shutdown_prespawned_webdrivers, close_driver, scrape_url, navigate_to_url, find_elements, wait_for_element, wait_for_page_ready, get_wait_timings, start_page_budget, start_retry_budget, configure_circuit_breakers, set_page_layout, click_element_multiple_retries, run_webdriver_pool, harvest_links
+from s2iTurbokit.s2iJournal import CheckpointJournal, load_journal, get_finished_tasks, journal_task_key
+from s2iTurbokit.s2iWriters import open_row_writer
+from s2iTurbokit.s2iTrace import enable_command_tracing, set_trace_session, get_command_trace_summary
+from s2iTurbokit.s2iProfile import PROFILE_MODES, RunProfiler, get_profile_settings, default_profile_path, format_breakdown
+from s2iTurbokit.s2iConfig import load_config, check_locators
+from s2iTurbokit.s2iMetrics import timed_function, start_progress, record_progress, PeriodicMetricsExporter
+from s2iExtensions.Exelixis.ConferenceConfigs import DEFAULT_CONFERENCE, REQUIRED_SELECTOR_KEYS
+
+DEFAULT_JOURNAL_PATH = "AACO.journal.jsonl"
+DEFAULT_OUTPUT_PATH = "AACO.xlsx"
+
+# Settings and compiled locators of the conference being scraped, filled by use_conference
+CONFIG = {}
+LOCATORS = {}
+
+
+def use_conference(name):
+    """
+    Loads a registered conference config and makes it the one the scraper reads.
+
+    Args:
+    name (str): Conference config name registered in s2iExtensions.Exelixis.ConferenceConfigs.
+
+    Returns:
+    dict: Dictionary containing status, message, and data (dictionary with 'settings' and 'locators').
+    """
+    result = load_config(name)
+    if result["status"]:
+        loaded = result["data"][0]
+        CONFIG.clear()
+        CONFIG.update(loaded['settings'])
+        LOCATORS.clear()
+        LOCATORS.update(loaded['locators'])
+    return result
+
+
+def create_worker_driver():
+    """
+    Starts a WebDriver for a scraping worker using the configured driver profile.
+
+    Returns:
+    dict: Dictionary containing status, message, and data (WebDriver instance).
+    """
+    config = CONFIG
+    return create_webdriver(config.get('driver_profile', 'headless'), config.get('resource_rules'),
+                            profile_template=config.get('profile_template'))
+
+
+def open_session_listing(driver):
+    """
+    Navigates a worker's WebDriver to the session listing page.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance.
+
+    Returns:
+    dict: Dictionary containing status, message, and data (None).
+    """
+    url = CONFIG['url']
+    logger.info(f"Navigating to URL: {url}")
+    result = scrape_url(driver, url)
+    if result["status"]:
+        wait_for_listing_page(driver)
+    return result
+
+
+def wait_for_page(driver, xpath, label):
+    """
+    Waits until a page is ready using the configured wait strategy, instead of sleeping sleep_duration.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance.
+    xpath (str): XPath that must be present for the 'selector' strategy.
+    label (str): Name the wait timing is recorded under.
+
+    Returns:
+    dict: Dictionary containing status, message, and data (seconds the wait took).
+    """
+    config = CONFIG
+    result = wait_for_page_ready(driver, config.get('wait_strategy', 'document'), timeout=config.get('wait_timeout', 20),
+                                 poll_interval=config.get('wait_poll_interval', 0.1), xpath=xpath,
+                                 quiet_period=config.get('wait_quiet_period', 0.5), label=label,
+                                 fixed_sleep=config.get('sleep_duration'))
+    if not result["status"]:
+        logger.warning(result["message"])
+    return result
+
+
+def wait_for_listing_page(driver):
+    """
+    Waits until the session listing page shows its session cards.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance.
+
+    Returns:
+    dict: Dictionary containing status, message, and data (seconds the wait took).
+    """
+    return wait_for_page(driver, CONFIG['findelements'], 'listing_page')
+
+
+def wait_for_session_page(driver):
+    """
+    Waits until a session detail page shows its title.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance.
+
+    Returns:
+    dict: Dictionary containing status, message, and data (seconds the wait took).
+    """
+    return wait_for_page(driver, CONFIG.get('title_element'), 'session_page')
+
+
+def log_wait_timings():
+    """
+    Logs how long the readiness waits took compared with the fixed sleeps they replaced.
+    """
+    for label, timing in get_wait_timings().items():
+        logger.info(f"Wait '{label}': {timing['count']} waits, mean {timing['mean']:.2f}s, max {timing['max']:.2f}s, "
+                    f"{timing['timeouts']} timeouts ({timing['timeout_total']:.1f}s), {timing['short_checks']} short checks, "
+                    f"{timing['saved']:.1f}s saved versus fixed sleeps")
+
+
+def log_command_trace(top=10):
+    """
+    Logs the traced WebDriver commands: the most frequent commands, the chattiest calling functions and the
+    commands per session.
+
+    Args:
+    top (int): Number of commands and callers to log. Default is 10.
+    """
+    summary = get_command_trace_summary()
+    if not summary["total"]:
+        return
+    logger.info(f"WebDriver commands: {summary['total']} round-trips, {summary['seconds']:.1f}s")
+    for command, entry in list(summary["commands"].items())[:top]:
+        logger.info(f"Command '{command}': {entry['count']} calls, mean {entry['mean'] * 1000:.1f}ms, {entry['seconds']:.1f}s total")
+    for caller, entry in list(summary["callers"].items())[:top]:
+        commands = ', '.join(f"{command} {count}" for command, count in sorted(entry["commands"].items(), key=lambda item: -item[1]))
+        logger.info(f"Caller {caller}: {entry['count']} commands, {entry['seconds']:.1f}s ({commands})")
+    sessions = [entry["count"] for session, entry in summary["sessions"].items() if session != 'listing']
+    if sessions:
+        logger.info(f"Commands per session: mean {sum(sessions) / len(sessions):.1f}, max {max(sessions)} over {len(sessions)} sessions")
+
+
+@timed_function('extraction')
+def extract_session_rows(driver, snapshot=None):
+    """
+    Extracts the session row and its presentation rows from the currently open session page.
+
+    With the conference config's extraction_mode 'snapshot', every field is read from one page snapshot
+    (a single execute_script call) instead of one WebDriver round-trip per element. With
+    'page_source', the rendered DOM is transferred once and the XPaths are evaluated with lxml.
+    A snapshot taken elsewhere (e.g. with snapshot_page_source from saved HTML) is extracted without a browser.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance showing a session detail page, or None with a snapshot.
+    snapshot (dict): Optional snapshot of the session page from take_session_snapshot or snapshot_page_source.
+
+    Returns:
+    dict: Dictionary containing status, message, and data (list of SessionRecord, one per date/time slot of the session).
+    """
+    sessions = []
+    if driver is not None:
+        start_page_budget(driver, CONFIG.get('page_time_budget'),
+                          absent_timeout=CONFIG.get('absent_selector_timeout', 1.0))
+
+    extraction_mode = CONFIG.get('extraction_mode', 'live')
+    if snapshot is None and extraction_mode in ('snapshot', 'page_source'):
+        ready_result = wait_for_element(driver, By.XPATH, CONFIG.get('title_element'))
+        if not ready_result["status"]:
+            return getReturnArray(False, ready_result["message"], None)
+        snapshot_source = 'page_source' if extraction_mode == 'page_source' else 'script'
+        snapshot_result = take_session_snapshot(driver, CONFIG, source=snapshot_source)
+        if not snapshot_result["status"]:
+            return getReturnArray(False, snapshot_result["message"], None)
+        snapshot = snapshot_result["data"][0]
+
+    session_event_type = ""
+    session_event_type_result = extract_event_type(driver, CONFIG.get('event_type'), snapshot=snapshot)
+    if session_event_type_result["status"]:
+        event_types = session_event_type_result["data"]
+        if event_types:
+            session_event_type = event_types[0]
+            logger.info(f"Event Type: {session_event_type}")
+        else:
+            logger.error("No Event Type found.")
+    else:
+        logger.error(session_event_type_result["message"])
+
+    if snapshot is not None:
+        session_time_parts_result = convert_mutiple_dateformats(driver, CONFIG.get('dateandtime_element'), snapshot=snapshot)
+    else:
+        session_date_time_elements_result = find_elements(driver, CONFIG.get('dateandtime_element'))
+        if not session_date_time_elements_result["status"]:
+            return getReturnArray(False, session_date_time_elements_result["message"], None)
+        session_date_time_elements = session_date_time_elements_result["data"]
+
+        session_time_parts_result = convert_mutiple_dateformats(driver, session_date_time_elements)
+    if not session_time_parts_result["status"]:
+        return getReturnArray(False, session_time_parts_result["message"], None)
+
+    session_time_parts = session_time_parts_result["data"]
+    for part in session_time_parts:
+        session_date = part.get('date', '')
+        session_start_time = part.get('start_time', '')
+        session_end_time = part.get('end_time', '')
+        session_timezone = part.get('timezone', '')
+        session_full_time = part.get('time', '')
+        session_title_xpath = CONFIG.get('title_element')
+        session_title_element_txt = ""
+        if session_title_xpath:
+            session_title_result = get_element_text(driver, session_title_xpath, snapshot=snapshot)
+            if not session_title_result["status"]:
+                return getReturnArray(False, session_title_result["message"], None)
+            session_title_element_txt = session_title_result["data"][0]
+
+        session_type_elements = ""
+        session_types = CONFIG.get('session_types')
+        session_type_element = extract_session_type(driver, session_types, snapshot=snapshot)
+        if session_type_element["status"]:
+            session_type_elements = session_type_element["data"]
+            if session_type_elements:
+                session_type_element = session_type_elements
+                if driver is not None:
+                    set_page_layout(driver, session_type_elements[0])
+            else:
+                logger.error("No session types found.")
+
+        session_location_text = []
+        session_location_xpath = CONFIG.get('location')
+        session_location_texts = extract_locations(driver, session_location_xpath, snapshot=snapshot) if session_location_xpath else getReturnArray(False, "No location XPath provided", [])
+        if session_location_texts["status"]:
+            session_location_text = session_location_texts["data"]
+            if session_location_text:
+                session_location_text = session_location_text
+            else:
+                logger.error("No session locations found.")
+
+        session_disease_xpath = CONFIG.get('disease')
+        session_diseases = extract_disease(driver, session_disease_xpath, snapshot=snapshot) if session_disease_xpath else getReturnArray(False, "No disease XPath provided", [])
+        if session_diseases["status"]:
+            session_diseases = session_diseases["data"]
+            if session_diseases:
+                session_diseases = session_diseases[0]
+            else:
+                logger.error("No diseases found.")
+        else:
+            session_diseases = ""
+
+        session_authors_xpath = CONFIG.get('session_authors_xpath')
+        session_authors = extract_session_authors(driver, session_authors_xpath, snapshot=snapshot) if session_authors_xpath else getReturnArray(False, "No session authors XPath provided", "")
+        if session_authors["status"]:
+            session_authors = session_authors["data"]
+            if session_authors:
+                session_authors = session_authors[0]
+            else:
+                logger.error("No session authors found.")
+        else:
+            session_authors = ""
+
+        session_authors_affiliations_xpath = CONFIG.get('session_authors_affiliations_xpath')
+        session_authors_affiliations = extract_session_authors_affiliations(driver, session_authors_affiliations_xpath, snapshot=snapshot) if session_authors_affiliations_xpath else getReturnArray(False, "No session authors affiliations XPath provided", "")
+        if session_authors_affiliations["status"]:
+            session_authors_affiliations = session_authors_affiliations["data"]
+            if session_authors_affiliations:
+                session_authors_affiliations = session_authors_affiliations[0]
+            else:
+                logger.error("No session authors affiliations found.")
+        else:
+            session_authors_affiliations = ""
+
+        # One cell value for the session types, as for the locations
+        session_type_text = ";".join(session_type_elements)
+        session_url = snapshot["url"] if snapshot is not None else driver.current_url
+        custom_name_with_link = f'=HYPERLINK("{session_url}", "{session_type_text}")'
+
+        presentation_link_text_values = session_url
+
+        session = SessionRecord(event_type=session_event_type, date=session_date, time=session_full_time,
+                                start_time=session_start_time, end_time=session_end_time, timezone=session_timezone,
+                                locations=session_location_text, session_type=session_type_text,
+                                title=session_title_element_txt, link=custom_name_with_link, disease=session_diseases,
+                                authors=session_authors, affiliations=session_authors_affiliations, url=session_url)
+        sessions.append(session)
+
+        presentation_sections_result = extract_presentation_sections(driver, CONFIG, snapshot=snapshot)
+        if not presentation_sections_result["status"]:
+            logger.error(presentation_sections_result["message"])
+            continue
+
+        for presentation in presentation_sections_result["data"]:
+            session.add_presentation(time=presentation['p_time'], start_time=presentation['p_start_time'],
+                                     end_time=presentation['p_end_time'], timezone=presentation['p_time_zone'],
+                                     title=presentation['title'], link=presentation['link_text'],
+                                     authors=presentation['authors'], affiliations=presentation['affiliations'],
+                                     url=presentation['link'] or presentation_link_text_values)
+
+    return getReturnArray(True, "Session extracted successfully", sessions)
+
+
+@timed_function('listing')
+def harvest_session_tasks(driver):
+    """
+    Collects the detail page URL of every session card on the listing page in one pass.
+
+    Cards whose URL cannot be determined are returned as their card index, so they can still
+    be opened by clicking.
+
+    Args:
+    driver (WebDriver): WebDriver instance showing the session listing page.
+
+    Returns:
+    dict: Dictionary containing status, message, and data (list of session URLs or card indexes, in listing order).
+    """
+    config = CONFIG
+    links_result = harvest_links(driver, config['findelements'], config.get('session_link'), config.get('session_id_attribute'))
+    if not links_result["status"]:
+        return links_result
+
+    tasks = []
+    for index, link in enumerate(links_result["data"]):
+        if link.get('href'):
+            tasks.append(link['href'])
+        elif link.get('id') and config.get('session_url_template'):
+            tasks.append(config['session_url_template'].format(id=link['id']))
+        else:
+            tasks.append(index)
+
+    fallback_count = sum(1 for task in tasks if isinstance(task, int))
+    if fallback_count:
+        logger.warning(f"{fallback_count} of {len(tasks)} session cards have no URL and will be opened by clicking")
+    return getReturnArray(True, f"Harvested {len(tasks)} sessions", tasks)
+
+
+def scrape_session_url(driver, url):
+    """
+    Navigates directly to a session detail page and extracts it.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance.
+    url (str): URL of the session detail page.
+
+    Returns:
+    dict: Dictionary containing status, message, and data (dictionary shaped like initialize_combined_data()).
+    """
+    try:
+        logger.info(f"Processing session: {url}")
+        navigation_result = navigate_to_url(driver, url)
+        if not navigation_result["status"]:
+            return getReturnArray(False, f"Could not open session {url}: {navigation_result['message']}", None)
+        wait_for_session_page(driver)
+        return extract_session_rows(driver)
+
+    except TimeoutException as te:
+        logger.error(f"Timeout exception occurred for session {url}: {te}")
+        return getReturnArray(False, f"Timeout for session {url}: {te}", None)
+
+
+def scrape_session_task(driver, task):
+    """
+    Scrapes one harvested session: a URL is opened directly, a card index is opened by clicking.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance.
+    task (str or int): Session URL or card index from harvest_session_tasks.
+
+    Returns:
+    dict: Dictionary containing status, message, and data (dictionary shaped like initialize_combined_data()).
+    """
+    set_trace_session(driver, f"card {task}" if isinstance(task, int) else task)
+    start_retry_budget(driver, CONFIG.get('session_retry_budget'))
+    if isinstance(task, int):
+        return scrape_session_card(driver, task)
+    return scrape_session_url(driver, task)
+
+
+def scrape_session_card(driver, index):
+    """
+    Opens the session card at the given index on the listing page, extracts it and navigates back.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance; the listing page is opened if it is not showing.
+    index (int): Index of the session card to process.
+
+    Returns:
+    dict: Dictionary containing status, message, and data (dictionary shaped like initialize_combined_data()).
+    """
+    try:
+        logger.info(f"Processing element at index: {index}")
+        if driver.current_url != CONFIG['url']:
+            open_session_listing(driver)
+        elements_result = find_elements(driver, CONFIG['findelements'])
+        if not elements_result["status"]:
+            return getReturnArray(False, elements_result["message"], None)
+        elements = elements_result["data"]
 
-def main():
-    combined_data = initialize_combined_data()
+        if index >= len(elements):
+            return getReturnArray(False, f"Session card at index {index} not found", None)
+
+        driver.execute_script("arguments[0].scrollIntoView();", elements[index])
+        ActionChains(driver).move_to_element(elements[index]).perform()
+
+        click_result = click_element_multiple_retries(driver, elements[index])
+        if not click_result["status"]:
+            return getReturnArray(False, f"Could not open session card at index {index}: {click_result['message']}", None)
+        wait_for_session_page(driver)
+
+        try:
+            return extract_session_rows(driver)
+        finally:
+            driver.execute_script("window.history.go(-1)")
+            wait_for_listing_page(driver)
+
+    except StaleElementReferenceException as se:
+        logger.warning(f"Stale Element Reference Exception: {se}")
+        return getReturnArray(False, f"Stale element at index {index}: {se}", None)
+
+    except TimeoutException as te:
+        logger.error(f"Timeout exception occurred at index {index}: {te}")
+        return getReturnArray(False, f"Timeout at index {index}: {te}", None)
+
+
+def report_selector_checks(page, checks):
+    """
+    Logs the selector checks of one preflight page.
+
+    Args:
+    page (str): Page the selectors were checked on.
+    checks (list): Results of check_locators.
+
+    Returns:
+    list: Messages of the checks that fail the preflight (required selector without match, or an evaluation error).
+    """
+    failures = []
+    for check in checks:
+        if check['error']:
+            failures.append(f"{page} '{check['key']}': {check['error']}")
+        elif not check['count'] and check['key'] in REQUIRED_SELECTOR_KEYS:
+            failures.append(f"{page} '{check['key']}': no match for {check['value']}")
+        elif not check['count']:
+            logger.warning(f"Preflight {page} '{check['key']}': no match on the first page (optional)")
+        else:
+            logger.info(f"Preflight {page} '{check['key']}': {check['count']} matches")
+    return failures
+
+
+def run_preflight(driver):
+    """
+    Checks every selector of the conference config against the first listing page and the first session page.
+
+    Listing selectors are checked on the listing page (card-relative ones inside the session cards), all others
+    on the first session page (section-relative ones inside the presentation sections), with one
+    execute_script call per page. Takes seconds, where a broken selector costs a timeout on every session of a run.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance.
+
+    Returns:
+    dict: Dictionary containing status, message, and data (list of check dictionaries with 'page', 'key',
+          'value', 'count' and 'error').
+    """
+    listing_locators = [LOCATORS[key] for key in LISTING_CONFIG_KEYS if key in LOCATORS]
+    detail_locators = [locator for key, locator in LOCATORS.items() if key not in LISTING_CONFIG_KEYS]
+
+    listing_result = open_session_listing(driver)
+    if not listing_result["status"]:
+        return getReturnArray(False, f"Preflight could not open the listing page: {listing_result['message']}", [])
+    listing_checks = check_locators(driver, listing_locators, LOCATORS.get('findelements'))
+    if not listing_checks["status"]:
+        return getReturnArray(False, listing_checks["message"], [])
+    failures = report_selector_checks('listing', listing_checks["data"])
+
+    tasks_result = harvest_session_tasks(driver)
+    if not tasks_result["status"] or not tasks_result["data"]:
+        failures.append("listing: no session to check the session page selectors on")
+        return getReturnArray(False, "Preflight failed: " + "; ".join(failures), listing_checks["data"])
+
+    first_task = tasks_result["data"][0]
+    if isinstance(first_task, int):
+        elements_result = find_elements(driver, CONFIG['findelements'])
+        open_result = click_element_multiple_retries(driver, elements_result["data"][0]) if elements_result["status"] else elements_result
+    else:
+        open_result = navigate_to_url(driver, first_task)
+    if not open_result["status"]:
+        return getReturnArray(False, f"Preflight could not open the first session: {open_result['message']}", listing_checks["data"])
+    wait_for_session_page(driver)
+
+    detail_checks = check_locators(driver, detail_locators, LOCATORS.get('presentation_section'))
+    if not detail_checks["status"]:
+        return getReturnArray(False, detail_checks["message"], listing_checks["data"])
+    failures += report_selector_checks('session', detail_checks["data"])
+
+    checks = ([dict(check, page='listing') for check in listing_checks["data"]] +
+              [dict(check, page='session') for check in detail_checks["data"]])
+    if failures:
+        return getReturnArray(False, "Preflight failed: " + "; ".join(failures), checks)
+    return getReturnArray(True, f"Preflight passed: {len(checks)} selectors checked", checks)
+
+
+def open_journal(journal_path, resume):
+    """
+    Opens the checkpoint journal and loads the sessions a previous run already finished.
+
+    Without resume the previous journal is kept as <journal_path>.prev and a new one is started.
+
+    Args:
+    journal_path (str): Path of the journal file.
+    resume (bool): Continue the journal of an interrupted run.
+
+    Returns:
+    tuple: (CheckpointJournal, dict mapping journal_task_key(task) to the session's SessionRecord.to_dict() list)
+    """
+    finished = {}
+    if resume:
+        journal_result = load_journal(journal_path)
+        logger.info(journal_result["message"])
+        if journal_result["status"]:
+            finished = get_finished_tasks(journal_result["data"][0])
+    elif os.path.exists(journal_path):
+        os.replace(journal_path, f"{journal_path}.prev")
+
+    return CheckpointJournal(journal_path), finished
+
+
+@timed_function('postprocess')
+def postprocess_output(output_path):
+    """
+    Rewrites a finished CSV, JSON Lines or xlsx output sorted by time, with the columns added by normalize_session_times.
+
+    Args:
+    output_path (str): Output file written by the row writer.
+
+    Returns:
+    dict: Dictionary containing status, message, and data (number of rows).
+    """
+    readers = {
+        '.csv': functools.partial(pd.read_csv, dtype=str),
+        '.jsonl': functools.partial(pd.read_json, lines=True, dtype=False),
+        '.xlsx': functools.partial(pd.read_excel, dtype=str),
+    }
+    extension = os.path.splitext(output_path)[1].lower()
+    if extension not in readers:
+        return getReturnArray(False, f"Time normalization is not supported for {extension} output", None)
+
+    try:
+        df = readers[extension](output_path)
+        df = normalize_session_times(df, CONFIG.get('default_timezone'))
+
+        if extension == '.csv':
+            df.to_csv(output_path, index=False)
+        elif extension == '.jsonl':
+            df.to_json(output_path, orient='records', lines=True, date_format='iso')
+        else:
+            # Excel cannot store timezone-aware datetimes; the columns are UTC by name
+            for column in ('Start UTC', 'End UTC'):
+                df[column] = df[column].dt.tz_localize(None)
+            df.to_excel(output_path, index=False)
+        return getReturnArray(True, f"Normalized times of {len(df)} rows in {output_path}", len(df))
+    except Exception as e:
+        return getReturnArray(False, f"Error normalizing times in {output_path}: {str(e)}", None)
+
+
+def main(pool_size=None, resume=False, journal_path=DEFAULT_JOURNAL_PATH, output_path=DEFAULT_OUTPUT_PATH,
+         conference=DEFAULT_CONFERENCE, preflight=False, metrics_path=None, trace=False, trace_path=None,
+         profile=None, profile_path=None, profile_breakdown=False, normalize_times=False):
+    """
+    Runs scrape_conference, optionally under a profiler.
+
+    Profiling is switched on by profile or the S2I_PROFILE environment variable ('cprofile' writes a pstats
+    file, 'sampling' collapsed stacks); see s2iTurbokit.s2iProfile. The other arguments are passed to scrape_conference.
+
+    Args:
+    profile (str): 'cprofile', 'sampling', or None to follow S2I_PROFILE. Default is None.
+    profile_path (str): Profile output file. Default is S2I_PROFILE_PATH or profiles/ASCO_AACR-<timestamp>.prof/.folded.
+    profile_breakdown (bool): Also record the wall-clock breakdown (chromedriver, waiting, parsing, pandas, python).
+
+    Returns:
+    bool: False if the run failed.
+    """
+    run_args = dict(pool_size=pool_size, resume=resume, journal_path=journal_path, output_path=output_path,
+                    conference=conference, preflight=preflight, metrics_path=metrics_path, trace=trace, trace_path=trace_path,
+                    normalize_times=normalize_times)
+    settings = get_profile_settings()
+    profile = profile or settings['mode']
+    if not profile:
+        return scrape_conference(**run_args)
+    if profile not in PROFILE_MODES:
+        logger.error(f"Unknown profile mode '{profile}', expected one of {', '.join(PROFILE_MODES)}")
+        return False
+
+    profiler = RunProfiler(profile, profile_path or settings['path'] or default_profile_path('ASCO_AACR', profile),
+                           breakdown=profile_breakdown or settings['breakdown']).start()
+    try:
+        return scrape_conference(**run_args)
+    finally:
+        profile_result = profiler.stop()
+        if profile_result["status"]:
+            logger.info(profile_result["message"])
+            for line in format_breakdown(profile_result["data"][0]['breakdown'] or {}):
+                logger.info(f"Wall-clock breakdown {line}")
+        else:
+            logger.error(profile_result["message"])
+
+
+def scrape_conference(pool_size=None, resume=False, journal_path=DEFAULT_JOURNAL_PATH, output_path=DEFAULT_OUTPUT_PATH,
+                      conference=DEFAULT_CONFERENCE, preflight=False, metrics_path=None, trace=False, trace_path=None,
+                      normalize_times=False):
+    """
+    Scrapes every session of a conference into output_path, checkpointing finished sessions in the journal.
+
+    Args:
+    pool_size (int): Number of parallel WebDriver workers. Default is the conference config's pool_size.
+    resume (bool): Skip sessions already finished in the checkpoint journal. Default is False.
+    journal_path (str): Checkpoint journal path.
+    output_path (str): Output file; .xlsx, .csv, .jsonl, or .parquet for a partitioned dataset directory.
+    conference (str): Registered conference config to scrape.
+    preflight (bool): Only check every selector against the first listing and session page. Default is False.
+    metrics_path (str): Metrics file, JSON or Prometheus text format for .prom/.txt. Default is the conference
+                        config's metrics_path (off unless set).
+    trace (bool): Trace every WebDriver command and log the commands per session and per calling function. Default is False.
+    trace_path (str): JSON Lines file receiving every traced command (implies trace). Default is the conference config's trace_path.
+    normalize_times (bool): Rewrite the output with normalized times (see postprocess_output). Default is the
+                            conference config's normalize_times, which is off.
+
+    Returns:
+    bool: False if the run failed.
+    """
+    config_result = use_conference(conference)
+    if not config_result["status"]:
+        logger.error(config_result["message"])
+        return False
+    logger.info(config_result["message"])
+
+    # Opt-in WebDriver command tracing, must be enabled before the drivers are started
+    trace_path = trace_path or CONFIG.get('trace_path')
+    if trace or trace_path or CONFIG.get('trace_commands'):
+        trace_result = enable_command_tracing(trace_path)
+        if not trace_result["status"]:
+            logger.error(trace_result["message"])
+            return False
+        logger.info(trace_result["message"])
+
+    if preflight:
+        result = create_worker_driver()
+        if not result["status"]:
+            logger.error(result["message"])
+            return False
+        try:
+            preflight_result = run_preflight(result["data"])
+        finally:
+            close_driver(result["data"])
+        if preflight_result["status"]:
+            logger.info(preflight_result["message"])
+        else:
+            logger.error(preflight_result["message"])
+        return preflight_result["status"]
+
+    pool_size = pool_size or CONFIG.get('pool_size', 1)
+    configure_circuit_breakers(CONFIG.get('circuit_failure_threshold'), CONFIG.get('circuit_cooldown'))
+
+    # Rewrites and re-sorts the output with extra columns, so only when asked for; the rows then carry
+    # their 'Row Type' so the overlap check can leave presentations out
+    normalize_times = bool(normalize_times or CONFIG.get('normalize_times')) and not output_path.lower().endswith('.parquet')
+
+    writer_options = {}
+    if output_path.lower().endswith('.parquet'):
+        # Typed columns, partitioned as <output_path>/Conference=.../Date=.../part-*.parquet
+        writer_options = {
+            'batch_size': 1000,
+            'table_builder': functools.partial(combined_rows_to_arrow, conference=CONFIG.get('conference')),
+            'partition_cols': ['Conference', 'Date'],
+        }
+    writer_result = open_row_writer(output_path, list(initialize_combined_data(row_type=normalize_times)), **writer_options)
+    if not writer_result["status"]:
+        logger.error(writer_result["message"])
+        return False
+    writer = writer_result["data"][0]
+    journal, finished = open_journal(journal_path, resume)
+
+    # Stage latencies, field timeouts, retries and progress, exported during the run and at its end
+    metrics_path = metrics_path or CONFIG.get('metrics_path')
+    exporter = PeriodicMetricsExporter(metrics_path, CONFIG.get('metrics_interval', 30)).start() if metrics_path else None
+
+    # Sessions finished by the interrupted run go to the output first
+    for sessions in finished.values():
+        writer.write_rows(iter_session_rows((SessionRecord.from_dict(session) for session in sessions), row_type=normalize_times))
+
+    def checkpoint(task, session_result):
+        session_dicts = [session.to_dict() for session in session_result["data"]] if session_result["status"] else None
+        record_progress(session_result["status"])
+        journal_result = journal.append(task, session_result["status"], session_dicts)
+        if not journal_result["status"]:
+            logger.error(journal_result["message"])
+        if session_result["status"]:
+            finished[journal_task_key(task)] = session_dicts
+            writer.write_rows(iter_session_rows(session_result["data"], row_type=normalize_times))
 
     try:
         logger.info("Starting the web scraping script...")
 
-        result = initialize_webdriver()
+        # Start the listing driver and every worker driver up front so Chrome launches overlap
+        config = CONFIG
+        prespawn_webdrivers(pool_size + 1, config.get('driver_profile', 'headless'), config.get('resource_rules'),
+                            profile_template=config.get('profile_template'))
+
+        result = create_worker_driver()
         if not result["status"]:
             logger.error(result["message"])
-            return
+            return False
         driver = result["data"]
+        set_trace_session(driver, 'listing')
+
+        try:
+            open_session_listing(driver)
+            elements_result = find_elements(driver, CONFIG['findelements'])
+            tasks_result = harvest_session_tasks(driver) if elements_result["status"] else elements_result
+        finally:
+            # The listing driver has loaded the site's bundles; keep its cache for the next run
+            close_driver(driver, promote_profile=True)
+
+        if not tasks_result["status"]:
+            logger.error(tasks_result["message"])
+            return False
+        tasks = tasks_result["data"]
+        pending = [task for task in tasks if journal_task_key(task) not in finished]
+
+        logger.info(f"Number of elements found: {len(tasks)}")
+        if len(pending) < len(tasks):
+            logger.info(f"Resuming: {len(tasks) - len(pending)} sessions already in {journal_path}")
+        logger.info(f"Scraping with {pool_size} WebDriver workers")
+        start_progress(len(pending))
+        pool_result = run_webdriver_pool(pending, scrape_session_task, pool_size=pool_size,
+                                         driver_factory=create_worker_driver, result_callback=checkpoint)
+        if not pool_result["status"]:
+            logger.warning(pool_result["message"])
+
+        for item in pool_result["data"]:
+            session_result = item["result"]
+            if not session_result["status"]:
+                logger.error(f"Session {item['task']}: {session_result['message']}")
 
-        url = WEBSITE_CONFIG['config']['url']
-        logger.info(f"Navigating to URL: {url}")
-        scrape_url(driver, url)
-
-        elements_result = find_elements(driver, WEBSITE_CONFIG['config']['findelements'])
-        if not elements_result["status"]:
-            logger.error(elements_result["message"])
-            return
-        elements = elements_result["data"]
-
-        logger.info(f"Number of elements found: {len(elements)}")
-        for index in range(len(elements):
-            try:
-                logger.info(f"Processing element at index: {index}")
-                elements_result = find_elements(driver, WEBSITE_CONFIG['config']['findelements'])
-                if not elements_result["status"]:
-                    logger.error(elements_result["message"])
-                    continue
-                elements = elements_result["data"]
-
-                if index < len(elements):
-                    driver.execute_script("arguments[0].scrollIntoView();", elements[index])
-                    ActionChains(driver).move_to_element(elements[index]).perform()
-
-                    if not click_element_multiple_retries(driver, elements[index]):
-                        continue
-                time.sleep(WEBSITE_CONFIG['config']['sleep_duration'])
-
-                session_event_type_result = extract_event_type(driver, WEBSITE_CONFIG['config'].get('event_type'))
-                if session_event_type_result["status"]:
-                    event_types = session_event_type_result["data"]
-                    if event_types:
-                        session_event_type = event_types[0]
-                        logger.info(f"Event Type: {session_event_type}")
-                    else:
-                        logger.error("No Event Type found.")
-                else:
-                    logger.error(session_event_type_result["message"])
-
-                session_date_time_elements_result = find_elements(driver, WEBSITE_CONFIG['config'].get('dateandtime_element'))
-                if not session_date_time_elements_result["status"]:
-                    logger.error(session_date_time_elements_result["message"])
-                    continue
-                session_date_time_elements = session_date_time_elements_result["data"]
-
-                session_time_parts_result = convert_mutiple_dateformats(driver, session_date_time_elements)
-                if session_time_parts_result["status"]:
-                    session_time_parts = session_time_parts_result["data"]
-                    for part in session_time_parts:
-                        session_date = part.get('date', '')
-                        session_start_time = part.get('start_time', '')
-                        session_end_time = part.get('end_time', '')
-                        session_timezone = part.get('timezone', '')
-                        session_full_time = part.get('time', '')
-                        session_title_xpath = WEBSITE_CONFIG['config'].get('title_element')
-                        session_title_element_txt = WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.XPATH, session_title_xpath))).text.strip() if session_title_xpath else ""
-
-                        session_types = WEBSITE_CONFIG['config'].get('session_types')
-                        session_type_element = extract_session_type(driver, session_types)
-                        if session_type_element["status"]:
-                            session_type_elements = session_type_element["data"]
-                            if session_type_elements:
-                                session_type_element = session_type_elements
-                            else:
-                                logger.error("No session types found.")
-
-                        session_location_xpath = WEBSITE_CONFIG['config'].get('location')
-                        session_location_texts = extract_locations(driver, session_location_xpath) if session_location_xpath else []
-                        if session_location_texts["status"]:
-                            session_location_text = session_location_texts["data"]
-                            if session_location_text:
-                                session_location_text = session_location_text
-                            else:
-                                logger.error("No session locations found.")
-
-                        session_details_text = f"{session_type_elements};{';'.join(session_location_text)};{session_title_element_txt}"
-
-                        session_disease_xpath = WEBSITE_CONFIG['config'].get('disease')
-                        session_diseases = extract_disease(driver, session_disease_xpath) if session_disease_xpath else []
-                        if session_diseases["status"]:
-                            session_diseases = session_diseases["data"]
-                            if session_diseases:
-                                session_diseases = session_diseases[0]
-                            else:
-                                logger.error("No diseases found.")
-
-                        session_authors_xpath = WEBSITE_CONFIG['config'].get('session_authors_xpath')
-                        session_authors = extract_session_authors(driver, session_authors_xpath) if session_authors_xpath else []
-                        if session_authors["status"]:
-                            session_authors = session_authors["data"]
-                            if session_authors:
-                                session_authors = session_authors[0]
-                            else:
-                                logger.error("No session authors found.")
-
-                        session_authors_affiliations_xpath = WEBSITE_CONFIG['config'].get('session_authors_affiliations_xpath')
-                        session_authors_affiliations = extract_session_authors_affiliations(driver, session_authors_affiliations_xpath) if session_authors_affiliations_xpath else []
-                        if session_authors_affiliations["status"]:
-                            session_authors_affiliations = session_authors_affiliations["data"]
-                            if session_authors_affiliations:
-                                session_authors_affiliations = session_authors_affiliations[0]
-                            else:
-                                logger.error("No session authors affiliations found.")
-
-                        custom_name_with_link = f'=HYPERLINK("{driver.current_url}", "{session_type_elements}")'
-
-                        presentation_link_text_values = driver.current_url
-
-                        # Append session data to combined_data dictionary
-                        combined_data["Event Type"].append(session_event_type)
-                        combined_data["Date"].append(session_date)
-                        combined_data["Time"].append(session_full_time)
-                        combined_data["Start Time"].append(session_start_time)
-                        combined_data["End Time"].append(session_end_time)
-                        combined_data["Time Zone"].append(session_timezone)
-                        combined_data["Location"].append(";".join(session_location_text))
-                        combined_data["Session Type"].append(session_type_elements)
-                        combined_data["Session Details"].append(session_details_text)
-                        combined_data["Title"].append(session_title_element_txt)
-                        combined_data["Abs"].append(custom_name_with_link)
-                        combined_data["Disease"].append(session_diseases)
-                        combined_data["Authors"].append(session_authors)
-                        combined_data["Affiliations"].append(session_authors_affiliations)
-                        combined_data["Details"].append("No Details Found")
-                        combined_data["Source"].append(presentation_link_text_values)
-
-                        presentation_title_xpath = WEBSITE_CONFIG['config'].get('presentation_title')
-                        presentation_titles = extract_presentation_titles(driver, presentation_title_xpath) if presentation_title_xpath else []
-
-                        if presentation_titles["status"]:
-                            presentation_titles = presentation_titles["data"]
-                            if presentation_titles:
-                                presentation_titles = presentation_titles
-                                print(type(presentation_titles))
-                            else:
-                                logger.error("No presentation titles found.")
-
-
-                        presentation_authors_xpath =WEBSITE_CONFIG['config'].get('presentation_authors')
-                        presentation_authors = extract_presentation_authors(driver, presentation_authors_xpath) if presentation_authors_xpath else []
-                        if presentation_authors["status"]:
-                            presentation_authors = presentation_authors["data"]
-                            if presentation_authors:
-                                presentation_authors = presentation_authors
-                                print(presentation_authors)
-                            else:
-                                logger.error("No presentation authors found.")
-
-
-                        presentation_affiliations_xpath = WEBSITE_CONFIG['config'].get('presentation_affiliations')
-                        presentation_affiliations = extract_presentation_affiliations(driver, presentation_affiliations_xpath) if presentation_affiliations_xpath else []
-                        if presentation_affiliations["status"]:
-                            presentation_affiliations = presentation_affiliations["data"]
-                            if presentation_affiliations:
-                                presentation_affiliations = presentation_affiliations
-                                print(presentation_affiliations)
-                            else:
-                                logger.error("No presentation affiliations found.")
-
-
-                        presentation_time_xpath = WEBSITE_CONFIG['config'].get('presentationtime_xpath')
-                        presentation_time_parts = extract_presentation_time(driver, presentation_time_xpath) if presentation_time_xpath else []
-                        if presentation_time_parts["status"]:
-                            presentation_time_parts = presentation_time_parts["data"]
-                            if presentation_time_parts:
-                                presentation_time_parts = presentation_time_parts
-                            else:
-                                logger.error("No presentation times found.")
-
-
-                        presentation_link_xpath =WEBSITE_CONFIG['config'].get('presentation_link')
-                        presentation_link_elements = WebDriverWait(driver, 10).until(EC.presence_of_all_elements_located((By.XPATH, presentation_link_xpath)))
-                        
-                        if isinstance(presentation_titles, list):
-                           for i in range(len(presentation_titles)):
-                                presentation_full_time = presentation_time_parts[i].get('p_time', '') if presentation_time_parts else ''
-                                presentation_start_time = presentation_time_parts[i].get('p_start_time', '') if presentation_time_parts else ''
-                                presentation_end_time = presentation_time_parts[i].get('p_end_time', '') if presentation_time_parts else ''
-                                presentation_timezone = presentation_time_parts[i].get('p_time_zone', '') if presentation_time_parts else ''
-
-
-                                if  presentation_link_elements and i < len(presentation_link_elements):
-                                   presentation_link_element = presentation_link_elements[i]
-                                   presentation_link_text_value = presentation_link_element.get_attribute('href')
-                                   link_text = presentation_link_element.text.strip()
-                                   presentation_link_text = f'=HYPERLINK("{presentation_link_text_value}", "{link_text}")'
-                                else:
-                                   presentation_link_text = ''
-
-                                combined_data["Event Type"].append(session_event_type)
-                                combined_data["Date"].append(session_date)
-                                combined_data["Time"].append(presentation_full_time)
-                                combined_data["Start Time"].append(presentation_start_time)
-                                combined_data["End Time"].append(presentation_end_time)
-                                combined_data["Time Zone"].append(presentation_timezone)
-                                combined_data["Location"].append(";".join(session_location_text))
-                                combined_data["Session Type"].append(session_type_elements)
-                                combined_data["Session Details"].append(f"{session_type_elements};{session_location_text};{presentation_titles[i]}")
-                                combined_data["Title"].append(presentation_titles[i])
-                                combined_data["Abs"].append(presentation_link_text)
-                                combined_data["Disease"].append(session_diseases)
-                                combined_data["Authors"].append(presentation_authors[i] if presentation_authors else "")
-                                combined_data["Affiliations"].append(presentation_affiliations[i] if presentation_affiliations else "")
-                                combined_data["Details"].append("No Details Found")
-                                combined_data["Source"].append(presentation_link_text_value)
-                            
-                        driver.execute_script("window.history.go(-1)")
-                        time.sleep(WEBSITE_CONFIG['config']['sleep_duration'])  # Sleep after navigating back
-                        elements = find_elements(driver, WEBSITE_CONFIG['config']['findelements'])
-                           
-                else:
-                    logger.error(session_time_parts_result["message"])
-
-            except StaleElementReferenceException as se:
-                logger.warning(f"Stale Element Reference Exception: {se}")
-
-            except TimeoutException as te:
-                logger.error(f"Timeout exception occurred at index {index}: {te}")
     except Exception as e:
         logger.error(f"Error occurred during web scraping: {e}")
 
     finally:
-        if driver:
-            driver.quit()  # Quit WebDriver session
- 
-            # Convert combined_data to a DataFrame
-            df = pd.DataFrame(combined_data)
-            # Save DataFrame to Excel
-            output_file = "AACO.xlsx"
-            df.to_excel(output_file, index=False)  # Save to Excel file
-            logger.info(f"Data successfully saved to {output_file}")
+        journal.close()
+        shutdown_prespawned_webdrivers()
+        log_wait_timings()
+        log_command_trace()
+
+        try:
+            writer.close()
+        except Exception as e:
+            logger.error(f"Error writing the last rows to {output_path}: {str(e)}")
+        logger.info(f"{writer.rows_written} rows of {len(finished)} sessions saved to {output_path}")
+        if writer.rows_failed:
+            logger.error(f"{writer.rows_failed} rows could not be written, see {output_path}.failed.jsonl")
+
+        if normalize_times:
+            normalize_result = postprocess_output(output_path)
+            if normalize_result["status"]:
+                logger.info(normalize_result["message"])
+            else:
+                logger.error(normalize_result["message"])
+
+        if exporter:
+            metrics_result = exporter.stop()
+            if metrics_result["status"]:
+                logger.info(metrics_result["message"])
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Scrape ASCO/AACR session listings.")
+    parser.add_argument("--pool-size", type=int, default=None, help="Number of parallel WebDriver workers (default: the conference config's pool_size).")
+    parser.add_argument("--resume", action="store_true", help="Skip sessions already finished in the checkpoint journal.")
+    parser.add_argument("--journal", default=DEFAULT_JOURNAL_PATH, help=f"Checkpoint journal path (default: {DEFAULT_JOURNAL_PATH}).")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_PATH, help=f"Output file; .xlsx, .csv, .jsonl, or .parquet for a partitioned dataset directory (default: {DEFAULT_OUTPUT_PATH}).")
+    parser.add_argument("--conference", default=DEFAULT_CONFERENCE, help=f"Registered conference config to scrape (default: {DEFAULT_CONFERENCE}).")
+    parser.add_argument("--metrics", default=None, help="Metrics file, JSON or Prometheus text format for .prom/.txt (default: the conference config's metrics_path; off unless set).")
+    parser.add_argument("--preflight", action="store_true", help="Only check every selector against the first listing and session page, then exit.")
+    parser.add_argument("--trace", action="store_true", help="Trace every WebDriver command and log the commands per session and per calling function.")
+    parser.add_argument("--trace-log", default=None, help="JSON Lines file receiving every traced command (implies --trace).")
+    parser.add_argument("--profile", choices=PROFILE_MODES, default=None, help="Run under cProfile (pstats file) or the sampling profiler (collapsed stacks); also S2I_PROFILE.")
+    parser.add_argument("--profile-path", default=None, help="Profile output file (default: profiles/ASCO_AACR-<timestamp>.prof or .folded).")
+    parser.add_argument("--profile-breakdown", action="store_true", help="Also record how much wall-clock time is spent on chromedriver, waiting, parsing and pandas.")
+    parser.add_argument("--normalize-times", action="store_true", help="After the scrape, add UTC start/end, duration and overlap columns and sort the output by time (default: the conference config's normalize_times).")
+    args = parser.parse_args()
+    ok = main(pool_size=args.pool_size, resume=args.resume, journal_path=args.journal, output_path=args.output,
+              conference=args.conference, preflight=args.preflight, metrics_path=args.metrics,
+              trace=args.trace, trace_path=args.trace_log,
+              profile=args.profile, profile_path=args.profile_path, profile_breakdown=args.profile_breakdown,
+              normalize_times=args.normalize_times)
+    sys.exit(1 if ok is False else 0)
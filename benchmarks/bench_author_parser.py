@@ -0,0 +1,117 @@
+# Benchmark of the author/affiliation parsers on the abstract fixtures in benchmarks/fixtures/abstracts.
+#
+#   python benchmarks/bench_author_parser.py [--repeat 500]
+#
+# Compares the BeautifulSoup parser extract_presentation_authors_affiliations used before
+# parse_authors_affiliations_html (copied below, minus the WebDriver lookups) with the lxml parser.
+# The fixtures are hand-built from the markup patterns of ASCO and abstractsonline abstract pages:
+# <sup> indexes, plain-digit indexes, index ranges, <br> separated affiliations, nested links, one shared affiliation.
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+
+import pandas as pd
+from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Exelixis_Library.ASCO_AACR_DataFactory import parse_authors_affiliations_html
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'abstracts')
+
+
+def legacy_parse_authors_affiliations(authors_html, abstract_html):
+    """extract_presentation_authors_affiliations before the lxml parser, on HTML strings."""
+    parts = re.split(r'<br\s*/?>\s*<br\s*/?>|;\s*<br\s*/?>', authors_html, flags=re.I)
+    if len(parts) < 2:
+        raise ValueError("Expected at least two parts (authors and affiliations) in the HTML content")
+
+    authors_part = parts[0].strip()
+    affiliations_part = parts[1].strip()
+
+    authors_soup = BeautifulSoup(authors_part, "html.parser")
+    authors_text = authors_soup.get_text(separator=" ")
+    authors_with_sup = re.findall(r'(.*?)\s*(\d+)', authors_text)
+    if not authors_with_sup:
+        authors_list = re.split(r',\s*', authors_text)
+        authors_with_sup = [(author.strip(), '') for author in authors_list]
+
+    affiliations_soup = BeautifulSoup(affiliations_part, "html.parser")
+    affiliations_text = affiliations_soup.get_text(separator="; ")
+    affiliations_list = re.split(r'(\d+)\s*;', affiliations_text)
+    affiliations_list = [affiliation.strip() for affiliation in affiliations_list if affiliation.strip()]
+
+    authors_cleaned = [f"{name.strip()} {number.strip()}" for name, number in authors_with_sup]
+
+    affiliations_cleaned = []
+    for i in range(0, len(affiliations_list), 2):
+        number = affiliations_list[i]
+        name = affiliations_list[i + 1] if (i + 1) < len(affiliations_list) else ''
+        affiliations_cleaned.append(f"{number} {name.strip()}")
+
+    if not any(number for name, number in authors_with_sup):
+        affiliations_cleaned = [f"{affiliations_part}"]
+
+    abstract_soup = BeautifulSoup(abstract_html, "html.parser")
+    abstract_text = abstract_soup.get_text(separator=" ", strip=True)
+
+    authors_str = '; '.join(authors_cleaned).replace(", ;", ";").replace("; ,", ";").replace("; ", ";").strip(",; ")
+    affiliations_str = '; '.join(affiliations_cleaned).replace(", ;", ";").replace("; ,", ";").replace(";;", ";").strip(",; ")
+
+    return pd.DataFrame({
+        'Authors': [authors_str],
+        'Affiliations': [affiliations_str],
+        'Abstract': [abstract_text]
+    })
+
+
+def inner_html(element):
+    return (element.text or '') + ''.join(lxml_html.tostring(child, encoding='unicode') for child in element)
+
+
+def load_fixtures():
+    """Returns (name, authors_html, abstract_html) for every fixture file."""
+    fixtures = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, '*.html'))):
+        with open(path, encoding='utf-8') as f:
+            document = lxml_html.fromstring(f"<html><body>{f.read()}</body></html>")
+        fixtures.append((os.path.basename(path),
+                         inner_html(document.xpath('//div[@class="authors"]')[0]),
+                         inner_html(document.xpath('//div[@class="abstract"]')[0])))
+    return fixtures
+
+
+def run(parse, fixtures, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for name, authors_html, abstract_html in fixtures:
+            parse(authors_html, abstract_html)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the author/affiliation parsers.")
+    parser.add_argument("--repeat", type=int, default=500, help="Passes over the fixture set (default: 500).")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures()
+    count = len(fixtures) * args.repeat
+
+    for name, authors_html, abstract_html in fixtures:
+        legacy = legacy_parse_authors_affiliations(authors_html, abstract_html).iloc[0]
+        record = parse_authors_affiliations_html(authors_html, abstract_html)
+        print(f"{name}\n  legacy: {legacy['Authors']}\n  lxml:   {record['authors_text']}")
+
+    legacy_seconds = run(legacy_parse_authors_affiliations, fixtures, args.repeat)
+    lxml_seconds = run(parse_authors_affiliations_html, fixtures, args.repeat)
+    print(f"\n{count} abstracts")
+    print(f"legacy bs4 + DataFrame {legacy_seconds:8.3f} s {count / legacy_seconds:>10,.0f} abstracts/s")
+    print(f"lxml records           {lxml_seconds:8.3f} s {count / lxml_seconds:>10,.0f} abstracts/s  ({legacy_seconds / lxml_seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
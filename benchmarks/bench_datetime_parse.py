@@ -0,0 +1,107 @@
+# Micro-benchmark of the date/time parsers on a corpus of conference date/time strings.
+#
+#   python benchmarks/bench_datetime_parse.py [--count 100000] [--distinct 400]
+#
+# Compares the whitespace-splitting parser parse_date_time_text used before the format registry
+# (copied below) with ASCO_AACR_DateTime.parse_date_time, uncached and with its LRU cache.
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Exelixis_Library.ASCO_AACR_DateTime import parse_date_time, parse_time_range
+
+
+def legacy_parse_date_time_text(text):
+    """parse_date_time_text before the format registry, kept for comparison."""
+    text = text.strip()
+    parts = text.split()
+
+    try:
+        if len(parts) >= 9 and parts[-1].startswith(('PST', 'GMT', 'CDT')):
+            date = parts[1].strip(',') + "-" + parts[0] + "-" + parts[2]
+            start_time = parts[3] + " " + parts[4]
+            end_time = parts[6] + " " + parts[7]
+            timezone = parts[8]
+            time = start_time + "-" + end_time
+        elif len(parts) >= 5 and parts[1].count('-') == 2 and parts[2].count(':') == 2:
+            date = parts[1]
+            start_time = parts[2]
+            end_time = parts[4]
+            timezone = None
+            time = start_time + "-" + end_time
+        elif len(parts) >= 7 and ',' in parts[1]:
+            month_day_year = parts[1].strip(',')
+            date = month_day_year.replace(',', '-') + "-" + parts[0]
+            start_time = parts[3] + " " + parts[4]
+            end_time = parts[6] + " " + parts[7]
+            timezone = None
+            time = start_time + "-" + end_time
+        else:
+            raise ValueError("Unrecognized format")
+
+        return {'date': date, 'start_time': start_time, 'end_time': end_time, 'timezone': timezone, 'time': time}
+    except Exception:
+        return {'original_text': text}
+
+
+def build_corpus(count, distinct, seed=7):
+    """Builds count date/time strings drawn from distinct variants, as a conference repeats its slots."""
+    rng = random.Random(seed)
+    months = ['April', 'May', 'June']
+    variants = []
+    while len(variants) < distinct:
+        day = rng.randint(1, 28)
+        month = rng.choice(months)
+        hour = rng.randint(7, 17)
+        minute = rng.choice(['00', '15', '30', '45'])
+        end_hour = hour + rng.randint(1, 2)
+        start12 = f"{(hour - 1) % 12 + 1}:{minute} {'AM' if hour < 12 else 'PM'}"
+        end12 = f"{(end_hour - 1) % 12 + 1}:{minute} {'AM' if end_hour < 12 else 'PM'}"
+        style = len(variants) % 4
+        if style == 0:
+            variants.append(f"{day} {month} 2024 {start12} – {end12} {rng.choice(['CDT', 'GMT-5', 'PST'])}")
+        elif style == 1:
+            variants.append(f"Sunday, {month} {day}, 2024, {start12} - {end12}")
+        elif style == 2:
+            variants.append(f"Friday 2024-05-{day:02d} {hour:02d}:{minute}:00 – {end_hour:02d}:{minute}:00")
+        else:
+            variants.append(f"{rng.randint(4, 6)}/{day}/2024 {start12} - {end12} EDT")
+    return [rng.choice(variants) for _ in range(count)]
+
+
+def run(label, parse, corpus):
+    started = time.perf_counter()
+    results = [parse(text) for text in corpus]
+    elapsed = time.perf_counter() - started
+    return {'label': label, 'seconds': elapsed, 'per_second': len(corpus) / elapsed, 'results': results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the date/time parsers.")
+    parser.add_argument("--count", type=int, default=100000, help="Number of strings to parse (default: 100000).")
+    parser.add_argument("--distinct", type=int, default=400, help="Number of distinct strings in the corpus (default: 400).")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.count, args.distinct)
+
+    runs = [
+        run("legacy split parser", legacy_parse_date_time_text, corpus),
+        run("registry, uncached", parse_date_time.__wrapped__, corpus),
+    ]
+    parse_date_time.cache_clear()
+    runs.append(run("registry, LRU cache", parse_date_time, corpus))
+    parse_time_range.cache_clear()
+    runs.append(run("time range, LRU cache", parse_time_range, corpus))
+
+    print(f"{len(corpus)} strings, {len(set(corpus))} distinct")
+    for result in runs:
+        unparsed = sum(1 for item in result['results'] if not item or 'original_text' in item)
+        print(f"{result['label']:<24} {result['seconds']:8.3f} s {result['per_second']:>12,.0f} strings/s   unparsed: {unparsed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# Import-time benchmark of the s2iTurbokit package.
+#
+#   python benchmarks/bench_import.py [--repeat 10]
+#
+# Every statement runs in a fresh interpreter, as in a new worker process, and is timed with -X importtime
+# (cumulative microseconds of the imports it triggers). 'eager' imports s2iWebKit up front, which is what
+# the package __init__ did before its s2iWebKit names became lazy attributes. The heavy dependencies loaded
+# by each statement are listed so a regression that imports selenium again for a helper shows up.
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STATEMENTS = [
+    ('helpers', "from s2iTurbokit import getDomainName, loadJSON"),
+    ('eager', "import s2iTurbokit, s2iTurbokit.s2iWebKit"),
+    ('webkit attribute', "from s2iTurbokit import scrape_url"),
+]
+
+HEAVY_MODULES = ('selenium', 'webdriver_manager', 'pdfkit', 'pypdf', 'bs4', 'requests', 'lxml')
+
+
+def time_import(statement):
+    """Runs statement in a fresh interpreter. Returns (import microseconds, heavy modules loaded)."""
+    code = f"{statement}\nimport sys\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=REPO_ROOT,
+                               capture_output=True, text=True, check=True)
+    # importtime lines: 'import time: self [us] | cumulative | imported package'; top-level imports are not indented
+    microseconds = 0
+    for line in completed.stderr.splitlines():
+        match = re.match(r'import time:\s+\d+ \|\s+(\d+) \| (\S.*)$', line)
+        if match:
+            microseconds += int(match.group(1))
+    return microseconds, completed.stdout.strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the import time of the s2iTurbokit package.")
+    parser.add_argument("--repeat", type=int, default=10, help="Fresh interpreters per statement (default: 10).")
+    args = parser.parse_args()
+
+    baseline = statistics.median(time_import('pass')[0] for _ in range(args.repeat))
+    results = {}
+    print(f"{'case':<17} {'median ms':>10} {'min ms':>8}  heavy modules loaded")
+    for name, statement in STATEMENTS:
+        runs = [time_import(statement) for _ in range(args.repeat)]
+        times = [microseconds - baseline for microseconds, _ in runs]
+        results[name] = statistics.median(times)
+        print(f"{name:<17} {results[name] / 1000:>10.1f} {min(times) / 1000:>8.1f}  {runs[0][1] or '-'}")
+
+    print(f"\nhelpers import {results['eager'] / max(results['helpers'], 1):.0f}x faster than the eager package import")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# Benchmark of normalize_session_times on a synthetic combined data DataFrame.
+#
+#   python benchmarks/bench_normalize_times.py [--rows 100000]
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Exelixis_Library.ASCO_AACR_DataFactory import initialize_combined_data, normalize_session_times
+
+
+def build_rows(count, seed=7):
+    """Builds count rows in the initialize_combined_data(row_type=True) layout, one session row per five."""
+    rng = np.random.default_rng(seed)
+    start_hours = rng.integers(7, 18, count)
+    minutes = rng.choice(['00', '15', '30', '45'], count)
+    durations = rng.integers(1, 3, count)
+
+    df = pd.DataFrame({column: [""] * count for column in initialize_combined_data(row_type=True)})
+    df['Event Type'] = "2024 ASCO Annual Meeting"
+    df['Date'] = [f"2024-06-{day:02d}" for day in rng.integers(1, 5, count)]
+    df['Start Time'] = [f"{(hour - 1) % 12 + 1}:{minute} {'AM' if hour < 12 else 'PM'}" for hour, minute in zip(start_hours, minutes)]
+    df['End Time'] = [f"{(hour + extra - 1) % 12 + 1}:{minute} {'AM' if hour + extra < 12 else 'PM'}"
+                      for hour, extra, minute in zip(start_hours, durations, minutes)]
+    df['Time Zone'] = rng.choice(['CDT', 'GMT-5', 'No Time Zone'], count)
+    df['Row Type'] = np.where(np.arange(count) % 5 == 0, 'Session', 'Presentation')
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark normalize_session_times.")
+    parser.add_argument("--rows", type=int, default=100000, help="Number of rows (default: 100000).")
+    args = parser.parse_args()
+
+    df = build_rows(args.rows)
+    started = time.perf_counter()
+    normalized = normalize_session_times(df, default_timezone='CDT')
+    elapsed = time.perf_counter() - started
+
+    print(f"{len(df)} rows normalized in {elapsed:.3f} s ({len(df) / elapsed:,.0f} rows/s), "
+          f"{int(normalized['Overlap'].sum())} overlapping sessions")
+
+
+if __name__ == "__main__":
+    main()
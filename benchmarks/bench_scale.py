@@ -0,0 +1,131 @@
+# Scaling benchmark of the listing walk, the extraction and the row writers on synthetic conferences.
+#
+#   python benchmarks/bench_scale.py [--sizes 100 1000 10000 100000] [--site asco] [--formats csv jsonl parquet]
+#
+# For every size, a SyntheticConference is served locally and the scraper runs without a browser:
+#   listing     fetch the listing page and harvest the session links with the compiled config locators
+#   extraction  fetch every session page, snapshot_page_source, ASCO_AACR_Main.extract_session_rows
+#   <format>    stream the extracted rows through open_row_writer, as main() does
+# Each stage reports microseconds per session and its growth exponent against the previous size: time grows
+# with size**exponent, so about 1.0 is linear and anything approaching 2.0 is quadratic.
+import argparse
+import logging
+import math
+import os
+import sys
+import tempfile
+import time
+import urllib.request
+from urllib.parse import urljoin
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lxml import html as lxml_html
+
+import Exelixis_Library.ASCO_AACR_Main as scraper
+from Exelixis_Library.ASCO_AACR_DataFactory import initialize_combined_data, get_session_xpaths, iter_session_rows
+from s2iTurbokit.s2iWebKit import snapshot_page_source
+from s2iTurbokit.s2iWriters import open_row_writer
+
+from fixture_config import register_fixture_configs
+from synthetic_conference import SyntheticConference, serve_conference
+
+# Growth exponents above this are reported as superlinear
+SUPERLINEAR_EXPONENT = 1.25
+
+
+def fetch(url):
+    with urllib.request.urlopen(url) as response:
+        return response.read()
+
+
+def measure(size, site, formats, work_dir):
+    """Runs every stage on a synthetic conference of size sessions. Returns stage -> seconds, plus counts."""
+    server, base_url = serve_conference(SyntheticConference(size))
+    try:
+        scraper.use_conference(f"fixture-{site}")
+        scraper.CONFIG.update(url=f"{base_url}/{site}/index.html", extraction_mode='page_source')
+        locators = scraper.LOCATORS
+        xpaths, section_xpath, section_xpaths = get_session_xpaths(scraper.CONFIG)
+        seconds = {}
+
+        started = time.perf_counter()
+        listing = lxml_html.fromstring(fetch(scraper.CONFIG['url']))
+        urls = [urljoin(scraper.CONFIG['url'], link.get('href'))
+                for card in locators['findelements'].compiled(listing) for link in locators['session_link'].compiled(card)[:1]]
+        seconds['listing'] = time.perf_counter() - started
+
+        writers = {}
+        for output_format in formats:
+            writer_result = open_row_writer(os.path.join(work_dir, f"{site}-{size}.{output_format}"), list(initialize_combined_data()))
+            if not writer_result["status"]:
+                raise RuntimeError(writer_result["message"])
+            writers[output_format] = writer_result["data"][0]
+            seconds[output_format] = 0.0
+
+        seconds['extraction'] = 0.0
+        sessions = presentations = 0
+        for url in urls:
+            started = time.perf_counter()
+            page_source = fetch(url).decode('utf-8')
+            snapshot = snapshot_page_source(page_source, xpaths, section_xpath, section_xpaths, url=url)["data"][0]
+            result = scraper.extract_session_rows(None, snapshot=snapshot)
+            seconds['extraction'] += time.perf_counter() - started
+            if not result["status"]:
+                continue
+
+            sessions += len(result["data"])
+            presentations += sum(len(session.presentations) for session in result["data"])
+            rows = list(iter_session_rows(result["data"]))
+            for output_format, writer in writers.items():
+                started = time.perf_counter()
+                writer.write_rows(rows)
+                seconds[output_format] += time.perf_counter() - started
+
+        for output_format, writer in writers.items():
+            started = time.perf_counter()
+            writer.close()
+            seconds[output_format] += time.perf_counter() - started
+    finally:
+        server.shutdown()
+
+    return seconds, len(urls), sessions, presentations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that listing, extraction and writers scale linearly.")
+    parser.add_argument("--sizes", type=int, nargs='+', default=[100, 1000, 10000], help="Conference sizes in sessions (default: 100 1000 10000).")
+    parser.add_argument("--site", default='asco', choices=['asco', 'aacr'], help="Site shape (default: asco).")
+    parser.add_argument("--formats", nargs='*', default=['csv', 'jsonl', 'parquet'], help="Row writer formats (default: csv jsonl parquet).")
+    args = parser.parse_args()
+
+    # extract_session_rows logs every session without presentations or chairs
+    logging.disable(logging.CRITICAL)
+    register_fixture_configs()
+
+    stages = ['listing', 'extraction'] + args.formats
+    previous = None
+    print(f"{'sessions':>9} {'presentations':>13} " + ' '.join(f"{stage + ' us/session':>22}" for stage in stages))
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in sorted(args.sizes):
+            seconds, listed, sessions, presentations = measure(size, args.site, args.formats, work_dir)
+            cells = []
+            superlinear = []
+            for stage in stages:
+                cell = f"{seconds[stage] / size * 1e6:,.1f}"
+                if previous and previous[1][stage] > 0 and seconds[stage] > 0:
+                    exponent = math.log(seconds[stage] / previous[1][stage]) / math.log(size / previous[0])
+                    cell += f" (n^{exponent:.2f})"
+                    if exponent > SUPERLINEAR_EXPONENT:
+                        superlinear.append(stage)
+                cells.append(f"{cell:>22}")
+            print(f"{size:>9} {presentations:>13} " + ' '.join(cells))
+            if listed != size:
+                print(f"  listing walk found {listed} of {size} sessions")
+            if superlinear:
+                print(f"  superlinear growth: {', '.join(superlinear)}")
+            previous = (size, seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+# End-to-end scraping benchmark against the saved ASCO and AACR pages in benchmarks/fixtures/site.
+#
+#   python benchmarks/bench_scrape.py [--sites asco aacr] [--modes live snapshot page_source] [--pool-size 2]
+#                                     [--offline] [--repeat 20] [--synthetic SESSIONS]
+#                                     [--compare benchmarks/results/<previous>.json]
+#
+# The pages are served by a local HTTP server, so no request leaves the machine; --synthetic serves a
+# synthetic_conference.py program of that size instead. Every site/mode case runs in
+# its own process, so peak RSS and the module-level caches are not carried over between cases:
+#   pipeline    the real ASCO_AACR_Main.main() - listing walk, WebDriver pool, extraction, JSON Lines output
+#   extractors  extract_session_rows on every session page with one WebDriver, --repeat passes
+#   offline     the DataFactory extractors on page_source snapshots fetched over HTTP, no browser (--offline
+#               runs only this case; it measures the parsing ceiling)
+# Reported per case: sessions per minute, WebDriver round-trips (chromedriver commands) per session and peak RSS
+# of the Python process and of its largest reaped child (chromedriver/Chrome). Results are written to
+# benchmarks/results/scrape-<time>-<git revision>.json; --compare prints the change against an earlier file.
+import argparse
+import datetime
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from urllib.parse import urljoin
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(BENCHMARKS_DIR))
+
+RESULTS_DIR = os.path.join(BENCHMARKS_DIR, 'results')
+MODES = ('live', 'snapshot', 'page_source')
+
+
+def count_round_trips():
+    """Counts every chromedriver command sent by any WebDriver in this process."""
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+    counter = {'commands': 0}
+    lock = threading.Lock()
+    original_execute = WebDriver.execute
+
+    def execute(self, driver_command, params=None):
+        with lock:
+            counter['commands'] += 1
+        return original_execute(self, driver_command, params)
+
+    WebDriver.execute = execute
+    return counter
+
+
+def peak_rss_mb(who=resource.RUSAGE_SELF):
+    """Peak resident set size in MB (ru_maxrss is KB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(who).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def configure_site(site, base_url, mode, pool_size):
+    """Registers the fixture configs and points the loaded settings of one site at the fixture server."""
+    from fixture_config import register_fixture_configs
+    from s2iTurbokit.s2iConfig import load_config
+
+    register_fixture_configs()
+    name = f"fixture-{site}"
+    config_result = load_config(name)
+    if not config_result["status"]:
+        raise RuntimeError(config_result["message"])
+    config_result["data"][0]['settings'].update(url=f"{base_url}/{site}/index.html", extraction_mode=mode,
+                                                pool_size=pool_size, driver_profile='headless')
+    return name
+
+
+def run_pipeline(site, base_url, mode, pool_size, repeat):
+    """Runs ASCO_AACR_Main.main() on the fixture site and counts the sessions it wrote."""
+    import Exelixis_Library.ASCO_AACR_Main as scraper
+    from s2iTurbokit.s2iJournal import load_journal, get_finished_tasks
+
+    conference = configure_site(site, base_url, mode, pool_size)
+    round_trips = count_round_trips()
+    with tempfile.TemporaryDirectory() as work_dir:
+        output_path = os.path.join(work_dir, 'sessions.jsonl')
+        journal_path = os.path.join(work_dir, 'journal.jsonl')
+        started = time.perf_counter()
+        ok = scraper.main(pool_size=pool_size, journal_path=journal_path, output_path=output_path, conference=conference)
+        seconds = time.perf_counter() - started
+        if ok is False:
+            raise RuntimeError("main() failed, see its log above")
+
+        # The journal holds every session written to the output, with its presentations
+        sessions = [session for task_sessions in get_finished_tasks(load_journal(journal_path)["data"][0]).values()
+                    for session in task_sessions]
+    return {'sessions': len(sessions), 'presentations': sum(len(session['presentations']) for session in sessions),
+            'seconds': seconds, 'round_trips': round_trips['commands']}
+
+
+def run_extractors(site, base_url, mode, pool_size, repeat):
+    """Runs extract_session_rows on every fixture session page with one WebDriver, repeat times."""
+    import Exelixis_Library.ASCO_AACR_Main as scraper
+    from s2iTurbokit.s2iWebKit import close_driver
+
+    conference = configure_site(site, base_url, mode, pool_size)
+    scraper.use_conference(conference)
+    round_trips = count_round_trips()
+
+    driver_result = scraper.create_worker_driver()
+    if not driver_result["status"]:
+        raise RuntimeError(driver_result["message"])
+    driver = driver_result["data"]
+    try:
+        scraper.open_session_listing(driver)
+        tasks_result = scraper.harvest_session_tasks(driver)
+        if not tasks_result["status"]:
+            raise RuntimeError(tasks_result["message"])
+        urls = [task for task in tasks_result["data"] if isinstance(task, str)]
+
+        sessions = presentations = 0
+        commands_before = round_trips['commands']
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for url in urls:
+                scraper.navigate_to_url(driver, url)
+                scraper.wait_for_session_page(driver)
+                result = scraper.extract_session_rows(driver)
+                if result["status"]:
+                    sessions += len(result["data"])
+                    presentations += sum(len(session.presentations) for session in result["data"])
+        seconds = time.perf_counter() - started
+        commands = round_trips['commands'] - commands_before
+    finally:
+        close_driver(driver)
+    return {'sessions': sessions, 'presentations': presentations, 'seconds': seconds, 'round_trips': commands}
+
+
+def run_offline(site, base_url, mode, pool_size, repeat):
+    """Runs extract_session_rows on page_source snapshots of the fixture pages, without a browser."""
+    from lxml import html as lxml_html
+    import Exelixis_Library.ASCO_AACR_Main as scraper
+    from Exelixis_Library.ASCO_AACR_DataFactory import get_session_xpaths
+    from s2iTurbokit.s2iWebKit import snapshot_page_source
+
+    scraper.use_conference(configure_site(site, base_url, 'page_source', pool_size))
+    config, locators = scraper.CONFIG, scraper.LOCATORS
+
+    with urllib.request.urlopen(config['url']) as response:
+        listing = lxml_html.fromstring(response.read())
+    cards = locators['findelements'].compiled(listing)
+    urls = [urljoin(config['url'], link.get('href')) for card in cards for link in locators['session_link'].compiled(card)[:1]]
+    pages = []
+    for url in urls:
+        with urllib.request.urlopen(url) as response:
+            pages.append((url, response.read().decode('utf-8')))
+
+    xpaths, section_xpath, section_xpaths = get_session_xpaths(config)
+    sessions = presentations = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for url, page_source in pages:
+            snapshot = snapshot_page_source(page_source, xpaths, section_xpath, section_xpaths, url=url)["data"][0]
+            result = scraper.extract_session_rows(None, snapshot=snapshot)
+            if result["status"]:
+                sessions += len(result["data"])
+                presentations += sum(len(session.presentations) for session in result["data"])
+    seconds = time.perf_counter() - started
+    return {'sessions': sessions, 'presentations': presentations, 'seconds': seconds, 'round_trips': 0}
+
+
+CASES = {'pipeline': run_pipeline, 'extractors': run_extractors, 'offline': run_offline}
+
+
+def run_case(kind, site, mode, pool_size, repeat, synthetic=0):
+    """Runs one case in this process against the saved fixtures, or a synthetic conference of that many sessions."""
+    if synthetic:
+        from synthetic_conference import SyntheticConference, serve_conference
+        server, base_url = serve_conference(SyntheticConference(synthetic))
+    else:
+        from fixture_server import serve_directory
+        server, base_url = serve_directory()
+    try:
+        measured = CASES[kind](site, base_url, mode, pool_size, repeat)
+    finally:
+        server.shutdown()
+
+    sessions = measured['sessions']
+    return dict(measured, kind=kind, site=site, mode='page_source' if kind == 'offline' else mode,
+                pool_size=pool_size, synthetic_sessions=synthetic, http_requests=server.request_count,
+                sessions_per_minute=sessions / measured['seconds'] * 60 if measured['seconds'] else 0.0,
+                round_trips_per_session=measured['round_trips'] / sessions if sessions else None,
+                peak_rss_mb=peak_rss_mb(), peak_child_rss_mb=peak_rss_mb(resource.RUSAGE_CHILDREN))
+
+
+def run_case_process(kind, site, mode, pool_size, repeat, synthetic=0):
+    """Runs one case in a fresh interpreter and returns its measurements, or an error entry."""
+    command = [sys.executable, os.path.abspath(__file__), '--case', kind, site, mode,
+               '--pool-size', str(pool_size), '--repeat', str(repeat), '--synthetic', str(synthetic)]
+    completed = subprocess.run(command, capture_output=True, text=True)
+    lines = completed.stdout.strip().splitlines()
+    if completed.returncode or not lines:
+        return {'kind': kind, 'site': site, 'mode': mode, 'error': (completed.stderr.strip().splitlines() or ['failed'])[-1]}
+    return json.loads(lines[-1])
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCHMARKS_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except Exception:
+        return 'unknown'
+
+
+def case_key(case):
+    return (case['kind'], case['site'], case['mode'], case.get('synthetic_sessions', 0))
+
+
+def print_results(results, previous=None):
+    previous_cases = {case_key(case): case for case in (previous or {}).get('cases', [])}
+    print(f"{'case':<32} {'sessions':>8} {'sessions/min':>13} {'trips/session':>14} {'rss MB':>8} {'child MB':>9}")
+    for case in results['cases']:
+        label = f"{case['kind']} {case['site']} {case['mode']}"
+        if 'error' in case:
+            print(f"{label:<32} error: {case['error']}")
+            continue
+        trips = f"{case['round_trips_per_session']:.1f}" if case['round_trips_per_session'] is not None else '-'
+        line = (f"{label:<32} {case['sessions']:>8} {case['sessions_per_minute']:>13,.0f} {trips:>14} "
+                f"{case['peak_rss_mb']:>8.0f} {case['peak_child_rss_mb']:>9.0f}")
+        before = previous_cases.get(case_key(case))
+        if before and 'error' not in before and before['sessions_per_minute']:
+            line += f"   {case['sessions_per_minute'] / before['sessions_per_minute'] - 1:+.0%} sessions/min"
+            if before['round_trips_per_session'] and case['round_trips_per_session'] is not None:
+                line += f", {case['round_trips_per_session'] - before['round_trips_per_session']:+.1f} trips/session"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scraper against saved conference pages on a local server.")
+    parser.add_argument("--sites", nargs='+', default=['asco', 'aacr'], choices=['asco', 'aacr'], help="Fixture sites (default: both).")
+    parser.add_argument("--modes", nargs='+', default=list(MODES), choices=MODES, help="Extraction modes (default: all).")
+    parser.add_argument("--pool-size", type=int, default=2, help="WebDriver workers for the pipeline case (default: 2).")
+    parser.add_argument("--repeat", type=int, default=20, help="Passes over the session pages in the extractor cases (default: 20).")
+    parser.add_argument("--offline", action="store_true", help="Only run the browser-free extractor case.")
+    parser.add_argument("--synthetic", type=int, default=0, metavar="SESSIONS",
+                        help="Serve a synthetic conference of this many sessions instead of the saved fixtures.")
+    parser.add_argument("--compare", help="Earlier results file to compare with.")
+    parser.add_argument("--case", nargs=3, metavar=('KIND', 'SITE', 'MODE'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(*args.case, args.pool_size, args.repeat, args.synthetic), default=str))
+        return
+
+    cases = [('offline', site, 'page_source') for site in args.sites]
+    if not args.offline:
+        cases += [(kind, site, mode) for kind in ('extractors', 'pipeline') for site in args.sites for mode in args.modes]
+
+    results = {
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cases': [run_case_process(kind, site, mode, args.pool_size, args.repeat, args.synthetic) for kind, site, mode in cases],
+    }
+
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            previous = json.load(f)
+    print_results(results, previous)
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    results_path = os.path.join(RESULTS_DIR, f"scrape-{time.strftime('%Y%m%d-%H%M%S')}-{results['git_revision']}.json")
+    with open(results_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {results_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Check that rows extracted from real session pages can be written in every output format.
+#
+#   python benchmarks/check_writers.py
+#
+# The fixture session pages in benchmarks/fixtures/site are extracted offline with snapshot_page_source and
+# ASCO_AACR_Main.extract_session_rows, as in a page_source run, and the rows are streamed through
+# open_row_writer with the options main() uses (the typed Arrow schema for Parquet). Every output is read
+# back and must hold all rows with text cells only; the script exits with status 1 otherwise.
+import functools
+import glob
+import logging
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+import Exelixis_Library.ASCO_AACR_Main as scraper
+from Exelixis_Library.ASCO_AACR_DataFactory import initialize_combined_data, get_session_xpaths, iter_session_rows, combined_rows_to_arrow
+from s2iTurbokit.s2iWebKit import snapshot_page_source
+from s2iTurbokit.s2iWriters import open_row_writer
+
+from fixture_config import register_fixture_configs
+from fixture_server import FIXTURE_SITE_DIR
+
+FORMATS = ('csv', 'jsonl', 'xlsx', 'parquet')
+
+READERS = {
+    'csv': lambda path: pd.read_csv(path, dtype=str, keep_default_na=False),
+    'jsonl': lambda path: pd.read_json(path, lines=True, dtype=False),
+    'xlsx': lambda path: pd.read_excel(path, dtype=str),
+    'parquet': lambda path: pd.read_parquet(path),
+}
+
+
+def extract_fixture_rows(site):
+    """Extracts every fixture session page of a site. Returns the rows in the output column order."""
+    scraper.use_conference(f"fixture-{site}")
+    xpaths, section_xpath, section_xpaths = get_session_xpaths(scraper.CONFIG)
+    rows = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_SITE_DIR, site, 'session-*.html'))):
+        with open(path, encoding='utf-8') as f:
+            snapshot = snapshot_page_source(f.read(), xpaths, section_xpath, section_xpaths, url=f"file://{path}")["data"][0]
+        result = scraper.extract_session_rows(None, snapshot=snapshot)
+        if not result["status"]:
+            raise RuntimeError(f"{path}: {result['message']}")
+        rows.extend(iter_session_rows(result["data"]))
+    return rows
+
+
+def check_format(output_format, rows, work_dir):
+    """Writes rows in one format and reads them back. Returns a list of problems."""
+    path = os.path.join(work_dir, f"rows.{output_format}")
+    writer_options = {}
+    if output_format == 'parquet':
+        writer_options = {'table_builder': functools.partial(combined_rows_to_arrow, conference=None),
+                          'partition_cols': ['Conference', 'Date']}
+    writer_result = open_row_writer(path, list(initialize_combined_data()), **writer_options)
+    if not writer_result["status"]:
+        return [writer_result["message"]]
+    writer = writer_result["data"][0]
+    try:
+        writer.write_rows(rows)
+        writer.close()
+    except Exception as e:
+        return [f"write failed: {type(e).__name__}: {e}"]
+
+    problems = []
+    if writer.rows_failed:
+        problems.append(f"{writer.rows_failed} rows quarantined")
+    frame = READERS[output_format](path)
+    if len(frame) != len(rows):
+        problems.append(f"read back {len(frame)} of {len(rows)} rows")
+    # The Parquet schema splits the Abs HYPERLINK formula into 'Abs URL' and 'Abs Text'
+    for column in ('Session Type', 'Session Details', 'Location', 'Abs Text' if output_format == 'parquet' else 'Abs'):
+        bad = [value for value in frame[column] if not (isinstance(value, str) or pd.isna(value)) or str(value).startswith('[')]
+        if bad:
+            problems.append(f"'{column}' holds non-text values, e.g. {bad[0]!r}")
+    return problems
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    register_fixture_configs()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as work_dir:
+        for site in ('asco', 'aacr'):
+            rows = extract_fixture_rows(site)
+            for output_format in FORMATS:
+                problems = check_format(output_format, rows, os.path.join(work_dir, site))
+                failed = failed or bool(problems)
+                print(f"{site:<5} {output_format:<8} {len(rows):>3} rows  {'; '.join(problems) or 'ok'}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+# Conference configs for the fixture site served by fixture_server.py.
+#
+# Copies of the real configs with the listing URLs pointed at the fixture server. Benchmarks register them
+# with register_fixture_configs and may change the loaded settings (URL, extraction_mode, ...) before a run.
+from s2iExtensions.Exelixis.ASCOconfig import WEBSITE_CONFIG as ASCO_WEBSITE_CONFIG
+from s2iExtensions.Exelixis.AACRConfig import WEBSITE_CONFIG as AACR_WEBSITE_CONFIG
+from s2iExtensions.Exelixis.ConferenceConfigs import REQUIRED_SELECTOR_KEYS
+from s2iTurbokit.s2iConfig import register_config
+
+from fixture_server import DEFAULT_PORT
+
+FIXTURE_URL = f"http://127.0.0.1:{DEFAULT_PORT}"
+
+WEBSITE_CONFIG = {
+    'asco': dict(ASCO_WEBSITE_CONFIG['asco'], url=f"{FIXTURE_URL}/asco/index.html", profile_template=None),
+    # abstractsonline lists sessions as <ul id="results"><li>, the alternative listing XPath of the config
+    'aacr': dict(AACR_WEBSITE_CONFIG['asco'], url=f"{FIXTURE_URL}/aacr/index.html", profile_template=None,
+                 findelements=AACR_WEBSITE_CONFIG['asco']['findelementss']),
+}
+
+
+def register_fixture_configs():
+    """
+    Registers the fixture configs as 'fixture-asco' and 'fixture-aacr'.
+
+    Returns:
+    list: The registered config names.
+    """
+    names = []
+    for site in WEBSITE_CONFIG:
+        register_config(f"fixture-{site}", __name__, site, REQUIRED_SELECTOR_KEYS)
+        names.append(f"fixture-{site}")
+    return names
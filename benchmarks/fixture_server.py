@@ -0,0 +1,82 @@
+# Serves the saved conference pages in benchmarks/fixtures/site (or any directory) over local HTTP.
+#
+#   python benchmarks/fixture_server.py [--root benchmarks/fixtures/site] [--port 8765]
+#
+# The benchmarks start it in-process with serve_directory; run it standalone to inspect the pages in a browser.
+import argparse
+import functools
+import os
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURE_SITE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'site')
+DEFAULT_PORT = 8765
+
+
+class CountingRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler that counts requests instead of logging each one."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def count_request(self):
+        with self.server.request_count_lock:
+            self.server.request_count += 1
+
+    def do_GET(self):
+        self.count_request()
+        super().do_GET()
+
+
+def start_server(handler, host='127.0.0.1', port=0):
+    """
+    Starts an HTTP server with a request counter in a daemon thread.
+
+    Args:
+    handler (callable): Request handler class or factory.
+    host (str): Interface to bind. Default is 127.0.0.1.
+    port (int): Port to bind; 0 picks a free port. Default is 0.
+
+    Returns:
+    tuple: (server, base URL without trailing slash). server.request_count counts GET requests; call
+           server.shutdown() to stop it.
+    """
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.request_count = 0
+    server.request_count_lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, name="fixture-server", daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def serve_directory(root=FIXTURE_SITE_DIR, host='127.0.0.1', port=0):
+    """
+    Serves a directory over HTTP from a daemon thread.
+
+    Args:
+    root (str): Directory to serve. Default is benchmarks/fixtures/site.
+    host (str): Interface to bind. Default is 127.0.0.1.
+    port (int): Port to bind; 0 picks a free port. Default is 0.
+
+    Returns:
+    tuple: (server, base URL without trailing slash), as start_server.
+    """
+    return start_server(functools.partial(CountingRequestHandler, directory=root), host, port)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve saved conference pages over local HTTP.")
+    parser.add_argument("--root", default=FIXTURE_SITE_DIR, help="Directory to serve (default: benchmarks/fixtures/site).")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port to listen on (default: {DEFAULT_PORT}).")
+    args = parser.parse_args()
+
+    server, base_url = serve_directory(args.root, port=args.port)
+    print(f"Serving {args.root} at {base_url}/ - Ctrl+C to stop")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+# Synthetic conference site for scale testing, in the DOM shape the WEBSITE_CONFIG XPaths expect.
+#
+#   python benchmarks/synthetic_conference.py --sessions 100000 [--seed 7] [--port 8765]   serve it
+#   python benchmarks/synthetic_conference.py --sessions 500 --write /tmp/site                write it to disk
+#
+# Pages are rendered on request from (seed, session number), so a 100,000 session site needs no disk space
+# and every run sees the same program. /asco/ serves the meetings.asco.org shape (div.session-card listing,
+# day-month-year times with a time zone), /aacr/ the abstractsonline shape (ul#results listing,
+# month-day-year times). Presentation counts follow the session type: poster sessions carry dozens of
+# posters, oral sessions a dozen talks, education sessions a few, workshops none.
+import argparse
+import datetime
+import html
+import os
+import random
+import re
+import threading
+from http.server import BaseHTTPRequestHandler
+
+from fixture_server import DEFAULT_PORT, start_server
+
+# (session type, share of sessions, min and max presentations, minutes per presentation; 0 = all share the session time)
+SESSION_TYPES = (
+    ('Poster Session', 0.30, 20, 120, 0),
+    ('Oral Abstract Session', 0.12, 6, 12, 12),
+    ('Poster Discussion Session', 0.10, 6, 15, 10),
+    ('Education Session', 0.25, 2, 5, 20),
+    ('Clinical Science Symposium', 0.08, 3, 6, 15),
+    ('Special Session', 0.05, 0, 1, 30),
+    ('Career Development Workshop', 0.10, 0, 0, 0),
+)
+
+TRACKS = ('Breast Cancer—Metastatic', 'Lung Cancer—Non-Small Cell Metastatic', 'Genitourinary Cancer—Kidney and Bladder',
+          'Gastrointestinal Cancer—Colorectal and Anal', 'Developmental Therapeutics—Molecularly Targeted Agents and Tumor Biology',
+          'Hematologic Malignancies—Leukemia, Myelodysplastic Syndromes, and Allotransplant', 'Melanoma/Skin Cancers',
+          'Tumor Biology', 'Experimental and Molecular Therapeutics', 'Immunology')
+LOCATIONS = ('Hall D1', 'Hall A', 'Arie Crown Theater', 'E450', 'S100a', 'S406', 'Poster Section 12', 'Poster Section 30')
+FIRST_NAMES = ('Jing', 'Robert', 'Sofia', 'Ahmed', 'Mei', 'Lars', 'Priya', 'Tomás', 'Hannah', 'Daniel', 'Amara', 'Kenji',
+               'Elena', 'Samuel', 'Fatima', 'Olivia', 'Mateo', 'Ingrid', 'Ravi', 'Chloé')
+LAST_NAMES = ('Chen', 'Miller', 'Rossi', 'Hassan', 'Tanaka', 'Nilsson', 'Natarajan', 'García', 'Weber', 'Okafor',
+              'Kowalski', 'Dubois', 'Haddad', 'Novak', 'Silva', 'Kim', 'Andersen', 'Moreau', 'Iyer', 'Brown')
+INSTITUTIONS = ('Fred Hutchinson Cancer Center', 'Johns Hopkins University School of Medicine', 'Karolinska Institutet',
+                'Memorial Sloan Kettering Cancer Center', 'German Cancer Research Center (DKFZ)', 'Gustave Roussy',
+                'University of California San Francisco', 'MD Anderson Cancer Center', 'Peter MacCallum Cancer Centre',
+                'National Cancer Center Hospital East', 'Istituto Nazionale dei Tumori', 'Exelixis, Inc.')
+TITLE_WORDS = ('zanzalintinib', 'cabozantinib', 'atezolizumab', 'first-line', 'randomized', 'phase III', 'biomarker',
+               'circulating tumor DNA', 'resistance', 'metastatic', 'real-world', 'outcomes', 'MET', 'AXL', 'VEGFR2',
+               'neoadjuvant', 'single-arm', 'survival', 'patient-reported', 'combination')
+
+# Conference days and display formats of the two site shapes
+SITE_STYLES = {
+    'asco': {'event': '2024 ASCO Annual Meeting', 'first_day': datetime.date(2024, 5, 31), 'days': 5, 'time_zone': ' CDT',
+             'date_format': '{weekday}, {day} {month} {year}'},
+    'aacr': {'event': 'AACR Annual Meeting 2024', 'first_day': datetime.date(2024, 4, 5), 'days': 6, 'time_zone': '',
+             'date_format': '{weekday}, {month} {day}, {year},'},
+}
+
+SESSION_PATH = re.compile(r'^/(asco|aacr)/session-(\d+)\.html$')
+LISTING_PATH = re.compile(r'^/(asco|aacr)/(?:index\.html)?$')
+
+
+def _clock(minutes):
+    hour, minute = divmod(minutes, 60)
+    return f"{(hour - 1) % 12 + 1}:{minute:02d} {'AM' if hour < 12 else 'PM'}"
+
+
+def _person(rng):
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+class SyntheticConference:
+    """
+    A deterministic synthetic program of sessions and presentations.
+
+    Args:
+    sessions (int): Number of sessions, e.g. 100 to 100,000.
+    seed (int): Seed of the program; the same seed always renders the same pages. Default is 7.
+    """
+
+    def __init__(self, sessions, seed=7):
+        self.sessions = sessions
+        self.seed = seed
+        self.listing_cache = {}
+        self.listing_lock = threading.Lock()
+
+    def session(self, number):
+        """
+        Generates session number (1-based) of the program.
+
+        Returns:
+        dict: Session with 'number', 'title', 'type', 'day' (offset), 'start' and 'end' (minutes after midnight),
+              'location', 'track' (or None), 'chairs' (list of (name, institution)) and 'presentations'
+              (list of dicts with 'number', 'title', 'start', 'end', 'authors' and 'institutions').
+        """
+        rng = random.Random(self.seed * 1000003 + number)
+        session_type, _, low, high, slot = rng.choices(SESSION_TYPES, weights=[entry[1] for entry in SESSION_TYPES])[0]
+        count = rng.randint(low, high)
+        start = rng.choice(range(7 * 60, 17 * 60, 15))
+        length = max(45, count * slot) if slot else rng.choice((60, 90, 120, 180))
+        end = min(start + length, 23 * 60 + 45)
+
+        presentations = []
+        for index in range(count):
+            slot_start = start + index * slot if slot else start
+            presentations.append({
+                'number': number * 1000 + index,
+                'title': ' '.join(rng.sample(TITLE_WORDS, rng.randint(4, 9))).capitalize(),
+                'start': min(slot_start, end),
+                'end': min(slot_start + slot, end) if slot else end,
+                'authors': [_person(rng) for _ in range(rng.randint(0, 6))],
+                'institutions': rng.sample(INSTITUTIONS, rng.randint(1, 3)),
+            })
+
+        return {
+            'number': number,
+            'title': f"{rng.choice(TRACKS)}: {' '.join(rng.sample(TITLE_WORDS, 3))}",
+            'type': session_type,
+            'day': rng.randrange(SITE_STYLES['asco']['days']),
+            'start': start,
+            'end': end,
+            'location': rng.choice(LOCATIONS),
+            'track': rng.choice(TRACKS) if rng.random() < 0.8 else None,
+            'chairs': [(_person(rng), rng.choice(INSTITUTIONS)) for _ in range(rng.choice((0, 0, 1, 2, 3)))],
+            'presentations': presentations,
+        }
+
+    def render_listing(self, site):
+        """Renders the listing page of all sessions in the site's shape. Rendered once per site and cached."""
+        with self.listing_lock:
+            if site not in self.listing_cache:
+                self.listing_cache[site] = self._render_listing(site).encode('utf-8')
+            return self.listing_cache[site]
+
+    def _render_listing(self, site):
+        style = SITE_STYLES[site]
+        parts = [f'<!DOCTYPE html>\n<html lang="en">\n<head><meta charset="utf-8"><title>{style["event"]} - Sessions</title></head>\n<body>\n']
+        if site == 'asco':
+            parts.append('<main>\n  <h1>Scheduled Sessions</h1>\n  <div class="session-list">\n')
+            for number in range(1, self.sessions + 1):
+                parts.append(f'    <div class="session-card card"><a href="session-{number}.html"><h4>Session {number}</h4></a></div>\n')
+            parts.append('  </div>\n</main>\n')
+        else:
+            parts.append('<div id="content">\n  <h1>Sessions</h1>\n  <ul id="results">\n')
+            for number in range(1, self.sessions + 1):
+                parts.append(f'    <li><a href="session-{number}.html">Session {number}</a></li>\n')
+            parts.append('  </ul>\n</div>\n')
+        parts.append('</body>\n</html>\n')
+        return ''.join(parts)
+
+    def render_session(self, site, number):
+        """Renders the detail page of session number in the site's shape."""
+        style = SITE_STYLES[site]
+        session = self.session(number)
+        day = style['first_day'] + datetime.timedelta(days=session['day'] % style['days'])
+        date_text = style['date_format'].format(weekday=day.strftime('%A'), day=day.day, month=day.strftime('%B'), year=day.year)
+        dash = '–' if site == 'asco' else '-'
+        escape = html.escape
+
+        parts = [
+            f'<!DOCTYPE html>\n<html lang="en">\n<head><meta charset="utf-8"><title>{escape(session["title"])}</title></head>\n<body>\n<main>\n',
+            f'  <h3 _ngcontent-serverapp-c253="">{escape(session["title"])}</h3>\n',
+            f'  <p data-cy="type"><span><span>{session["type"]}</span></span></p>\n',
+            f'  <span _ngcontent-serverapp-c131="">{session["type"]}</span>\n',
+            f'  <p data-cy="meeting"><span><span>{style["event"]}</span></span></p>\n',
+            f'  <p data-cy="time"><span>{date_text} {_clock(session["start"])} {dash} {_clock(session["end"])}{style["time_zone"]}</span></p>\n',
+            f'  <p data-cy="location">{session["location"]}</p>\n',
+        ]
+        if session['track']:
+            parts.append(f'  <p data-cy="tracks">{escape(session["track"])}</p>\n')
+        if session['chairs']:
+            # Rendered with DOM calls like the Angular site; an HTML parser cannot nest <h5> in <p>
+            parts.append('  <div class="row">\n    <div class="col">\n      <p data-cy="chairs"></p>\n      <template id="chairs">\n')
+            for name, institution in session['chairs']:
+                parts.append(f'        <h5 class="m-0 p-0 text-14">{escape(name)}</h5>\n'
+                             f'        <p class="m-0 p-0 text-12 ng-star-inserted">{escape(institution)}</p>\n')
+            parts.append("      </template>\n      <script>document.querySelector('[data-cy=\"chairs\"]')"
+                         ".append(document.getElementById('chairs').content.cloneNode(true));</script>\n    </div>\n  </div>\n")
+        if session['presentations']:
+            parts.append('  <div id="talks">\n')
+            for presentation in session['presentations']:
+                parts.append(f'    <div id="presentation-{presentation["number"]}" class="presentation">\n'
+                             f'      <div class="presentation-time small ng-star-inserted">{_clock(presentation["start"])} {dash} '
+                             f'{_clock(presentation["end"])}{style["time_zone"]}</div>\n'
+                             f'      <h6 class="my-2">{escape(presentation["title"])}</h6>\n')
+                for author in presentation['authors']:
+                    parts.append(f'      <h5 class="m-0 p-0 text-14">{escape(author)}</h5>\n')
+                if presentation['authors']:
+                    for institution in presentation['institutions']:
+                        parts.append(f'      <p class="m-0 p-0 text-12 ng-star-inserted">{escape(institution)}</p>\n')
+                parts.append(f'      <a href="/abstracts/{presentation["number"]}">Abstract {presentation["number"]}</a>\n    </div>\n')
+            parts.append('  </div>\n')
+        parts.append('</main>\n</body>\n</html>\n')
+        return ''.join(parts)
+
+    def write(self, root, sites=('asco', 'aacr')):
+        """
+        Writes the rendered site to disk as <root>/<site>/index.html and session-<n>.html.
+
+        Returns:
+        int: Number of files written.
+        """
+        written = 0
+        for site in sites:
+            os.makedirs(os.path.join(root, site), exist_ok=True)
+            with open(os.path.join(root, site, 'index.html'), 'wb') as f:
+                f.write(self.render_listing(site))
+            for number in range(1, self.sessions + 1):
+                with open(os.path.join(root, site, f'session-{number}.html'), 'w', encoding='utf-8') as f:
+                    f.write(self.render_session(site, number))
+            written += self.sessions + 1
+        return written
+
+
+class SyntheticConferenceHandler(BaseHTTPRequestHandler):
+    """Serves the pages of the server's SyntheticConference (server.conference)."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        with self.server.request_count_lock:
+            self.server.request_count += 1
+
+        path = self.path.split('?', 1)[0]
+        conference = self.server.conference
+        listing = LISTING_PATH.match(path)
+        session = SESSION_PATH.match(path)
+        if listing:
+            body = conference.render_listing(listing.group(1))
+        elif session and 1 <= int(session.group(2)) <= conference.sessions:
+            body = conference.render_session(session.group(1), int(session.group(2))).encode('utf-8')
+        else:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve_conference(conference, host='127.0.0.1', port=0):
+    """
+    Serves a SyntheticConference over HTTP from a daemon thread.
+
+    Returns:
+    tuple: (server, base URL without trailing slash), as fixture_server.start_server. The listing pages are
+           <base URL>/asco/index.html and <base URL>/aacr/index.html.
+    """
+    server, base_url = start_server(SyntheticConferenceHandler, host, port)
+    server.conference = conference
+    return server, base_url
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve or write a synthetic conference site.")
+    parser.add_argument("--sessions", type=int, default=1000, help="Number of sessions (default: 1000).")
+    parser.add_argument("--seed", type=int, default=7, help="Program seed (default: 7).")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port to serve on (default: {DEFAULT_PORT}).")
+    parser.add_argument("--write", metavar="DIR", help="Write the pages to DIR instead of serving them.")
+    args = parser.parse_args()
+
+    conference = SyntheticConference(args.sessions, args.seed)
+    if args.write:
+        print(f"{conference.write(args.write)} pages written to {args.write}")
+        return
+
+    server, base_url = serve_conference(conference, port=args.port)
+    print(f"Serving {args.sessions} synthetic sessions at {base_url}/asco/ and {base_url}/aacr/ - Ctrl+C to stop")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,35 @@
 # Define URLs and XPaths for scraping
 WEBSITE_CONFIG = {
     'asco': {
-        'sleep_duration': 5,  # Sleep duration in seconds between actions
+        'sleep_duration': 5,  # Fixed sleep the readiness waits replace; only used to report the time saved
+        'wait_strategy': ['angular', 'selector'],  # Readiness waits: 'document', 'angular', 'network_idle', 'dom_quiet', 'selector'
+        'wait_timeout': 20,  # Maximum seconds a readiness wait may take
+        'wait_poll_interval': 0.1,  # Seconds between readiness checks
+        'wait_quiet_period': 0.5,  # Seconds without network/DOM activity for 'network_idle' and 'dom_quiet'
+        'page_time_budget': 30,  # Seconds all field waits on one session page may take together (None for no limit)
+        'absent_selector_timeout': 1.0,  # Seconds to check for a field that was absent on an earlier page of the same session type
+        'pool_size': 4,  # Number of parallel WebDriver workers
+        'extraction_mode': 'live',  # 'live' (one WebDriver call per element), 'snapshot' (one execute_script per page) or 'page_source' (lxml over one DOM transfer)
+        'driver_profile': 'headless',  # 'headless', or 'lean' to skip images, fonts, stylesheets, media and analytics
+        'resource_rules': None,  # Resource rules for the 'lean' profile; None uses s2iWebKit.LEAN_RESOURCE_RULES
+        'profile_template': None,  # Chrome profile template dir (e.g. s2iWebKit.PROFILE_TEMPLATE_DIR) whose HTTP cache every worker clones; None starts cold
         'url': 'https://meetings.asco.org/meetings/2024-asco-annual-meeting/316/program-guide/scheduled-sessions',  # URL to scrape
         'url1': 'https://www.abstractsonline.com/pp8/#!/20272/sessions/@sessiontype=Poster%20Session/1',  # URL to scrape
+        'conference': None,  # Conference name for the Parquet output partitions; None uses each row's Event Type
+        'normalize_times': False,  # Opt-in (or --normalize-times): after the scrape, add UTC start/end, duration and overlap columns and sort the output by time
+        'default_timezone': None,  # Time zone assumed for rows without one when normalizing, e.g. 'CDT'
+        'metrics_path': None,  # Opt-in (or --metrics): stage latency/timeout/progress metrics file, JSON or Prometheus text (.prom), e.g. 'AACO.metrics.json'
+        'metrics_interval': 30,  # Seconds between metrics exports during a run
+        'trace_commands': False,  # Trace every WebDriver command and log the chattiest callers (also S2I_TRACE_COMMANDS=1)
+        'trace_path': None,  # JSON Lines file of every traced command; setting it enables tracing
+        'session_retry_budget': 6,  # Retries (navigation, clicks) one session may spend in total; None for no limit
+        'circuit_failure_threshold': 5,  # Consecutive site failures (navigation timeouts, network errors) that pause all workers
+        'circuit_cooldown': 30,  # Seconds the workers pause the first time; doubles while the site keeps failing
         'findelements': '//*[contains(concat( " ", @class, " " ), concat( " ", "session-card", " " ))]',  # XPath to find session cards
         'findelementss': "//ul[@id='results']//li",  # XPath to find session cards
+        'session_link': './/a[@href]',  # Card-relative XPath of the link to the session detail page
+        'session_id_attribute': None,  # Attribute holding the session ID when cards have no link, used with session_url_template
+        'session_url_template': None,  # e.g. 'https://meetings.asco.org/.../session/{id}'
         'title_element': '//h3[@_ngcontent-serverapp-c253]',  # XPath for session titles
         'session_authors_xpath': "//div[@class='col']/p[@data-cy='chairs']//h5[@class='m-0 p-0 text-14']",  # XPath for session authors
         'session_authors_affiliations_xpath': "//div[@class='col']/p[@data-cy='chairs']//p[@class='m-0 p-0 text-12 ng-star-inserted']",  # XPath for session authors' affiliations
@@ -20,9 +44,11 @@ WEBSITE_CONFIG = {
         'presentation_title': ".//h6[@class='my-2']",  # XPath for presentation titles
         'presentation_affiliations': ".//p[@class='m-0 p-0 text-12 ng-star-inserted']",  # XPath for presentation affiliations
         'presentation_authors': ".//h5[@class='m-0 p-0 text-14']",  # XPath for presentation authors
-        'presentaion_section': "//div[contains(@id, 'presentation')]",  # XPath for presentation sections
-        'presentaiontime_xpath': "//div[@class='presentation-time small ng-star-inserted']",  # XPath for presentation times
+        'presentation_section': "//div[contains(@id, 'presentation')]",  # XPath for presentation sections
+        'presentationtime_xpath': "//div[@class='presentation-time small ng-star-inserted']",  # XPath for presentation times
         'presentation_link': "//div[contains(@id, 'presentation')]//a",  # XPath for presentation links
+        'presentation_section_time': ".//div[@class='presentation-time small ng-star-inserted']",  # Section-relative XPath for the presentation time
+        'presentation_section_link': './/a',  # Section-relative XPath for the presentation link
         'session_types': "//p[@data-cy='type']/span/span"  # XPath for session types
     }
 }
\ No newline at end of file
@@ -0,0 +1,10 @@
+# Register the conference configs with the s2iTurbokit config registry
+from s2iTurbokit.s2iConfig import register_config
+
+# Selectors the ASCO/AACR scraper cannot run without
+REQUIRED_SELECTOR_KEYS = ('findelements', 'title_element', 'dateandtime_element', 'presentation_section', 'presentation_title')
+
+register_config('asco', 's2iExtensions.Exelixis.ASCOconfig', 'asco', REQUIRED_SELECTOR_KEYS)
+register_config('aacr', 's2iExtensions.Exelixis.AACRConfig', 'asco', REQUIRED_SELECTOR_KEYS)
+
+DEFAULT_CONFERENCE = 'aacr'
@@ -1,4 +1,32 @@
 # Module2/__init__.py
 from .s2iHelperFunctions import getDomainName, getReturnArray, loadJSON, getPrompt, unpackDict2Str, checkPath
 
-from .s2iWebKit import initialize_webdriver, scrape_url, find_elements, click_element_multiple_retries
+import importlib
+
+# Public names loaded on first use, so importing the package for a helper does not pull in
+# selenium, webdriver_manager, pdfkit, pypdf, bs4 and requests through s2iWebKit
+LAZY_ATTRIBUTES = {
+    'initialize_webdriver': 's2iWebKit',
+    'scrape_url': 's2iWebKit',
+    'find_elements': 's2iWebKit',
+    'click_element_multiple_retries': 's2iWebKit',
+}
+
+LAZY_SUBMODULES = ('s2iWebKit', 's2iConfig', 's2iJournal', 's2iMetrics', 's2iProfile', 's2iTrace', 's2iWriters')
+
+__all__ = ['getDomainName', 'getReturnArray', 'loadJSON', 'getPrompt', 'unpackDict2Str', 'checkPath'] + list(LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name in LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(f".{LAZY_ATTRIBUTES[name]}", __name__), name)
+    elif name in LAZY_SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_ATTRIBUTES) | set(LAZY_SUBMODULES))
@@ -0,0 +1,170 @@
+##### s2iTurbokit site config registry module
+#
+# Site configs are plain dicts of settings and XPath selectors kept in extension modules. The registry
+# imports each one once, checks every selector's syntax and compiles it into a Locator, so a typo in a
+# key or an XPath fails at startup instead of costing a timeout on every page.
+
+from .s2iHelperFunctions import getReturnArray
+from .s2iWebKit import snapshot_xpaths
+from selenium.webdriver.common.by import By
+from collections import namedtuple
+import difflib
+import importlib
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# A precompiled selector: Selenium locator (by, value), whether it is relative to a section or card
+# ('.//...'), and the lxml XPath evaluator used for page_source snapshots.
+Locator = namedtuple('Locator', ['key', 'by', 'value', 'relative', 'compiled'])
+
+# Config name -> {'module', 'key', 'required_keys'}
+CONFIG_REGISTRY = {}
+
+# Config name -> {'settings', 'locators'}, filled by load_config
+LOADED_CONFIGS = {}
+LOADED_CONFIGS_LOCK = threading.Lock()
+
+
+def register_config(name, module, key, required_keys=()):
+    """
+    Registers a site config kept as WEBSITE_CONFIG[key] in an extension module. The module is imported on first load.
+
+    Args:
+    name (str): Name the config is loaded by (e.g. 'asco').
+    module (str): Dotted module path (e.g. 's2iExtensions.Exelixis.ASCOconfig').
+    key (str): Key of the config inside the module's WEBSITE_CONFIG.
+    required_keys (list): Selector keys the scraper cannot run without.
+    """
+    CONFIG_REGISTRY[name] = {'module': module, 'key': key, 'required_keys': tuple(required_keys)}
+    with LOADED_CONFIGS_LOCK:
+        LOADED_CONFIGS.pop(name, None)
+
+
+def is_selector(value):
+    """
+    Tells whether a config value is an XPath selector rather than a setting or URL.
+    """
+    return isinstance(value, str) and value.lstrip().startswith(('/', '.', '('))
+
+
+def compile_locators(settings):
+    """
+    Checks the syntax of every XPath selector in a config and compiles it.
+
+    Args:
+    settings (dict): Site config.
+
+    Returns:
+    tuple: (dict of key -> Locator, list of error messages).
+    """
+    from lxml import etree
+
+    locators = {}
+    errors = []
+    for key, value in settings.items():
+        if not is_selector(value):
+            continue
+        try:
+            locators[key] = Locator(key, By.XPATH, value, value.lstrip().startswith('.'), etree.XPath(value))
+        except etree.XPathSyntaxError as e:
+            errors.append(f"'{key}': invalid XPath {value!r} ({e})")
+    return locators, errors
+
+
+def validate_config(settings, required_keys=()):
+    """
+    Validates a site config: every selector must compile and every required key must be present.
+
+    Missing keys are reported with the closest existing key, which catches typos such as 'presentaion_section'.
+
+    Args:
+    settings (dict): Site config.
+    required_keys (list): Selector keys that must be present.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (dict of key -> Locator).
+    """
+    locators, errors = compile_locators(settings)
+    for key in required_keys:
+        if settings.get(key):
+            continue
+        close = difflib.get_close_matches(key, settings.keys(), n=1, cutoff=0.8)
+        errors.append(f"'{key}': missing" + (f" (did you mean '{close[0]}'?)" if close else ""))
+
+    if errors:
+        return getReturnArray(False, "Invalid config: " + "; ".join(errors), [])
+    return getReturnArray(True, f"{len(locators)} selectors compiled", locators)
+
+
+def load_config(name, refresh=False):
+    """
+    Loads, validates and compiles a registered site config. The result is cached for the process.
+
+    Args:
+    name (str): Registered config name.
+    refresh (bool): Re-import and re-validate the config. Default is False.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (dictionary with
+          'settings' (the config dict) and 'locators' (dict of key -> Locator)).
+    """
+    if name not in CONFIG_REGISTRY:
+        return getReturnArray(False, f"Unknown config '{name}'. Registered: {', '.join(CONFIG_REGISTRY)}", None)
+
+    with LOADED_CONFIGS_LOCK:
+        if name in LOADED_CONFIGS and not refresh:
+            return getReturnArray(True, f"Config '{name}' loaded", LOADED_CONFIGS[name])
+
+        entry = CONFIG_REGISTRY[name]
+        try:
+            module = importlib.import_module(entry['module'])
+            if refresh:
+                module = importlib.reload(module)
+            settings = module.WEBSITE_CONFIG[entry['key']]
+        except Exception as e:
+            return getReturnArray(False, f"Error loading config '{name}' from {entry['module']}: {str(e)}", None)
+
+        validation_result = validate_config(settings, entry['required_keys'])
+        if not validation_result["status"]:
+            return getReturnArray(False, f"Config '{name}': {validation_result['message']}", None)
+
+        LOADED_CONFIGS[name] = {'settings': settings, 'locators': validation_result["data"][0]}
+        return getReturnArray(True, f"Config '{name}' loaded: {validation_result['message']}", LOADED_CONFIGS[name])
+
+
+def check_locators(driver, locators, section_locator=None):
+    """
+    Counts the matches of many locators on the current page with a single execute_script round-trip.
+
+    Document-level locators are evaluated on the page, relative locators inside every element of section_locator.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance.
+    locators (list): Locators to check.
+    section_locator (Locator): Locator of the sections or cards the relative locators are evaluated in.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (list of dictionaries with
+          'key', 'value', 'count' and 'error', in the order of locators).
+    """
+    document_xpaths = [locator.value for locator in locators if not locator.relative]
+    relative_xpaths = [locator.value for locator in locators if locator.relative] if section_locator else []
+
+    snapshot_result = snapshot_xpaths(driver, document_xpaths, section_locator.value if section_locator else None, relative_xpaths)
+    if not snapshot_result["status"]:
+        return getReturnArray(False, snapshot_result["message"], [])
+    snapshot = snapshot_result["data"][0]
+    errors = snapshot.get("errors") or {}
+
+    checks = []
+    for locator in locators:
+        if locator.relative:
+            count = sum(len(section.get(locator.value, [])) for section in snapshot.get("sections") or [])
+            error = errors.get(locator.value) or (None if section_locator else "No section locator to evaluate it in")
+        else:
+            count = len(snapshot["xpaths"].get(locator.value) or [])
+            error = errors.get(locator.value)
+        checks.append({'key': locator.key, 'value': locator.value, 'count': count, 'error': error})
+    return getReturnArray(True, f"Checked {len(checks)} selectors", checks)
@@ -0,0 +1,151 @@
+##### s2iTurbokit checkpoint journal module
+#
+# An append-only JSON Lines journal of finished tasks. Every entry is flushed and fsynced before
+# append() returns, so a crash, a killed browser or a Ctrl-C loses at most the task in progress.
+# A resumed run loads the journal and skips every task that already has a successful entry.
+
+from .s2iHelperFunctions import getReturnArray, checkPath
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def journal_task_key(task):
+    """
+    Returns the key a task is recorded under, e.g. a session card index or URL.
+
+    Args:
+    task: A JSON-serializable task.
+
+    Returns:
+    str: Stable key for the task.
+    """
+    return json.dumps(task, sort_keys=True, default=str)
+
+
+def load_journal(journal_path):
+    """
+    Loads the entries of a checkpoint journal.
+
+    A partially written last line (the process died mid-write) is skipped. When a task has several
+    entries, the last one wins.
+
+    Args:
+    journal_path (str): Path of the journal file.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (dict mapping
+          journal_task_key(task) to the entry dictionary with 'task', 'status', 'data' and 'time').
+    """
+    entries = {}
+    if not os.path.exists(journal_path):
+        return getReturnArray(True, f"No journal at {journal_path}", entries)
+
+    try:
+        skipped = 0
+        with open(journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    skipped += 1
+                    continue
+                entries[journal_task_key(entry['task'])] = entry
+
+        message = f"Loaded {len(entries)} journal entries from {journal_path}"
+        if skipped:
+            message += f" ({skipped} damaged lines skipped)"
+        return getReturnArray(True, message, entries)
+    except Exception as e:
+        return getReturnArray(False, f"Error loading journal {journal_path}: {str(e)}", {})
+
+
+def get_finished_tasks(entries):
+    """
+    Returns the journal entries of tasks that finished successfully.
+
+    Args:
+    entries (dict): Entries returned by load_journal.
+
+    Returns:
+    dict: Mapping of journal_task_key(task) to the task's recorded data.
+    """
+    return {key: entry['data'] for key, entry in entries.items() if entry.get('status')}
+
+
+class CheckpointJournal:
+    """
+    Append-only, crash-safe journal of finished tasks. Safe to share between worker threads.
+
+    Args:
+    journal_path (str): Path of the journal file. Existing entries are kept and appended to.
+    """
+
+    def __init__(self, journal_path):
+        self.journal_path = journal_path
+        self.lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(journal_path))
+        checkPath(directory)
+        self._drop_partial_line()
+        self.file = open(journal_path, 'a', encoding='utf-8')
+
+    def _drop_partial_line(self):
+        """Truncates a last line left unterminated by a crash so new entries start on their own line."""
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, 'rb+') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size == 0:
+                return
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) == b'\n':
+                return
+
+            # Walk back to the last complete line
+            position = size
+            while position > 0:
+                step = min(4096, position)
+                position -= step
+                f.seek(position)
+                newline = f.read(step).rfind(b'\n')
+                if newline != -1:
+                    position += newline + 1
+                    break
+            logger.warning(f"Dropping a partially written entry at the end of {self.journal_path}")
+            f.truncate(position)
+
+    def append(self, task, status, data):
+        """
+        Appends one task's outcome and forces it to disk.
+
+        Args:
+        task: The task, e.g. a session card index or URL.
+        status (bool): Whether the task finished successfully. Only successful tasks are skipped on resume.
+        data: JSON-serializable result data, e.g. the session's rows.
+
+        Returns:
+        dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (None).
+        """
+        try:
+            line = json.dumps({'task': task, 'status': status, 'data': data, 'time': time.time()}, default=str)
+            with self.lock:
+                self.file.write(line + '\n')
+                self.file.flush()
+                os.fsync(self.file.fileno())
+            return getReturnArray(True, "", None)
+        except Exception as e:
+            return getReturnArray(False, f"Error writing journal entry for task {task}: {str(e)}", None)
+
+    def close(self):
+        """Closes the journal file."""
+        with self.lock:
+            if not self.file.closed:
+                self.file.close()
@@ -0,0 +1,295 @@
+##### s2iTurbokit metrics module
+#
+# Process-wide latency histograms, counters and run progress for the scrape pipeline. Stages record into
+# the module-level registry (observe, increment, the timed_function decorator); export_metrics writes it as
+# JSON or Prometheus text format, and PeriodicMetricsExporter does so in the background during a run.
+
+from .s2iHelperFunctions import getReturnArray, checkPath
+import functools
+import json
+import logging
+import math
+import os
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is +Inf
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# (name, labels) -> histogram / counter; labels are a sorted tuple of (key, value) pairs
+HISTOGRAMS = {}
+COUNTERS = {}
+PROGRESS = {"total": None, "done": 0, "failed": 0, "started": None}
+METRICS_LOCK = threading.Lock()
+
+
+def _label_key(labels):
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def observe(name, seconds, **labels):
+    """
+    Records one latency observation in a histogram.
+
+    Args:
+    name (str): Histogram name, e.g. 'stage_seconds'.
+    seconds (float): Observed latency.
+    **labels: Label values, e.g. stage='navigation'.
+    """
+    key = (name, _label_key(labels))
+    with METRICS_LOCK:
+        histogram = HISTOGRAMS.get(key)
+        if histogram is None:
+            histogram = HISTOGRAMS[key] = {"buckets": [0] * (len(LATENCY_BUCKETS) + 1), "count": 0, "sum": 0.0, "max": 0.0}
+        index = next((i for i, bound in enumerate(LATENCY_BUCKETS) if seconds <= bound), len(LATENCY_BUCKETS))
+        histogram["buckets"][index] += 1
+        histogram["count"] += 1
+        histogram["sum"] += seconds
+        histogram["max"] = max(histogram["max"], seconds)
+
+
+def increment(name, amount=1, **labels):
+    """
+    Adds to a counter.
+
+    Args:
+    name (str): Counter name, e.g. 'field_timeouts_total'.
+    amount (float): Amount to add. Default is 1.
+    **labels: Label values, e.g. field='disease'.
+    """
+    key = (name, _label_key(labels))
+    with METRICS_LOCK:
+        COUNTERS[key] = COUNTERS.get(key, 0) + amount
+
+
+def timed_function(stage):
+    """
+    Decorator recording the duration of every call in 'stage_seconds' with the stage and function name.
+    Calls returning a getReturnArray dictionary with status False are counted in 'stage_failures_total'.
+
+    Args:
+    stage (str): Stage name, e.g. 'navigation', 'click', 'extract'.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.monotonic()
+            result = function(*args, **kwargs)
+            observe('stage_seconds', time.monotonic() - start, stage=stage, function=function.__name__)
+            if isinstance(result, dict) and result.get("status") is False:
+                increment('stage_failures_total', stage=stage, function=function.__name__)
+            return result
+        return wrapper
+    return decorator
+
+
+def start_progress(total):
+    """
+    Starts tracking run progress.
+
+    Args:
+    total (int): Number of sessions the run will process, or None if unknown.
+    """
+    with METRICS_LOCK:
+        PROGRESS.update(total=total, done=0, failed=0, started=time.monotonic())
+
+
+def record_progress(success=True):
+    """
+    Records one processed session.
+
+    Args:
+    success (bool): Whether the session was extracted. Default is True.
+    """
+    with METRICS_LOCK:
+        PROGRESS["done"] += 1
+        if not success:
+            PROGRESS["failed"] += 1
+
+
+def get_progress():
+    """
+    Summarizes run progress.
+
+    Returns:
+    dict: Dictionary with 'total', 'done', 'failed', 'elapsed' (seconds), 'per_minute' (sessions per minute)
+          and 'eta' (seconds until all sessions are done at the current rate, None if unknown).
+    """
+    with METRICS_LOCK:
+        progress = dict(PROGRESS)
+    elapsed = time.monotonic() - progress.pop("started") if progress["started"] is not None else 0.0
+    per_minute = progress["done"] / elapsed * 60 if elapsed > 0 else 0.0
+    eta = None
+    if progress["total"] is not None and per_minute > 0:
+        eta = max(0, progress["total"] - progress["done"]) / per_minute * 60
+    return dict(progress, elapsed=elapsed, per_minute=per_minute, eta=eta)
+
+
+def get_metrics():
+    """
+    Returns a snapshot of all metrics.
+
+    Returns:
+    dict: Dictionary with 'histograms' and 'counters' (lists of dictionaries with 'name', 'labels' and values;
+          histograms carry cumulative 'buckets' keyed by upper bound, 'count', 'sum', 'mean' and 'max')
+          and 'progress' (see get_progress).
+    """
+    with METRICS_LOCK:
+        histograms = [(name, labels, dict(histogram, buckets=list(histogram["buckets"])))
+                      for (name, labels), histogram in HISTOGRAMS.items()]
+        counters = [(name, labels, value) for (name, labels), value in COUNTERS.items()]
+
+    histogram_list = []
+    for name, labels, histogram in sorted(histograms):
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(LATENCY_BUCKETS + (math.inf,), histogram["buckets"]):
+            cumulative += count
+            buckets['+Inf' if bound == math.inf else repr(bound)] = cumulative
+        histogram_list.append({"name": name, "labels": dict(labels), "buckets": buckets, "count": histogram["count"],
+                               "sum": histogram["sum"], "max": histogram["max"],
+                               "mean": histogram["sum"] / histogram["count"] if histogram["count"] else 0.0})
+
+    return {
+        "histograms": histogram_list,
+        "counters": [{"name": name, "labels": dict(labels), "value": value} for name, labels, value in sorted(counters)],
+        "progress": get_progress(),
+    }
+
+
+def reset_metrics():
+    """
+    Clears all histograms, counters and progress.
+    """
+    with METRICS_LOCK:
+        HISTOGRAMS.clear()
+        COUNTERS.clear()
+        PROGRESS.update(total=None, done=0, failed=0, started=None)
+
+
+def _prometheus_labels(labels, extra=None):
+    items = list(labels.items()) + list((extra or {}).items())
+    if not items:
+        return ''
+    escaped = (f'{key}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"' for key, value in items)
+    return '{' + ','.join(escaped) + '}'
+
+
+def format_prometheus(metrics, prefix='s2i_'):
+    """
+    Formats a get_metrics snapshot in the Prometheus text exposition format.
+
+    Args:
+    metrics (dict): Snapshot from get_metrics.
+    prefix (str): Prefix of every metric name. Default is 's2i_'.
+
+    Returns:
+    str: Prometheus text format.
+    """
+    lines = []
+    declared = set()
+    for histogram in metrics["histograms"]:
+        name = prefix + histogram["name"]
+        if name not in declared:
+            lines.append(f"# TYPE {name} histogram")
+            declared.add(name)
+        for bound, count in histogram["buckets"].items():
+            lines.append(f"{name}_bucket{_prometheus_labels(histogram['labels'], {'le': bound})} {count}")
+        lines.append(f"{name}_sum{_prometheus_labels(histogram['labels'])} {histogram['sum']}")
+        lines.append(f"{name}_count{_prometheus_labels(histogram['labels'])} {histogram['count']}")
+    for counter in metrics["counters"]:
+        name = prefix + counter["name"]
+        if name not in declared:
+            lines.append(f"# TYPE {name} counter")
+            declared.add(name)
+        lines.append(f"{name}{_prometheus_labels(counter['labels'])} {counter['value']}")
+
+    progress = metrics["progress"]
+    for key in ('total', 'done', 'failed', 'per_minute', 'eta'):
+        if progress[key] is not None:
+            lines.append(f"# TYPE {prefix}sessions_{key} gauge")
+            lines.append(f"{prefix}sessions_{key} {progress[key]}")
+    return '\n'.join(lines) + '\n'
+
+
+def export_metrics(path, output_format=None):
+    """
+    Writes all metrics to a file, replacing it atomically so readers never see a partial file.
+
+    Args:
+    path (str): Output file path.
+    output_format (str): 'json' or 'prometheus'. Default is 'prometheus' for .prom and .txt paths, 'json' otherwise.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (the exported metrics dictionary).
+    """
+    output_format = output_format or ('prometheus' if path.lower().endswith(('.prom', '.txt')) else 'json')
+    try:
+        metrics = get_metrics()
+        content = format_prometheus(metrics) if output_format == 'prometheus' else json.dumps(metrics, indent=2, default=str)
+
+        directory = os.path.dirname(os.path.abspath(path))
+        checkPath(directory)
+        handle, temp_path = tempfile.mkstemp(dir=directory, prefix='.metrics-')
+        with os.fdopen(handle, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+        return getReturnArray(True, f"Metrics written to {path}", metrics)
+    except Exception as e:
+        return getReturnArray(False, f"Error writing metrics to {path}: {str(e)}", None)
+
+
+def format_progress(progress=None):
+    """
+    Formats run progress as one log line, e.g. '120/900 sessions (3 failed), 41.2/min, ETA 18m56s'.
+    """
+    progress = progress or get_progress()
+    total = progress["total"] if progress["total"] is not None else '?'
+    eta = f"{int(progress['eta'] // 60)}m{int(progress['eta'] % 60):02d}s" if progress["eta"] is not None else 'unknown'
+    return f"{progress['done']}/{total} sessions ({progress['failed']} failed), {progress['per_minute']:.1f}/min, ETA {eta}"
+
+
+class PeriodicMetricsExporter:
+    """
+    Exports the metrics to a file every interval seconds from a daemon thread, and logs the run progress.
+
+    Args:
+    path (str): Output file path, see export_metrics.
+    interval (float): Seconds between exports. Default is 30.
+    output_format (str): 'json' or 'prometheus'. Default follows the file extension.
+    """
+
+    def __init__(self, path, interval=30, output_format=None):
+        self.path = path
+        self.interval = interval
+        self.output_format = output_format
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="metrics-exporter", daemon=True)
+
+    def start(self):
+        """Starts the background exports."""
+        self.thread.start()
+        return self
+
+    def _run(self):
+        while not self.stopped.wait(self.interval):
+            self.export()
+
+    def export(self):
+        """Exports the metrics now and logs the progress."""
+        result = export_metrics(self.path, self.output_format)
+        if result["status"]:
+            logger.info(f"Progress: {format_progress(result['data'][0]['progress'])}")
+        else:
+            logger.warning(result["message"])
+        return result
+
+    def stop(self):
+        """Stops the background exports and writes the final metrics."""
+        self.stopped.set()
+        if self.thread.is_alive():
+            self.thread.join()
+        return self.export()
@@ -0,0 +1,272 @@
+##### s2iTurbokit profiling module
+#
+# Runs a scrape under a profiler without editing it. 'cprofile' mode is deterministic and writes a pstats
+# file, with one cProfile per thread (the WebDriver workers run on their own threads) merged at the end.
+# 'sampling' mode samples the stacks of every thread from a background thread and writes collapsed stacks
+# (one 'frame;frame;frame count' line per stack, the input of flamegraph.pl and speedscope). Either mode can
+# add a wall-clock breakdown that tells time blocked on chromedriver apart from Python time spent parsing,
+# in pandas, and elsewhere.
+
+from .s2iHelperFunctions import getReturnArray, checkPath
+from collections import Counter
+import cProfile
+import json
+import logging
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ('cprofile', 'sampling')
+
+# S2I_PROFILE=cprofile|sampling profiles a run; S2I_PROFILE_PATH sets the output file and
+# S2I_PROFILE_BREAKDOWN=1 adds the wall-clock breakdown
+PROFILE_ENV_VAR = 'S2I_PROFILE'
+PROFILE_PATH_ENV_VAR = 'S2I_PROFILE_PATH'
+PROFILE_BREAKDOWN_ENV_VAR = 'S2I_PROFILE_BREAKDOWN'
+
+DEFAULT_PROFILE_DIR = 'profiles'
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+# Wall-clock breakdown: a stack inside the HTTP client is blocked on chromedriver; a thread whose innermost frame
+# is a wait or sleep is waiting; otherwise the stack is Python time, split by the libraries on it
+CHROMEDRIVER_MODULES = ('selenium.webdriver.remote.remote_connection', 'urllib3', 'http.client', 'socket')
+WAITING_MODULES = ('selenium.webdriver.support.wait', 'threading', 'queue', 'concurrent.futures')
+WAITING_FUNCTIONS = ('wait_for_page_ready', 'wait_until_present', 'wait_for_element', 'sleep')
+PANDAS_MODULES = ('pandas', 'pyarrow', 'openpyxl', 'numpy')
+PARSING_MODULES = ('lxml', 'bs4', 'dateutil', 'html', 're')
+
+
+def get_profile_settings():
+    """
+    Reads the profiling switch from the environment.
+
+    Returns:
+    dict: Dictionary with 'mode' (None, 'cprofile' or 'sampling'), 'path' and 'breakdown' (bool).
+    """
+    mode = os.environ.get(PROFILE_ENV_VAR, '').strip().lower() or None
+    if mode in ('1', 'true', 'yes'):
+        mode = 'sampling'
+    return {
+        'mode': mode,
+        'path': os.environ.get(PROFILE_PATH_ENV_VAR) or None,
+        'breakdown': os.environ.get(PROFILE_BREAKDOWN_ENV_VAR, '') not in ('', '0'),
+    }
+
+
+def default_profile_path(name, mode, directory=DEFAULT_PROFILE_DIR):
+    """
+    Returns a per-run profile path, e.g. 'profiles/ASCO_AACR-20240601-142500.prof'.
+
+    Args:
+    name (str): Run name.
+    mode (str): 'cprofile' (.prof) or 'sampling' (.folded).
+    directory (str): Output directory. Default is 'profiles'.
+    """
+    extension = '.prof' if mode == 'cprofile' else '.folded'
+    return os.path.join(directory, f"{name}-{time.strftime('%Y%m%d-%H%M%S')}{extension}")
+
+
+def _thread_group(name):
+    # webdriver-worker-3 -> webdriver-worker, so the workers' stacks are merged
+    return re.sub(r'[-_]\d+$', '', name)
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    module = frame.f_globals.get('__name__', '?')
+    return f"{module.rsplit('.', 1)[-1]}:{code.co_name}"
+
+
+def _in_modules(module, prefixes):
+    return any(module == prefix or module.startswith(prefix + '.') for prefix in prefixes)
+
+
+def classify_stack(frames):
+    """
+    Assigns a sampled stack to a wall-clock breakdown category. Sleeps are only recognized in the wait helpers
+    and Selenium's WebDriverWait; a time.sleep elsewhere is counted as 'python'.
+
+    Args:
+    frames (list): Frames of the stack, innermost first.
+
+    Returns:
+    str: 'chromedriver', 'waiting', 'pandas', 'parsing' or 'python'.
+    """
+    modules = [frame.f_globals.get('__name__', '') for frame in frames]
+    if any(_in_modules(module, CHROMEDRIVER_MODULES) for module in modules):
+        return 'chromedriver'
+    if frames and (_in_modules(modules[0], WAITING_MODULES) or frames[0].f_code.co_name in WAITING_FUNCTIONS):
+        return 'waiting'
+    if any(_in_modules(module, PANDAS_MODULES) for module in modules):
+        return 'pandas'
+    if any(_in_modules(module, PARSING_MODULES) or frame.f_code.co_name.startswith('parse_') for module, frame in zip(modules, frames)):
+        return 'parsing'
+    return 'python'
+
+
+class StackSampler:
+    """
+    Samples the stacks of all threads every interval seconds from a daemon thread.
+
+    Args:
+    interval (float): Seconds between samples. Default is 0.005.
+    collect_stacks (bool): Count collapsed stacks for a flame graph. Default is True.
+    """
+
+    def __init__(self, interval=DEFAULT_SAMPLE_INTERVAL, collect_stacks=True):
+        self.interval = interval
+        self.collect_stacks = collect_stacks
+        self.stacks = Counter()
+        self.seconds = Counter()
+        self.samples = 0
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self):
+        """Starts sampling."""
+        self.thread.start()
+        return self
+
+    def _run(self):
+        own_id = threading.get_ident()
+        last = time.perf_counter()
+        while not self.stopped.wait(self.interval):
+            # Each sample stands for the time since the previous one, which is longer than interval under load
+            now = time.perf_counter()
+            elapsed, last = now - last, now
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                frames = []
+                while frame is not None:
+                    frames.append(frame)
+                    frame = frame.f_back
+                group = _thread_group(names.get(thread_id, 'thread'))
+                self.seconds[(group, classify_stack(frames))] += elapsed
+                if self.collect_stacks:
+                    self.stacks[';'.join([group] + [_frame_label(f) for f in reversed(frames)])] += 1
+            self.samples += 1
+
+    def stop(self):
+        """Stops sampling."""
+        self.stopped.set()
+        if self.thread.is_alive():
+            self.thread.join()
+
+    def write_collapsed(self, path):
+        """Writes the collapsed stacks, one 'frame;frame;frame count' line per stack."""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def breakdown(self):
+        """
+        Returns the sampled wall-clock time per thread group and category, in thread-seconds.
+        """
+        breakdown = {}
+        for (group, category), seconds in self.seconds.items():
+            breakdown.setdefault(group, {})[category] = seconds
+        return breakdown
+
+
+class RunProfiler:
+    """
+    Profiles everything that runs between start() and stop(), on all threads.
+
+    Args:
+    mode (str): 'cprofile' (pstats file) or 'sampling' (collapsed stacks).
+    path (str): Output file. The breakdown, if any, is written next to it as <path>.breakdown.json.
+    breakdown (bool): Also sample a wall-clock breakdown (always available in 'sampling' mode). Default is False.
+    interval (float): Sampling interval in seconds. Default is 0.005.
+    """
+
+    def __init__(self, mode, path, breakdown=False, interval=DEFAULT_SAMPLE_INTERVAL):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode '{mode}', expected one of {', '.join(PROFILE_MODES)}")
+        self.mode = mode
+        self.path = path
+        self.breakdown = breakdown or mode == 'sampling'
+        self.interval = interval
+        self.profiles = []
+        self.profiles_lock = threading.Lock()
+        self.sampler = None
+        self.started = None
+
+    def _profile_thread(self, frame, event, arg):
+        # Installed with threading.setprofile: the first event of every new thread swaps in its own cProfile
+        sys.setprofile(None)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            logger.warning(f"Thread {threading.current_thread().name} not profiled: {e}")
+            return
+        with self.profiles_lock:
+            self.profiles.append(profile)
+
+    def start(self):
+        """Starts profiling."""
+        self.started = (time.perf_counter(), time.process_time())
+        if self.mode == 'cprofile':
+            threading.setprofile(self._profile_thread)
+            profile = cProfile.Profile()
+            profile.enable()
+            self.profiles.append(profile)
+        if self.breakdown:
+            self.sampler = StackSampler(self.interval, collect_stacks=self.mode == 'sampling').start()
+        return self
+
+    def stop(self):
+        """
+        Stops profiling and writes the profile.
+
+        Returns:
+        dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (dictionary with 'path',
+              'wall_seconds', 'cpu_seconds' and 'breakdown' (thread group -> category -> thread-seconds, or None)).
+        """
+        wall_seconds = time.perf_counter() - self.started[0]
+        cpu_seconds = time.process_time() - self.started[1]
+        if self.mode == 'cprofile':
+            threading.setprofile(None)
+            self.profiles[0].disable()
+        if self.sampler:
+            self.sampler.stop()
+
+        try:
+            checkPath(os.path.dirname(os.path.abspath(self.path)))
+            if self.mode == 'cprofile':
+                with self.profiles_lock:
+                    stats = pstats.Stats(*self.profiles)
+                stats.dump_stats(self.path)
+            else:
+                self.sampler.write_collapsed(self.path)
+
+            breakdown = self.sampler.breakdown() if self.sampler else None
+            if breakdown is not None:
+                with open(f"{self.path}.breakdown.json", 'w', encoding='utf-8') as f:
+                    json.dump({'wall_seconds': wall_seconds, 'cpu_seconds': cpu_seconds, 'breakdown': breakdown}, f, indent=2)
+        except Exception as e:
+            return getReturnArray(False, f"Error writing profile {self.path}: {str(e)}", None)
+
+        return getReturnArray(True, f"Profile written to {self.path} ({wall_seconds:.1f}s wall, {cpu_seconds:.1f}s CPU)",
+                              {'path': self.path, 'wall_seconds': wall_seconds, 'cpu_seconds': cpu_seconds, 'breakdown': breakdown})
+
+
+def format_breakdown(breakdown):
+    """
+    Formats a wall-clock breakdown as one line per thread group,
+    e.g. 'webdriver-worker: chromedriver 61% (122.0s), waiting 22% (44.1s), parsing 9% (18.2s), ...'.
+    """
+    lines = []
+    for group, categories in sorted(breakdown.items()):
+        total = sum(categories.values()) or 1.0
+        parts = ', '.join(f"{category} {seconds / total:.0%} ({seconds:.1f}s)"
+                          for category, seconds in sorted(categories.items(), key=lambda item: -item[1]))
+        lines.append(f"{group}: {parts}")
+    return lines
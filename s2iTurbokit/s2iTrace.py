@@ -0,0 +1,208 @@
+##### s2iTurbokit WebDriver command tracing module
+#
+# Every WebDriver call (find_element, .text, get_attribute, execute_script, ...) is one HTTP round-trip to
+# chromedriver, and those round-trips dominate the scrape time. trace_driver wraps a driver's execute so each
+# command is timed and attributed to the code that issued it; the summary counts commands per session and
+# per calling function, which shows the chattiest extractors. Tracing is opt-in (enable_command_tracing or
+# the S2I_TRACE_COMMANDS environment variable) and costs a stack walk per command.
+
+from .s2iHelperFunctions import getReturnArray, checkPath
+from .s2iMetrics import observe
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Set to anything but '' or '0' to trace every driver the factories return
+TRACE_ENV_VAR = 'S2I_TRACE_COMMANDS'
+
+COMMAND_TRACE = {"enabled": False, "log_path": None, "log_file": None}
+
+# command -> {count, seconds}; caller -> {count, seconds, commands}; session -> {count, seconds, commands}
+TRACE_SUMMARY = {"commands": {}, "callers": {}, "sessions": {}}
+TRACE_LOCK = threading.Lock()
+
+# Modules whose frames are skipped when looking for the function that issued a command
+LIBRARY_MODULE_PREFIXES = ('selenium.', 's2iTurbokit.', 'urllib3.', 'functools', 'contextlib')
+
+# Selenium runs get_attribute, is_displayed, ... as execute_script calls tagged with a comment
+SCRIPT_ATOM_PATTERN = re.compile(r'\s*/\*\s*(\w+)\s*\*/')
+
+NO_SESSION = '<no session>'
+
+
+def enable_command_tracing(log_path=None, enabled=True):
+    """
+    Turns command tracing on or off for the drivers create_webdriver returns from now on.
+
+    Args:
+    log_path (str): Optional JSON Lines file receiving one record per command
+                    (session, command, seconds, error, site, caller). Default is None (summary only).
+    enabled (bool): Whether to trace. Default is True.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (None).
+    """
+    with TRACE_LOCK:
+        if COMMAND_TRACE["log_file"]:
+            COMMAND_TRACE["log_file"].close()
+        COMMAND_TRACE.update(enabled=enabled, log_path=None, log_file=None)
+        if enabled and log_path:
+            try:
+                checkPath(os.path.dirname(os.path.abspath(log_path)))
+                COMMAND_TRACE.update(log_path=log_path, log_file=open(log_path, 'a', encoding='utf-8'))
+            except Exception as e:
+                return getReturnArray(False, f"Error opening command trace {log_path}: {str(e)}", None)
+    state = "enabled" if enabled else "disabled"
+    return getReturnArray(True, f"WebDriver command tracing {state}" + (f", logging to {log_path}" if enabled and log_path else ""), None)
+
+
+def is_tracing_enabled():
+    """
+    Tells whether new drivers should be traced, by enable_command_tracing or the S2I_TRACE_COMMANDS environment variable.
+    """
+    return COMMAND_TRACE["enabled"] or os.environ.get(TRACE_ENV_VAR, '') not in ('', '0')
+
+
+def trace_driver(driver):
+    """
+    Wraps a WebDriver's execute so every command is timed and recorded. Element commands go through the
+    driver's execute as well, so they are traced too. Wrapping a driver twice has no effect.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance.
+
+    Returns:
+    WebDriver: The same driver.
+    """
+    if getattr(driver, 's2i_traced', False):
+        return driver
+    execute = driver.execute
+
+    def traced_execute(driver_command, params=None):
+        start = time.perf_counter()
+        error = None
+        try:
+            return execute(driver_command, params)
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            record_command(driver, driver_command, params, time.perf_counter() - start, error)
+
+    driver.execute = traced_execute
+    driver.s2i_traced = True
+    return driver
+
+
+def set_trace_session(driver, session):
+    """
+    Attributes the driver's following commands to a session (e.g. the session URL being scraped).
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance.
+    session (str): Session label, or None to stop attributing.
+    """
+    if driver is not None:
+        driver.s2i_trace_session = session
+
+
+def _command_name(driver_command, params):
+    if params and isinstance(params.get('script'), str):
+        match = SCRIPT_ATOM_PATTERN.match(params['script'])
+        if match:
+            return match.group(1)
+    return driver_command
+
+
+def _calling_frames(frame):
+    """
+    Returns (site, caller): the innermost frame outside Selenium and this module as 'function (file:line)',
+    and the innermost function outside the library modules, i.e. the extractor or task that issued the command.
+    """
+    site = caller = None
+    while frame is not None and caller is None:
+        module = frame.f_globals.get('__name__', '')
+        if not module.startswith('selenium.') and module != __name__:
+            code = frame.f_code
+            if site is None:
+                site = f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+            if not module.startswith(LIBRARY_MODULE_PREFIXES):
+                caller = f"{module.rsplit('.', 1)[-1]}.{code.co_name}"
+        frame = frame.f_back
+    return site or '<unknown>', caller or '<unknown>'
+
+
+def _add(summary, key, seconds, command=None):
+    entry = summary.get(key)
+    if entry is None:
+        entry = summary[key] = {"count": 0, "seconds": 0.0, "commands": {}}
+    entry["count"] += 1
+    entry["seconds"] += seconds
+    if command is not None:
+        entry["commands"][command] = entry["commands"].get(command, 0) + 1
+
+
+def record_command(driver, driver_command, params, seconds, error=None):
+    """
+    Records one traced WebDriver command.
+
+    Args:
+    driver (WebDriver): Driver the command was sent by.
+    driver_command (str): Selenium command name (e.g. 'findElement').
+    params (dict): Command parameters.
+    seconds (float): Round-trip duration.
+    error (str): Exception type name if the command failed.
+    """
+    command = _command_name(driver_command, params)
+    site, caller = _calling_frames(sys._getframe(2))
+    session = getattr(driver, 's2i_trace_session', None) or NO_SESSION
+
+    observe('webdriver_command_seconds', seconds, command=command)
+    logger.debug(f"{command} {seconds * 1000:.1f}ms {site}" + (f" [{error}]" if error else ""))
+    with TRACE_LOCK:
+        _add(TRACE_SUMMARY["commands"], command, seconds)
+        _add(TRACE_SUMMARY["callers"], caller, seconds, command)
+        _add(TRACE_SUMMARY["sessions"], session, seconds, command)
+        if COMMAND_TRACE["log_file"]:
+            COMMAND_TRACE["log_file"].write(json.dumps({"time": time.time(), "session": session, "command": command,
+                                                        "seconds": round(seconds, 6), "error": error,
+                                                        "site": site, "caller": caller}) + '\n')
+
+
+def get_command_trace_summary():
+    """
+    Summarizes the traced commands.
+
+    Returns:
+    dict: Dictionary with 'total' (commands), 'seconds' (total round-trip time), and 'commands', 'callers'
+          and 'sessions' (dictionaries of name -> {'count', 'seconds', 'mean', 'commands'}, most commands first;
+          'commands' of a caller or session counts its commands by name).
+    """
+    with TRACE_LOCK:
+        snapshot = {part: {key: dict(entry, commands=dict(entry["commands"])) for key, entry in entries.items()}
+                    for part, entries in TRACE_SUMMARY.items()}
+        if COMMAND_TRACE["log_file"]:
+            COMMAND_TRACE["log_file"].flush()
+
+    summary = {}
+    for part, entries in snapshot.items():
+        ordered = sorted(entries.items(), key=lambda item: item[1]["count"], reverse=True)
+        summary[part] = {key: dict(entry, mean=entry["seconds"] / entry["count"]) for key, entry in ordered}
+    summary["total"] = sum(entry["count"] for entry in snapshot["commands"].values())
+    summary["seconds"] = sum(entry["seconds"] for entry in snapshot["commands"].values())
+    return summary
+
+
+def reset_command_trace():
+    """
+    Clears the traced command summary.
+    """
+    with TRACE_LOCK:
+        for entries in TRACE_SUMMARY.values():
+            entries.clear()
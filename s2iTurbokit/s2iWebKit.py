@@ -1,6 +1,8 @@
 ##### s2iTurbokit Web module
 
 from .s2iHelperFunctions import getDomainName, getReturnArray, loadJSON, getPrompt, unpackDict2Str, checkPath
+from .s2iMetrics import observe, increment, timed_function
+from .s2iTrace import is_tracing_enabled, trace_driver
 from bs4 import BeautifulSoup
 from pypdf import PdfWriter
 from selenium import webdriver
@@ -9,17 +11,29 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException, TimeoutException, ElementNotInteractableException
+from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException, TimeoutException, ElementNotInteractableException, WebDriverException
 import re
 import pdfkit
 import re
 import requests
 import os
 import time  # Add this line to import the time module
+import fnmatch
+import functools
+import json
+import shutil
+import subprocess
+import tempfile
+import queue
+import random
+import threading
+from urllib.parse import urljoin
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.action_chains import ActionChains
 import logging
 
+logger = logging.getLogger(__name__)
+
 # Convert a web-page to PDF
 def convertWebpageToPDF(webURL):
     """
@@ -150,28 +164,17 @@ def setup_driver():
             'message' will contain an error message if setup failed.
             'data' will contain the WebDriver instance if setup was successful, otherwise None.
     """
-    try:
-        returnArray = getReturnArray(True, "", None)
-
-        options = Options()
-        options.add_argument('--headless')  # Run in headless mode
-        service = ChromeService(executable_path='path/to/chromedriver')  # Replace with actual path
-        driver = webdriver.Chrome(service=service, options=options)
-
-        returnArray["data"] = driver
-
-    except Exception as e:
-        returnArray = getReturnArray(False, str(e), None)
-
-    return returnArray
+    return create_webdriver('headless')
 
 # Close the Selenium WebDriver
-def close_driver(driver):
+def close_driver(driver, promote_profile=False):
     """
     Close the provided WebDriver instance.
 
     Args:
     - driver (WebDriver): The Selenium WebDriver instance to be closed.
+    - promote_profile (bool): If the driver runs on a clone of a profile template, make the clone
+                              (with its warm HTTP cache) the new template instead of deleting it.
 
     Returns:
     - dict: Dictionary containing 'status' (bool), 'message' (str), and 'data' (None).
@@ -187,12 +190,23 @@ def close_driver(driver):
     except Exception as e:
         returnArray = getReturnArray(False, str(e), None)
 
+    profile_dir = getattr(driver, 's2i_profile_dir', None)
+    if profile_dir:
+        if promote_profile:
+            profile_result = promote_profile_clone(profile_dir, driver.s2i_profile_template)
+        else:
+            profile_result = remove_profile_clone(profile_dir)
+        if not profile_result["status"]:
+            logger.warning(profile_result["message"])
+
     return returnArray
 
 
+@timed_function('navigation')
 def navigate_to_url(driver, url):
     """
     Navigate to the specified URL using the provided WebDriver instance.
+    Errors of a failing site are retried with backoff and counted by the domain's circuit breaker (see run_with_retries).
 
     Args:
     - driver (WebDriver): The Selenium WebDriver instance.
@@ -205,7 +219,8 @@ def navigate_to_url(driver, url):
             'data' will always be None.
     """
     try:
-        driver.get(url)
+        driver.s2i_domain = getDomainName(url)
+        run_with_retries(driver, 'navigation', lambda: driver.get(url))
         return getReturnArray(True, "", None)
     
     except Exception as e:
@@ -246,6 +261,508 @@ def wait_for_element(driver, by, value, timeout=10):
     return returnArray
 
 
+# JavaScript readiness probes used by wait_for_page_ready. Each returns true once the page is ready.
+ANGULAR_STABLE_SCRIPT = """
+if (document.readyState !== 'complete') { return false; }
+if (window.getAllAngularTestabilities) {
+    return window.getAllAngularTestabilities().every(function (t) { return t.isStable(); });
+}
+if (window.angular) {
+    var root = document.querySelector('[ng-app],[data-ng-app]') || document.body;
+    var injector = window.angular.element(root).injector();
+    return !injector || injector.get('$http').pendingRequests.length === 0;
+}
+return true;
+"""
+
+DOM_QUIET_SCRIPT = """
+if (!window.__s2iLastMutation) {
+    window.__s2iLastMutation = Date.now();
+    new MutationObserver(function () { window.__s2iLastMutation = Date.now(); })
+        .observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+return document.readyState === 'complete' && Date.now() - window.__s2iLastMutation >= arguments[0];
+"""
+
+RESOURCE_COUNT_SCRIPT = "return document.readyState === 'complete' ? performance.getEntriesByType('resource').length : -1;"
+
+WAIT_STRATEGIES = ('document', 'angular', 'network_idle', 'dom_quiet', 'selector')
+
+# Per-label wait statistics recorded by wait_for_page_ready
+WAIT_TIMINGS = {}
+WAIT_TIMINGS_LOCK = threading.Lock()
+
+
+def _readiness_probe(strategy, xpath, quiet_period):
+    """Builds a WebDriverWait condition for one readiness strategy."""
+    if strategy == 'document':
+        return lambda driver: driver.execute_script("return document.readyState === 'complete';")
+    if strategy == 'angular':
+        return lambda driver: driver.execute_script(ANGULAR_STABLE_SCRIPT)
+    if strategy == 'dom_quiet':
+        return lambda driver: driver.execute_script(DOM_QUIET_SCRIPT, int(quiet_period * 1000))
+    if strategy == 'selector':
+        if not xpath:
+            raise ValueError("The 'selector' wait strategy needs an XPath")
+        return lambda driver: len(driver.find_elements(By.XPATH, xpath)) > 0
+    if strategy == 'network_idle':
+        state = {"count": None, "since": None}
+
+        def network_idle(driver):
+            count = driver.execute_script(RESOURCE_COUNT_SCRIPT)
+            now = time.monotonic()
+            if count < 0 or count != state["count"]:
+                state["count"], state["since"] = count, now
+                return False
+            return now - state["since"] >= quiet_period
+
+        return network_idle
+    raise ValueError(f"Unknown wait strategy '{strategy}'. Valid values: {', '.join(WAIT_STRATEGIES)}")
+
+
+def record_wait_timing(label, elapsed, timeout, ready, fixed_sleep=None, short_check=False):
+    """
+    Records how long a readiness wait took.
+
+    Args:
+    label (str): Name the wait is reported under (e.g. 'session_page').
+    elapsed (float): Seconds the wait actually took.
+    timeout (float): Timeout of the wait in seconds.
+    ready (bool): Whether the page became ready before the timeout.
+    fixed_sleep (float): Fixed sleep in seconds this wait replaces, if any.
+    short_check (bool): Whether the wait was shortened because its selector is known to be absent.
+    """
+    with WAIT_TIMINGS_LOCK:
+        timing = WAIT_TIMINGS.setdefault(label, {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0, "timeout_total": 0.0,
+                                                 "short_checks": 0, "fixed_sleep_total": 0.0})
+        timing["count"] += 1
+        timing["total"] += elapsed
+        timing["max"] = max(timing["max"], elapsed)
+        if not ready:
+            timing["timeouts"] += 1
+            timing["timeout_total"] += elapsed
+        if short_check:
+            timing["short_checks"] += 1
+        if fixed_sleep is not None:
+            timing["fixed_sleep_total"] += fixed_sleep
+
+    observe('wait_seconds', elapsed, label=label)
+    if not ready:
+        increment('wait_timeouts_total', label=label)
+        increment('wait_timeout_seconds_total', elapsed, label=label)
+
+
+def get_wait_timings():
+    """
+    Summarizes the readiness waits recorded so far.
+
+    Returns:
+    dict: Label -> dictionary with 'count', 'total', 'mean', 'max', 'timeouts', 'timeout_total' (seconds spent in
+          waits that timed out), 'short_checks', 'fixed_sleep_total' and 'saved' (seconds the replaced fixed sleeps would have cost on top of the actual waits).
+    """
+    with WAIT_TIMINGS_LOCK:
+        summary = {}
+        for label, timing in WAIT_TIMINGS.items():
+            summary[label] = dict(timing)
+            summary[label]["mean"] = timing["total"] / timing["count"] if timing["count"] else 0.0
+            summary[label]["saved"] = timing["fixed_sleep_total"] - timing["total"] if timing["fixed_sleep_total"] else 0.0
+        return summary
+
+
+def reset_wait_timings():
+    """
+    Clears the recorded readiness wait statistics.
+    """
+    with WAIT_TIMINGS_LOCK:
+        WAIT_TIMINGS.clear()
+
+
+def wait_for_page_ready(driver, strategy='document', timeout=10, poll_interval=0.1, xpath=None, quiet_period=0.5,
+                        label=None, fixed_sleep=None):
+    """
+    Waits until the page is ready and returns as soon as it is, instead of sleeping for a fixed time.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance.
+    strategy (str or list): Readiness strategy, or a list of strategies that must all be satisfied:
+                            'document' (readyState complete), 'angular' (Angular/AngularJS stable),
+                            'network_idle' (no new resource loads for quiet_period),
+                            'dom_quiet' (no DOM mutations for quiet_period), 'selector' (xpath present).
+    timeout (float): Maximum seconds to wait. Default is 10.
+    poll_interval (float): Seconds between readiness checks. Default is 0.1.
+    xpath (str): XPath for the 'selector' strategy, e.g. the field the extractor needs next.
+    quiet_period (float): Seconds without network or DOM activity for 'network_idle' and 'dom_quiet'. Default is 0.5.
+    label (str): Name the wait timing is recorded under. Default is the strategy.
+    fixed_sleep (float): Fixed sleep this wait replaces, recorded so get_wait_timings can report the time saved.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (seconds the wait took).
+    """
+    strategies = [strategy] if isinstance(strategy, str) else list(strategy)
+    label = label or '+'.join(strategies)
+    start = time.monotonic()
+
+    try:
+        probes = [_readiness_probe(name, xpath, quiet_period) for name in strategies]
+        WebDriverWait(driver, timeout, poll_frequency=poll_interval).until(lambda d: all(probe(d) for probe in probes))
+        returnArray = getReturnArray(True, f"Page ready ({label})", None)
+    except TimeoutException:
+        returnArray = getReturnArray(False, f"Timeout after {timeout}s waiting for page readiness ({label})", None)
+    except Exception as e:
+        returnArray = getReturnArray(False, f"Error while waiting for page readiness ({label}): {str(e)}", None)
+
+    elapsed = time.monotonic() - start
+    record_wait_timing(label, elapsed, timeout, returnArray["status"], fixed_sleep)
+    returnArray["data"] = [elapsed]
+    return returnArray
+
+
+
+# Short check used instead of a full wait for selectors known to be absent from a page layout
+DEFAULT_ABSENT_SELECTOR_TIMEOUT = 1.0
+
+# (layout, xpath) pairs whose last full wait timed out
+ABSENT_SELECTORS = set()
+ABSENT_SELECTORS_LOCK = threading.Lock()
+
+
+def start_page_budget(driver, seconds, layout=None, absent_timeout=DEFAULT_ABSENT_SELECTOR_TIMEOUT):
+    """
+    Starts a time budget shared by all field waits on the page the driver shows now.
+
+    wait_until_present never waits past the budget, so a page missing several fields costs at most
+    the budget instead of one full timeout per field.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance.
+    seconds (float): Total seconds the field waits on this page may take, or None for no limit.
+    layout (str): Name of the page layout the negative cache is keyed by (e.g. the session type). Default is None.
+    absent_timeout (float): Seconds to check for selectors known to be absent from the layout. Default is 1.0.
+    """
+    driver.s2i_page_budget = {
+        "deadline": time.monotonic() + seconds if seconds is not None else None,
+        "layout": layout,
+        "absent_timeout": absent_timeout,
+    }
+
+
+def set_page_layout(driver, layout):
+    """
+    Sets the layout name of the current page once it is known, e.g. after the session type was read.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance with a page budget.
+    layout (str): Page layout name.
+    """
+    budget = getattr(driver, 's2i_page_budget', None)
+    if budget is None:
+        start_page_budget(driver, None, layout)
+    else:
+        budget["layout"] = layout
+
+
+def get_page_budget_remaining(driver):
+    """
+    Returns the seconds left in the driver's page budget, or None if the page has no budget.
+    """
+    budget = getattr(driver, 's2i_page_budget', None)
+    if not budget or budget["deadline"] is None:
+        return None
+    return max(0.0, budget["deadline"] - time.monotonic())
+
+
+def reset_absent_selectors():
+    """
+    Clears the negative cache of absent selectors.
+    """
+    with ABSENT_SELECTORS_LOCK:
+        ABSENT_SELECTORS.clear()
+
+
+def wait_until_present(driver, xpath, timeout=10, label=None):
+    """
+    Waits for the elements located by an XPath within the page budget, as a drop-in for
+    WebDriverWait(driver, timeout).until(EC.presence_of_all_elements_located((By.XPATH, xpath))).
+
+    The wait is cut to the time left in the page budget (see start_page_budget). A selector whose full wait
+    timed out is remembered as absent for the page layout and only gets a short check on later pages of that
+    layout, until it is found again. Every wait is recorded in the wait timings under 'field:<label>'.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance.
+    xpath (str): XPath of the elements to wait for.
+    timeout (float): Full timeout in seconds. Default is 10.
+    label (str): Name the wait timing is recorded under. Default is the XPath.
+
+    Returns:
+    list: The located WebElements.
+
+    Raises:
+    TimeoutException: If no element is present within the (possibly shortened) timeout.
+    """
+    budget = getattr(driver, 's2i_page_budget', None) or {}
+    key = (budget.get("layout"), xpath)
+    with ABSENT_SELECTORS_LOCK:
+        known_absent = key in ABSENT_SELECTORS
+
+    wait_timeout = min(timeout, budget.get("absent_timeout", DEFAULT_ABSENT_SELECTOR_TIMEOUT)) if known_absent else timeout
+    remaining = get_page_budget_remaining(driver)
+    if remaining is not None:
+        wait_timeout = min(wait_timeout, remaining)
+
+    start = time.monotonic()
+    try:
+        elements = WebDriverWait(driver, wait_timeout, poll_frequency=0.1).until(EC.presence_of_all_elements_located((By.XPATH, xpath)))
+    except TimeoutException:
+        record_wait_timing(f"field:{label or xpath}", time.monotonic() - start, wait_timeout, False, short_check=known_absent)
+        # Only a full wait proves the selector absent; one cut short by the budget does not
+        if wait_timeout >= timeout:
+            with ABSENT_SELECTORS_LOCK:
+                ABSENT_SELECTORS.add(key)
+        raise
+
+    record_wait_timing(f"field:{label or xpath}", time.monotonic() - start, wait_timeout, True, short_check=known_absent)
+    if known_absent:
+        with ABSENT_SELECTORS_LOCK:
+            ABSENT_SELECTORS.discard(key)
+    return elements
+
+
+# Retry policy: exponential backoff with jitter, a retry budget per session, and a circuit breaker per domain
+
+# Errors of a site that is slow or down (and of the network in between) rather than of one page's state
+# Transport-level failures only: a Selenium TimeoutException from an element wait that ran out is not one of them
+NETWORK_ERROR_PATTERN = re.compile(r'net::ERR_|ReadTimeout|ConnectTimeout|connection (refused|reset|aborted|timed out)|'
+                                   r'Failed to establish a new connection|Max retries exceeded')
+
+# Page-state errors that usually clear up when retried after a short pause
+TRANSIENT_EXCEPTIONS = (ElementClickInterceptedException, ElementNotInteractableException, TimeoutException)
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with jitter: retry n (0-based) waits up to base_delay * multiplier**n seconds, capped at
+    max_delay, of which a random fraction of up to jitter is taken off so that workers do not retry in lockstep.
+
+    Args:
+    max_attempts (int): Attempts including the first one. Default is 3.
+    base_delay (float): Delay before the first retry in seconds. Default is 0.5.
+    max_delay (float): Longest delay in seconds. Default is 10.
+    multiplier (float): Delay growth per retry. Default is 2.
+    jitter (float): Largest fraction of the delay removed at random, 0 to 1. Default is 0.5.
+    """
+
+    def __init__(self, max_attempts=3, base_delay=0.5, max_delay=10.0, multiplier=2.0, jitter=0.5):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+    def delay(self, retry):
+        """Returns the seconds to wait before retry number retry (0-based)."""
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** retry)
+        return delay * (1 - self.jitter * random.random())
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+def classify_exception(error, operation=None):
+    """
+    Classifies an exception for the retry policy.
+
+    Args:
+    error (Exception): The exception raised by the operation.
+    operation (str): Operation name; a timeout of a 'navigation' means the site did not respond.
+
+    Returns:
+    str: 'site' (site or network failing; retryable and counted by the domain's circuit breaker),
+         'transient' (page state, e.g. an overlay intercepting a click; retryable) or 'fatal' (not retryable).
+    """
+    if isinstance(error, TimeoutException):
+        return 'site' if operation == 'navigation' else 'transient'
+    if isinstance(error, TRANSIENT_EXCEPTIONS):
+        return 'transient'
+    # Chrome reports network errors inside WebDriverException messages (net::ERR_TIMED_OUT, ...); a stalled
+    # chromedriver connection raises urllib3 or socket errors (ReadTimeoutError, ConnectionResetError, ...)
+    transport = isinstance(error, (WebDriverException, ConnectionError)) or type(error).__module__.startswith('urllib3')
+    if transport and NETWORK_ERROR_PATTERN.search(f"{type(error).__name__}: {error}"):
+        return 'site'
+    return 'fatal'
+
+
+def start_retry_budget(driver, retries):
+    """
+    Starts a retry budget shared by all operations of the session the driver works on now.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance.
+    retries (int): Retries the session may spend in total, or None for no limit.
+    """
+    driver.s2i_retry_budget = retries
+
+
+def _consume_retry(driver):
+    budget = getattr(driver, 's2i_retry_budget', None)
+    if budget is None:
+        return True
+    if budget <= 0:
+        return False
+    driver.s2i_retry_budget = budget - 1
+    return True
+
+
+# Defaults of the circuit breakers created by get_circuit_breaker
+CIRCUIT_BREAKER_SETTINGS = {"failure_threshold": 5, "cooldown": 30.0, "max_cooldown": 300.0}
+
+# Domain -> CircuitBreaker
+CIRCUIT_BREAKERS = {}
+CIRCUIT_BREAKERS_LOCK = threading.Lock()
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker shared by all workers scraping one domain.
+
+    After failure_threshold site failures in a row the circuit opens: every worker calling wait() pauses
+    until the cooldown has passed, instead of each one running into its own timeouts. The first failure
+    after a cooldown opens it again with a doubled cooldown (up to max_cooldown); a success closes it.
+
+    Args:
+    domain (str): Domain the breaker guards.
+    failure_threshold (int): Consecutive site failures that open the circuit. Default is 5.
+    cooldown (float): Seconds the circuit stays open the first time. Default is 30.
+    max_cooldown (float): Longest cooldown in seconds. Default is 300.
+    """
+
+    def __init__(self, domain, failure_threshold=5, cooldown=30.0, max_cooldown=300.0):
+        self.domain = domain
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.failures = 0
+        self.trips = 0
+        self.open_until = 0.0
+        self.next_cooldown = cooldown
+        self.paused_seconds = 0.0
+        self.lock = threading.Lock()
+
+    def is_open(self):
+        """Tells whether the circuit is open, i.e. workers should pause."""
+        with self.lock:
+            return time.monotonic() < self.open_until
+
+    def wait(self):
+        """Pauses until the circuit is no longer open. Returns the seconds waited."""
+        waited = 0.0
+        while True:
+            # The state is read under the lock, but the sleep happens outside it so the other workers can check it too
+            with self.lock:
+                remaining = self.open_until - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(remaining)
+            waited += remaining
+        if waited:
+            with self.lock:
+                self.paused_seconds += waited
+            observe('circuit_wait_seconds', waited, domain=self.domain)
+        return waited
+
+    def record_success(self):
+        """Closes the circuit."""
+        with self.lock:
+            self.failures = 0
+            self.next_cooldown = self.cooldown
+
+    def record_failure(self):
+        """Counts a site failure and opens the circuit at the threshold."""
+        with self.lock:
+            self.failures += 1
+            if self.failures < self.failure_threshold or time.monotonic() < self.open_until:
+                return
+            self.open_until = time.monotonic() + self.next_cooldown
+            self.trips += 1
+            logger.warning(f"Circuit for {self.domain} open after {self.failures} failures, pausing all workers for {self.next_cooldown:.1f}s")
+            increment('circuit_trips_total', domain=self.domain)
+            self.next_cooldown = min(self.max_cooldown, self.next_cooldown * 2)
+            # Half-open: one more failure after the cooldown opens the circuit again
+            self.failures = self.failure_threshold - 1
+
+
+def configure_circuit_breakers(failure_threshold=None, cooldown=None, max_cooldown=None):
+    """
+    Sets the defaults of the circuit breakers and drops the existing ones.
+
+    Args:
+    failure_threshold (int): Consecutive site failures that open a circuit.
+    cooldown (float): Seconds a circuit stays open the first time.
+    max_cooldown (float): Longest cooldown in seconds.
+    """
+    settings = {"failure_threshold": failure_threshold, "cooldown": cooldown, "max_cooldown": max_cooldown}
+    with CIRCUIT_BREAKERS_LOCK:
+        CIRCUIT_BREAKER_SETTINGS.update({key: value for key, value in settings.items() if value is not None})
+        CIRCUIT_BREAKERS.clear()
+
+
+def get_circuit_breaker(domain):
+    """
+    Returns the circuit breaker of a domain, creating it on first use.
+
+    Args:
+    domain (str): Domain name, e.g. from getDomainName(url).
+    """
+    with CIRCUIT_BREAKERS_LOCK:
+        breaker = CIRCUIT_BREAKERS.get(domain)
+        if breaker is None:
+            breaker = CIRCUIT_BREAKERS[domain] = CircuitBreaker(domain, **CIRCUIT_BREAKER_SETTINGS)
+        return breaker
+
+
+def run_with_retries(driver, operation, action, policy=None, domain=None):
+    """
+    Runs action() with the retry policy: retryable errors are retried after a jittered exponential backoff
+    while the driver's session retry budget lasts, and the domain's circuit breaker pauses the call while open.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance.
+    operation (str): Operation name for the metrics and the exception classification (e.g. 'navigation', 'click').
+    action (callable): Called without arguments; its return value is returned.
+    policy (RetryPolicy): Retry policy. Default is DEFAULT_RETRY_POLICY.
+    domain (str): Domain whose circuit breaker guards the call. Default is the domain the driver last navigated to.
+
+    Returns:
+    The return value of action. The last exception is raised if no attempt succeeded.
+    """
+    policy = policy or DEFAULT_RETRY_POLICY
+    domain = domain or getattr(driver, 's2i_domain', None)
+    breaker = get_circuit_breaker(domain) if domain else None
+
+    for attempt in range(policy.max_attempts):
+        if breaker:
+            breaker.wait()
+        try:
+            result = action()
+        except Exception as e:
+            kind = classify_exception(e, operation)
+            if breaker and kind == 'site':
+                breaker.record_failure()
+            if kind == 'fatal' or attempt == policy.max_attempts - 1:
+                raise
+            if not _consume_retry(driver):
+                increment('retry_budget_exhausted_total', operation=operation)
+                raise
+            delay = policy.delay(attempt)
+            increment('retries_total', operation=operation, error=type(e).__name__)
+            observe('retry_backoff_seconds', delay, operation=operation)
+            logger.debug(f"Retrying {operation} in {delay:.2f}s after {type(e).__name__} (attempt {attempt + 1} of {policy.max_attempts})")
+            time.sleep(delay)
+            continue
+        if breaker:
+            breaker.record_success()
+        return result
+
 
 # Extract and return the text content of an element located by a specific method
 def extract_text(driver, by, value):
@@ -465,6 +982,39 @@ def handle_alert(driver, action='accept'):
     return returnArray
 
 
+def headless_chrome_options():
+    """
+    Builds the Chrome options used for headless scraping.
+
+    Returns:
+    Options: Chrome options for a headless browser.
+    """
+    # Set up Chrome options
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")  # Run headless
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920x1080")
+    chrome_options.add_argument("--start-maximized")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--proxy-server='direct://'")
+    chrome_options.add_argument("--proxy-bypass-list=*")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--ignore-certificate-errors")
+    chrome_options.add_argument("--allow-insecure-localhost")
+    chrome_options.add_argument("--disable-application-cache")
+    chrome_options.add_argument("--disable-browser-side-navigation")
+    chrome_options.add_argument("--disable-infobars")
+    chrome_options.add_argument("--disable-notifications")
+    chrome_options.add_argument("--disable-popup-blocking")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_argument("--disable-blink-features=BlockCredentialedSubresources")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36")
+    return chrome_options
+
+
 def chrome_headless():
     """
     Returns a headless Chrome browser instance.
@@ -472,73 +1022,590 @@ def chrome_headless():
     Returns:
     dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (headless Chrome WebDriver instance).
     """
-    returnArray = getReturnArray(True, "", None)  # Initialize return array
+    return create_webdriver('headless')
+
 
+
+def initialize_webdriver():
+    """
+    Initializes a WebDriver instance for Chrome and maximizes the window.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (initialized Chrome WebDriver instance with maximized window).
+    """
+    return create_webdriver('debug')
+
+
+# URL patterns (Network.setBlockedURLs syntax) for each blockable resource type
+RESOURCE_TYPE_PATTERNS = {
+    'image': ['.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.svg', '.ico', '.bmp'],
+    'font': ['.woff', '.woff2', '.ttf', '.otf', '.eot'],
+    'media': ['.mp4', '.webm', '.ogg', '.ogv', '.mp3', '.m3u8', '.mov'],
+    'stylesheet': ['.css'],
+}
+
+# Default resource rules of the lean driver profile.
+# - block_types: domain -> resource types to block; '*' applies to every domain.
+# - block_domains: domains (and their subdomains) whose requests are never resolved.
+# - allow_domains: if not empty, only these domains (and their subdomains) are resolved at all.
+LEAN_RESOURCE_RULES = {
+    'block_types': {'*': ['image', 'font', 'media', 'stylesheet']},
+    'block_domains': [
+        'google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'googlesyndication.com',
+        'facebook.net', 'hotjar.com', 'newrelic.com', 'nr-data.net', 'linkedin.com', 'twitter.com',
+        'youtube.com', 'vimeo.com', 'brightcove.net'
+    ],
+    'allow_domains': [],
+}
+
+
+def get_blocked_url_patterns(rules):
+    """
+    Translates resource rules into Network.setBlockedURLs patterns.
+
+    Args:
+    rules (dict): Resource rules shaped like LEAN_RESOURCE_RULES.
+
+    Returns:
+    list: URL patterns to block.
+    """
+    patterns = []
+    for domain, resource_types in rules.get('block_types', {}).items():
+        prefix = '*' if domain == '*' else f'*{domain}/*'
+        for resource_type in resource_types:
+            for extension in RESOURCE_TYPE_PATTERNS.get(resource_type, []):
+                patterns.append(f'{prefix}{extension}')
+                patterns.append(f'{prefix}{extension}?*')
+    return patterns
+
+
+def get_host_resolver_rules(rules):
+    """
+    Translates the domain allow and block lists of resource rules into a Chrome --host-resolver-rules value.
+
+    Args:
+    rules (dict): Resource rules shaped like LEAN_RESOURCE_RULES.
+
+    Returns:
+    str: Host resolver rules, or an empty string if no domain is blocked.
+    """
+    allow_domains = rules.get('allow_domains') or []
+    if allow_domains:
+        excludes = []
+        for domain in allow_domains:
+            excludes.extend([f'EXCLUDE {domain}', f'EXCLUDE *.{domain}'])
+        return ', '.join(['MAP * ~NOTFOUND'] + excludes)
+
+    mappings = []
+    for domain in rules.get('block_domains') or []:
+        mappings.extend([f'MAP {domain} ~NOTFOUND', f'MAP *.{domain} ~NOTFOUND'])
+    return ', '.join(mappings)
+
+
+def lean_chrome_options(rules=None):
+    """
+    Builds headless Chrome options that skip everything a text scraper does not need.
+
+    Images are disabled through Chrome preferences, blocked domains never resolve, and pages are
+    handed over as soon as the DOM is ready (the 'eager' page-load strategy).
+
+    Args:
+    rules (dict): Resource rules shaped like LEAN_RESOURCE_RULES. Default is LEAN_RESOURCE_RULES.
+
+    Returns:
+    Options: Chrome options for a lean headless browser.
+    """
+    rules = rules or LEAN_RESOURCE_RULES
+    chrome_options = headless_chrome_options()
+    chrome_options.page_load_strategy = 'eager'
+
+    if 'image' in rules.get('block_types', {}).get('*', []):
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+
+    host_resolver_rules = get_host_resolver_rules(rules)
+    if host_resolver_rules:
+        chrome_options.add_argument(f"--host-resolver-rules={host_resolver_rules}")
+
+    chrome_options.add_argument("--mute-audio")
+    chrome_options.add_argument("--autoplay-policy=user-gesture-required")
+    return chrome_options
+
+
+def apply_resource_blocking(driver, rules=None):
+    """
+    Blocks the resource types listed in the rules through DevTools request blocking.
+
+    Args:
+    driver (WebDriver): Chrome WebDriver instance.
+    rules (dict): Resource rules shaped like LEAN_RESOURCE_RULES. Default is LEAN_RESOURCE_RULES.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (list of blocked URL patterns).
+    """
     try:
-        # Set up Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")  # Run headless
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920x1080")
-        chrome_options.add_argument("--start-maximized")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--proxy-server='direct://'")
-        chrome_options.add_argument("--proxy-bypass-list=*")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--ignore-certificate-errors")
-        chrome_options.add_argument("--allow-insecure-localhost")
-        chrome_options.add_argument("--disable-application-cache")
-        chrome_options.add_argument("--disable-browser-side-navigation")
-        chrome_options.add_argument("--disable-infobars")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-popup-blocking")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("--disable-blink-features=BlockCredentialedSubresources")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36")
-
-        # Set up the WebDriver
-        driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=chrome_options)
-        returnArray["data"] = driver
+        patterns = get_blocked_url_patterns(rules or LEAN_RESOURCE_RULES)
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        return getReturnArray(True, f"Blocking {len(patterns)} URL patterns", patterns)
     except Exception as e:
-        returnArray =getReturnArray(False, f"Error setting up headless Chrome WebDriver: {str(e)}", None)
+        return getReturnArray(False, f"Error enabling resource blocking: {str(e)}", [])
 
-    return returnArray
 
+def chrome_lean(rules=None):
+    """
+    Returns a headless Chrome browser instance that does not load images, fonts, stylesheets,
+    media or analytics scripts.
+
+    Args:
+    rules (dict): Resource rules shaped like LEAN_RESOURCE_RULES. Default is LEAN_RESOURCE_RULES.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (lean headless Chrome WebDriver instance).
+    """
+    return create_webdriver('lean', rules)
 
 
-def initialize_webdriver():
+def debug_chrome_options(rules=None):
     """
-    Initializes a WebDriver instance for Chrome and maximizes the window.
+    Builds the Chrome options of the headful debug profile.
+
+    Args:
+    rules (dict): Unused; accepted so every profile's options builder has the same signature.
 
     Returns:
-    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (initialized Chrome WebDriver instance with maximized window).
+    Options: Chrome options for a visible browser window.
+    """
+    return Options()
+
+
+def _maximize_window(driver, rules=None):
+    """Maximizes the browser window after the debug profile starts."""
+    driver.maximize_window()
+
+
+def _apply_lean_blocking(driver, rules=None):
+    """Enables DevTools resource blocking after the lean profile starts."""
+    blocking_result = apply_resource_blocking(driver, rules)
+    if not blocking_result["status"]:
+        logger.warning(blocking_result["message"])
+
+
+# Named driver profiles used by create_webdriver. 'options' builds the Chrome options from the
+# resource rules; 'after_start' (optional) finishes configuring the started driver.
+DRIVER_PROFILES = {
+    'debug': {'options': debug_chrome_options, 'after_start': _maximize_window},
+    'headless': {'options': lambda rules=None: headless_chrome_options(), 'after_start': None},
+    'lean': {'options': lean_chrome_options, 'after_start': _apply_lean_blocking},
+}
+
+# chromedriver path resolved by ChromeDriverManager, shared across processes and runs
+DRIVER_PATH_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 's2iTurbokit', 'chromedriver_path.json')
+DRIVER_PATH_ENV = 'S2I_CHROMEDRIVER_PATH'
+DRIVER_PATH = None
+DRIVER_PATH_LOCK = threading.Lock()
+
+# Drivers started ahead of time by prespawn_webdrivers, keyed by profile and rules
+PRESPAWNED_DRIVERS = {}
+PRESPAWN_PENDING = {}
+PRESPAWN_LOCK = threading.Lock()
+
+
+def register_driver_profile(name, options_builder, after_start=None):
+    """
+    Registers a named driver profile for create_webdriver.
+
+    Args:
+    name (str): Profile name.
+    options_builder (callable): Called as options_builder(rules); returns Chrome Options.
+    after_start (callable): Optional after_start(driver, rules) run once the driver has started.
+    """
+    DRIVER_PROFILES[name] = {'options': options_builder, 'after_start': after_start}
+
+
+def get_chromedriver_path(refresh=False):
+    """
+    Returns the chromedriver path, resolving and downloading it at most once per machine.
+
+    The path is taken from the S2I_CHROMEDRIVER_PATH environment variable if set, otherwise from
+    this process's cache, otherwise from the on-disk cache shared by all processes and runs.
+    Only when none of these hold an existing executable is ChromeDriverManager consulted.
+
+    Args:
+    refresh (bool): Ignore the caches and resolve the driver again. Default is False.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (chromedriver path).
     """
+    global DRIVER_PATH
+
+    env_path = os.environ.get(DRIVER_PATH_ENV)
+    if env_path and not refresh:
+        return getReturnArray(True, f"chromedriver path from {DRIVER_PATH_ENV}", env_path)
+
+    with DRIVER_PATH_LOCK:
+        try:
+            if DRIVER_PATH and not refresh and os.access(DRIVER_PATH, os.X_OK):
+                return getReturnArray(True, "chromedriver path from process cache", DRIVER_PATH)
+
+            if not refresh and os.path.exists(DRIVER_PATH_CACHE_FILE):
+                try:
+                    cached_path = loadJSON(DRIVER_PATH_CACHE_FILE).get('path')
+                except (ValueError, OSError):
+                    cached_path = None
+                if cached_path and os.access(cached_path, os.X_OK):
+                    DRIVER_PATH = cached_path
+                    return getReturnArray(True, "chromedriver path from disk cache", DRIVER_PATH)
+
+            DRIVER_PATH = ChromeDriverManager().install()
+
+            # Write atomically so concurrent workers never read a half-written cache file
+            checkPath(os.path.dirname(DRIVER_PATH_CACHE_FILE))
+            temp_file = f"{DRIVER_PATH_CACHE_FILE}.{os.getpid()}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({'path': DRIVER_PATH, 'resolved_at': time.time()}, f)
+            os.replace(temp_file, DRIVER_PATH_CACHE_FILE)
+
+            return getReturnArray(True, "chromedriver path resolved by ChromeDriverManager", DRIVER_PATH)
+        except Exception as e:
+            return getReturnArray(False, f"Error resolving chromedriver path: {str(e)}", None)
+
+
+# Files Chrome uses to lock a running profile; they must not be copied into a clone
+PROFILE_LOCK_FILES = ('Singleton*', 'lockfile', 'LOCK', '*.tmp')
+
+# Default location of the shared profile template, see clone_profile_template
+PROFILE_TEMPLATE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 's2iTurbokit', 'chrome_profile')
+PROFILE_TEMPLATE_LOCK = threading.Lock()
+
+
+def _ignore_profile_locks(directory, names):
+    """shutil.copytree ignore callback that skips Chrome's profile lock files."""
+    return {name for name in names if any(fnmatch.fnmatch(name, pattern) for pattern in PROFILE_LOCK_FILES)}
+
+
+def clone_profile_template(template_dir=None):
+    """
+    Creates a private copy of a Chrome profile template for one WebDriver.
+
+    The clone is created next to the template with 'cp -a --reflink=auto', so on filesystems with
+    copy-on-write support (btrfs, XFS, APFS via clonefile) the HTTP cache is shared until Chrome
+    writes to it. Elsewhere, and where cp is unavailable, it falls back to a plain copy.
+    A template that does not exist yet is created empty; the first promoted clone warms it.
+
+    Args:
+    template_dir (str): Profile template directory. Default is PROFILE_TEMPLATE_DIR.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (clone directory).
+    """
+    template_dir = template_dir or PROFILE_TEMPLATE_DIR
+
+    try:
+        clones_dir = f"{template_dir}.clones"
+        checkPath(template_dir)
+        checkPath(clones_dir)
+        clone_dir = tempfile.mkdtemp(prefix='profile-', dir=clones_dir)
+
+        with PROFILE_TEMPLATE_LOCK:
+            copied = False
+            if shutil.which('cp'):
+                completed = subprocess.run(['cp', '-a', '--reflink=auto', f"{template_dir}/.", clone_dir],
+                                           capture_output=True, text=True)
+                copied = completed.returncode == 0
+            if not copied:
+                shutil.copytree(template_dir, clone_dir, ignore=_ignore_profile_locks, dirs_exist_ok=True)
+
+        # cp copies everything, so drop the lock files of a template that was promoted while in use
+        for root, dirs, files in os.walk(clone_dir):
+            for name in _ignore_profile_locks(root, files):
+                os.remove(os.path.join(root, name))
+
+        return getReturnArray(True, "", clone_dir)
+    except Exception as e:
+        return getReturnArray(False, f"Error cloning Chrome profile template: {str(e)}", None)
+
+
+def remove_profile_clone(clone_dir):
+    """
+    Deletes a profile clone created by clone_profile_template.
+
+    Args:
+    clone_dir (str): Clone directory.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (None).
+    """
+    try:
+        shutil.rmtree(clone_dir, ignore_errors=True)
+        return getReturnArray(True, "", None)
+    except Exception as e:
+        return getReturnArray(False, f"Error removing Chrome profile clone: {str(e)}", None)
+
+
+def promote_profile_clone(clone_dir, template_dir=None):
+    """
+    Replaces the profile template with a clone whose browser has exited, keeping its warm cache.
+
+    The clone lives next to the template, so the swap is two renames on the same filesystem.
+
+    Args:
+    clone_dir (str): Clone directory of a driver that has been quit.
+    template_dir (str): Profile template directory. Default is PROFILE_TEMPLATE_DIR.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (template directory).
+    """
+    template_dir = template_dir or PROFILE_TEMPLATE_DIR
+
+    try:
+        retired_dir = f"{clone_dir}.retired"
+        with PROFILE_TEMPLATE_LOCK:
+            if os.path.exists(template_dir):
+                os.rename(template_dir, retired_dir)
+            os.rename(clone_dir, template_dir)
+        shutil.rmtree(retired_dir, ignore_errors=True)
+        return getReturnArray(True, f"Promoted {clone_dir} to profile template", template_dir)
+    except Exception as e:
+        remove_profile_clone(clone_dir)
+        return getReturnArray(False, f"Error promoting Chrome profile clone: {str(e)}", None)
+
+
+def _prespawn_key(profile, rules, profile_template=None):
+    """Key of the prespawned driver queue for a profile, its rules and profile template."""
+    return (profile, json.dumps(rules, sort_keys=True, default=str), profile_template)
+
+
+def _start_webdriver(profile, rules=None, profile_template=None):
+    """Starts a new Chrome WebDriver for a profile. Returns a getReturnArray dictionary."""
     returnArray = getReturnArray(True, "", None)  # Initialize return array
+    clone_dir = None
 
     try:
-        # Set up Chrome options if needed
-        chrome_options = Options()
-        # Add any Chrome options if required
-        # For example:
-        # chrome_options.add_argument("--headless")  # Uncomment to run headless
-        
-        # Initialize the WebDriver
-        service = ChromeService(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.maximize_window()  # Maximize the browser window
+        if profile not in DRIVER_PROFILES:
+            return getReturnArray(False, f"Unknown driver profile '{profile}'. Valid values: {', '.join(DRIVER_PROFILES)}", None)
+        driver_path_result = get_chromedriver_path()
+        if not driver_path_result["status"]:
+            return driver_path_result
+
+        settings = DRIVER_PROFILES[profile]
+        chrome_options = settings['options'](rules)
+        if profile_template:
+            clone_result = clone_profile_template(profile_template)
+            if not clone_result["status"]:
+                return clone_result
+            clone_dir = clone_result["data"][0]
+            chrome_options.add_argument(f"--user-data-dir={clone_dir}")
+
+        driver = webdriver.Chrome(service=ChromeService(driver_path_result["data"][0]), options=chrome_options)
+        driver.s2i_profile_dir = clone_dir
+        driver.s2i_profile_template = profile_template
+        if settings['after_start']:
+            settings['after_start'](driver, rules)
         returnArray["data"] = driver
     except Exception as e:
-        returnArray = getReturnArray(False, f"Error initializing Chrome WebDriver: {str(e)}", None)
+        if clone_dir:
+            remove_profile_clone(clone_dir)
+        returnArray = getReturnArray(False, f"Error starting '{profile}' Chrome WebDriver: {str(e)}", None)
 
     return returnArray
 
 
+def create_webdriver(profile='headless', rules=None, prespawned_timeout=120, profile_template=None):
+    """
+    Returns a Chrome WebDriver for a named profile, reusing a prespawned driver when one is available.
+    When command tracing is enabled (see s2iTrace.enable_command_tracing), the driver's commands are traced.
+
+    Args:
+    profile (str): Driver profile: 'debug' (visible, maximized), 'headless', 'lean', or a registered profile.
+    rules (dict): Resource rules for the 'lean' profile. Default is LEAN_RESOURCE_RULES.
+    prespawned_timeout (float): Seconds to wait for a driver that prespawn_webdrivers is still starting. Default is 120.
+    profile_template (str): Chrome profile template directory. The driver runs on a private clone of it,
+                            so it starts with the template's HTTP cache. Default is None (fresh profile).
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (Chrome WebDriver instance).
+    """
+    key = _prespawn_key(profile, rules, profile_template)
+    with PRESPAWN_LOCK:
+        prespawned = PRESPAWNED_DRIVERS.get(key)
+        available = prespawned is not None and (not prespawned.empty() or PRESPAWN_PENDING.get(key, 0) > 0)
+
+    result = None
+    if available:
+        try:
+            result = prespawned.get(timeout=prespawned_timeout)
+            if not result["status"]:
+                logger.warning(f"Prespawned driver failed, starting a new one: {result['message']}")
+                result = None
+        except queue.Empty:
+            pass
+
+    if result is None:
+        result = _start_webdriver(profile, rules, profile_template)
+    if result["status"] and is_tracing_enabled():
+        trace_driver(result["data"])
+    return result
+
+
+def prespawn_webdrivers(count, profile='headless', rules=None, profile_template=None):
+    """
+    Starts WebDrivers in the background so later create_webdriver calls get one without waiting.
+
+    Args:
+    count (int): Number of drivers to start.
+    profile (str): Driver profile of the drivers.
+    rules (dict): Resource rules for the 'lean' profile.
+    profile_template (str): Chrome profile template directory, see create_webdriver.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (None).
+    """
+    key = _prespawn_key(profile, rules, profile_template)
+    with PRESPAWN_LOCK:
+        prespawned = PRESPAWNED_DRIVERS.setdefault(key, queue.Queue())
+        PRESPAWN_PENDING[key] = PRESPAWN_PENDING.get(key, 0) + count
+
+    def spawn():
+        try:
+            result = _start_webdriver(profile, rules, profile_template)
+        except Exception as e:
+            result = getReturnArray(False, str(e), None)
+        with PRESPAWN_LOCK:
+            prespawned.put(result)
+            PRESPAWN_PENDING[key] -= 1
+
+    for _ in range(count):
+        threading.Thread(target=spawn, name=f"prespawn-{profile}", daemon=True).start()
+
+    return getReturnArray(True, f"Prespawning {count} '{profile}' drivers", None)
+
+
+def shutdown_prespawned_webdrivers():
+    """
+    Waits for drivers still being prespawned and quits every prespawned driver nobody claimed.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (number of drivers closed).
+    """
+    closed = 0
+    with PRESPAWN_LOCK:
+        keys = list(PRESPAWNED_DRIVERS)
+
+    for key in keys:
+        prespawned = PRESPAWNED_DRIVERS[key]
+        while True:
+            with PRESPAWN_LOCK:
+                pending = PRESPAWN_PENDING.get(key, 0)
+            try:
+                result = prespawned.get(timeout=120) if pending > 0 else prespawned.get_nowait()
+            except queue.Empty:
+                break
+            if result["status"]:
+                close_driver(result["data"])
+                closed += 1
+
+    return getReturnArray(True, f"Closed {closed} unused prespawned drivers", closed)
+
+
+def run_webdriver_pool(tasks, worker_function, pool_size=4, driver_factory=None, setup_function=None, result_callback=None):
+    """
+    Processes tasks with a bounded pool of WebDriver workers.
+
+    Each worker owns one WebDriver instance and keeps claiming tasks from a shared queue
+    until the queue is empty, so a slow task only holds up the worker that claimed it.
+
+    Args:
+    tasks (list): Tasks to process, e.g. session card indexes.
+    worker_function (callable): Called as worker_function(driver, task). Should return a getReturnArray dictionary.
+    pool_size (int): Maximum number of WebDriver instances running at once. Default is 4.
+    driver_factory (callable): Returns a getReturnArray dictionary holding a WebDriver. Default is chrome_headless.
+    setup_function (callable): Optional setup_function(driver) run once per worker before it claims tasks.
+    result_callback (callable): Optional result_callback(task, result) run on the worker thread as soon as a
+                                task finishes, e.g. to checkpoint it. Must be thread-safe.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (list of dictionaries with
+          'task' and 'result' keys, in the same order as tasks).
+    """
+    tasks = list(tasks)
+    if not tasks:
+        return getReturnArray(True, "No tasks to process", [])
+
+    driver_factory = driver_factory or chrome_headless
+    task_queue = queue.Queue()
+    for position, task in enumerate(tasks):
+        task_queue.put((position, task))
+
+    results = [None] * len(tasks)
+    stop_event = threading.Event()
+
+    def worker(worker_id):
+        driver_result = driver_factory()
+        if not driver_result["status"]:
+            logger.error(f"Worker {worker_id} could not start a WebDriver: {driver_result['message']}")
+            return
+        driver = driver_result["data"]
+
+        try:
+            if setup_function:
+                setup_function(driver)
+
+            while not stop_event.is_set():
+                try:
+                    position, task = task_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                try:
+                    result = worker_function(driver, task)
+                except Exception as e:
+                    result = getReturnArray(False, f"Error processing task {task}: {str(e)}", None)
+                results[position] = {"task": task, "result": result}
+
+                if result_callback:
+                    try:
+                        result_callback(task, result)
+                    except Exception as e:
+                        logger.error(f"Result callback failed for task {task}: {str(e)}")
+        except Exception as e:
+            logger.error(f"Worker {worker_id} stopped: {str(e)}")
+        finally:
+            close_driver(driver)
+
+    pool_size = max(1, min(pool_size, len(tasks)))
+    threads = [threading.Thread(target=worker, args=(worker_id,), name=f"webdriver-worker-{worker_id}", daemon=True)
+               for worker_id in range(pool_size)]
+    for thread in threads:
+        thread.start()
+
+    try:
+        for thread in threads:
+            while thread.is_alive():
+                thread.join(0.5)
+    except KeyboardInterrupt:
+        stop_event.set()
+        raise
+
+    unprocessed = 0
+    for position, task in enumerate(tasks):
+        if results[position] is None:
+            unprocessed += 1
+            results[position] = {"task": task, "result": getReturnArray(False, "Task was not processed", None)}
+
+    if unprocessed:
+        return getReturnArray(False, f"{unprocessed} of {len(tasks)} tasks were not processed", results)
+    return getReturnArray(True, f"Processed {len(tasks)} tasks with {pool_size} workers", results)
+
+
+@timed_function('navigation')
 def scrape_url(driver, url):
     """
     Navigates the WebDriver to the specified URL and maximizes the window.
+    Errors of a failing site are retried with backoff and counted by the domain's circuit breaker (see run_with_retries).
 
     Args:
     driver (WebDriver): Initialized WebDriver instance.
@@ -550,8 +1617,9 @@ def scrape_url(driver, url):
     returnArray = getReturnArray(True, "", None)  # Initialize return array
 
     try:
-        # Navigate to the specified URL
-        driver.get(url)
+        # Navigate to the specified URL, retrying while the site is failing
+        driver.s2i_domain = getDomainName(url)
+        run_with_retries(driver, 'navigation', lambda: driver.get(url))
         # Maximize the browser window
         driver.maximize_window()
     except Exception as e:
@@ -580,7 +1648,13 @@ def close_overlays(driver):
             close_button = overlay.find_element(By.CSS_SELECTOR, 'button.close')
             if close_button:
                 close_button.click()
-                time.sleep(1)  # Give some time for the overlay to close
+                # Return as soon as the overlay is gone rather than after a fixed delay
+                start = time.monotonic()
+                try:
+                    WebDriverWait(driver, 1, poll_frequency=0.05).until(EC.invisibility_of_element(overlay))
+                    record_wait_timing('close_overlay', time.monotonic() - start, 1, True, fixed_sleep=1)
+                except TimeoutException:
+                    record_wait_timing('close_overlay', time.monotonic() - start, 1, False, fixed_sleep=1)
     except NoSuchElementException:
         returnArray.update({"message": "No overlay found"})
     except Exception as e:
@@ -590,33 +1664,36 @@ def close_overlays(driver):
 
 
 
-def click_element_multiple_retries(driver, element, retries=3):
+@timed_function('click')
+def click_element_multiple_retries(driver, element, retries=3, policy=None):
     """
-    Attempts to click an element multiple times with retries.
+    Attempts to click an element multiple times, backing off between attempts as set by the retry policy.
 
     Args:
     driver (WebDriver): Initialized WebDriver instance.
     element (WebElement): Element to be clicked.
-    retries (int): Number of retries in case of failure. Default is 3.
+    retries (int): Number of attempts in case of failure. Default is 3.
+    policy (RetryPolicy): Retry policy; overrides retries. Default is DEFAULT_RETRY_POLICY with retries attempts.
 
     Returns:
     dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (True if successful, False otherwise).
     """
+    if policy is None:
+        policy = RetryPolicy(retries, DEFAULT_RETRY_POLICY.base_delay, DEFAULT_RETRY_POLICY.max_delay,
+                             DEFAULT_RETRY_POLICY.multiplier, DEFAULT_RETRY_POLICY.jitter)
+
+    def click():
+        WebDriverWait(driver, 10).until(EC.element_to_be_clickable(element))
+        ActionChains(driver).move_to_element(element).click().perform()
+
     try:
-        for attempt in range(retries):
-            try:
-                WebDriverWait(driver, 10).until(EC.element_to_be_clickable(element))
-                ActionChains(driver).move_to_element(element).click().perform()
-                return getReturnArray(True, "", True)
-            except (ElementClickInterceptedException, TimeoutException) as e:
-                time.sleep(attempt + 1)  # Increase delay on each retry
-                if attempt == retries - 1:
-                    return getReturnArray(False, str(e), False)
+        run_with_retries(driver, 'click', click, policy)
+        return getReturnArray(True, "", True)
+    except (ElementClickInterceptedException, TimeoutException) as e:
+        return getReturnArray(False, str(e), False)
     except Exception as e:
         return getReturnArray(False, str(e), None)
 
-    return getReturnArray(False, "Unknown error occurred", False)
-
 
 def find_elements(driver, xpath):
     """
@@ -636,7 +1713,268 @@ def find_elements(driver, xpath):
     except Exception as e:
 
         return getReturnArray(False, str(e), [])
-    
+
+
+# JavaScript evaluated inside the page by snapshot_xpaths. Every node is reduced to its
+# rendered text and href so the whole result serializes in a single response.
+SNAPSHOT_XPATHS_SCRIPT = """
+var xpaths = arguments[0], sectionXpath = arguments[1], sectionXpaths = arguments[2];
+var errors = {};
+function evaluate(xpath, context) {
+    var nodes = [];
+    try {
+        var result = document.evaluate(xpath, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (var i = 0; i < result.snapshotLength; i++) {
+            var node = result.snapshotItem(i);
+            var text = node.innerText !== undefined ? node.innerText : node.textContent;
+            var href = node.href !== undefined ? String(node.href) : (node.getAttribute ? node.getAttribute('href') : null);
+            nodes.push({text: text || '', href: href || null});
+        }
+    } catch (e) {
+        errors[xpath] = String(e);
+    }
+    return nodes;
+}
+var snapshot = {url: window.location.href, xpaths: {}, sections: [], errors: errors};
+for (var i = 0; i < xpaths.length; i++) {
+    snapshot.xpaths[xpaths[i]] = evaluate(xpaths[i], document);
+}
+if (sectionXpath) {
+    var sections = document.evaluate(sectionXpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var s = 0; s < sections.snapshotLength; s++) {
+        var section = {};
+        for (var j = 0; j < sectionXpaths.length; j++) {
+            section[sectionXpaths[j]] = evaluate(sectionXpaths[j], sections.snapshotItem(s));
+        }
+        snapshot.sections.push(section);
+    }
+}
+return snapshot;
+"""
+
+
+def snapshot_xpaths(driver, xpaths, section_xpath=None, section_xpaths=None):
+    """
+    Evaluates many XPaths inside the page with a single execute_script round-trip.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance.
+    xpaths (list): Document-level XPath expressions to evaluate.
+    section_xpath (str): Optional XPath locating repeated sections (e.g. presentation sections).
+    section_xpaths (list): Section-relative XPath expressions (e.g. './/h6') evaluated inside every section.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (snapshot dictionary).
+          The snapshot holds 'url', 'xpaths' (XPath -> list of {'text', 'href'}), 'sections'
+          (one such mapping per section) and 'errors' (XPath -> evaluation error).
+    """
+    try:
+        snapshot = driver.execute_script(SNAPSHOT_XPATHS_SCRIPT, list(xpaths), section_xpath, list(section_xpaths or []))
+        return getReturnArray(True, "Page snapshot taken", snapshot)
+    except Exception as e:
+        return getReturnArray(False, f"Error taking page snapshot: {str(e)}", None)
+
+
+# JavaScript evaluated inside the page by harvest_links: one link (and optional id attribute) per item
+HARVEST_LINKS_SCRIPT = """
+var itemXpath = arguments[0], linkXpath = arguments[1], idAttribute = arguments[2];
+var items = document.evaluate(itemXpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+var links = [];
+for (var i = 0; i < items.snapshotLength; i++) {
+    var item = items.snapshotItem(i), href = null, id = null;
+    var link = linkXpath ? document.evaluate(linkXpath, item, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue : item;
+    if (link) {
+        href = link.href !== undefined ? String(link.href) : link.getAttribute('href');
+    }
+    if (idAttribute) {
+        var holder = document.evaluate('(ancestor-or-self::*|descendant::*)[@' + idAttribute + ']', item, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        id = holder ? holder.getAttribute(idAttribute) : null;
+    }
+    links.push({href: href || null, id: id});
+}
+return links;
+"""
+
+
+def harvest_links(driver, item_xpath, link_xpath=None, id_attribute=None):
+    """
+    Collects the link of every item on a listing page in a single execute_script round-trip.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance showing the listing page.
+    item_xpath (str): XPath locating the listing items (e.g. session cards).
+    link_xpath (str): Item-relative XPath of the item's link (e.g. './/a[@href]'). Default is the item itself.
+    id_attribute (str): Optional attribute holding the item's ID, for items that link through a click handler.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (list of {'href', 'id'}
+          dictionaries, one per item in listing order).
+    """
+    try:
+        links = driver.execute_script(HARVEST_LINKS_SCRIPT, item_xpath, link_xpath, id_attribute)
+        return getReturnArray(True, f"Harvested {len(links)} listing items", links)
+    except Exception as e:
+        return getReturnArray(False, f"Error harvesting links: {str(e)}", [])
+
+
+def capture_page_source(driver):
+    """
+    Captures the rendered DOM and URL of the current page in a single execute_script round-trip.
+
+    Args:
+    driver (WebDriver): Initialized WebDriver instance.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (dictionary with 'html' and 'url').
+    """
+    try:
+        html, url = driver.execute_script("return [document.documentElement.outerHTML, window.location.href];")
+        return getReturnArray(True, "Page source captured", {"html": html, "url": url})
+    except Exception as e:
+        return getReturnArray(False, f"Error capturing page source: {str(e)}", None)
+
+
+# Elements whose boundaries start a new line in rendered text, mirroring WebElement.text
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt', 'fieldset', 'figcaption', 'figure',
+    'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p',
+    'pre', 'section', 'table', 'tr', 'ul'
+}
+SKIPPED_TAGS = {'script', 'style', 'template', 'noscript'}
+
+
+@functools.lru_cache(maxsize=256)
+def compile_xpath(xpath):
+    """
+    Compiles an XPath expression for lxml once and reuses it for every page.
+
+    Args:
+    xpath (str): XPath expression.
+
+    Returns:
+    lxml.etree.XPath: Compiled XPath evaluator.
+    """
+    from lxml import etree
+    return etree.XPath(xpath)
+
+
+def _rendered_text(node):
+    """Approximates the rendered text (WebElement.text) of an lxml element."""
+    chunks = []
+
+    def walk(element):
+        tag = element.tag if isinstance(element.tag, str) else ''
+        if tag in SKIPPED_TAGS:
+            return
+        if tag == 'br':
+            chunks.append('\n')
+        elif tag in BLOCK_TAGS:
+            chunks.append('\n')
+        if element.text and tag:
+            chunks.append(element.text)
+        for child in element:
+            walk(child)
+            if child.tail:
+                chunks.append(child.tail)
+        if tag in BLOCK_TAGS:
+            chunks.append('\n')
+
+    walk(node)
+    text = re.sub(r'[ \t\r\f\v\u00a0]+', ' ', ''.join(chunks))
+    lines = [line.strip() for line in text.split('\n')]
+    return '\n'.join(line for line in lines if line)
+
+
+def _lxml_snapshot_nodes(context, xpath, url, errors):
+    """Evaluates one XPath with lxml and reduces the result to {'text', 'href'} dictionaries."""
+    nodes = []
+    try:
+        results = compile_xpath(xpath)(context)
+    except Exception as e:
+        errors[xpath] = str(e)
+        return nodes
+
+    if not isinstance(results, list):
+        results = [results]
+    for result in results:
+        if isinstance(result, str):
+            nodes.append({"text": str(result), "href": None})
+            continue
+        href = result.get('href')
+        nodes.append({
+            "text": _rendered_text(result),
+            "href": urljoin(url, href) if (href is not None and url) else href
+        })
+    return nodes
+
+
+def snapshot_page_source(page_source, xpaths, section_xpath=None, section_xpaths=None, url=None):
+    """
+    Evaluates many XPaths over captured page source with lxml, without talking to the browser.
+
+    Produces the same snapshot structure as snapshot_xpaths, so consumers of one accept the other.
+
+    Args:
+    page_source (str): Rendered HTML of the page, e.g. from capture_page_source.
+    xpaths (list): Document-level XPath expressions to evaluate.
+    section_xpath (str): Optional XPath locating repeated sections (e.g. presentation sections).
+    section_xpaths (list): Section-relative XPath expressions (e.g. './/h6') evaluated inside every section.
+    url (str): URL of the page, used to resolve relative hrefs the way the browser does.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (snapshot dictionary).
+    """
+    try:
+        from lxml import html as lxml_html
+
+        document = lxml_html.fromstring(page_source)
+        errors = {}
+        snapshot = {"url": url, "xpaths": {}, "sections": [], "errors": errors}
+
+        for xpath in xpaths:
+            snapshot["xpaths"][xpath] = _lxml_snapshot_nodes(document, xpath, url, errors)
+
+        if section_xpath:
+            for section in compile_xpath(section_xpath)(document):
+                snapshot["sections"].append({
+                    xpath: _lxml_snapshot_nodes(section, xpath, url, errors) for xpath in (section_xpaths or [])
+                })
+
+        return getReturnArray(True, "Page source snapshot taken", snapshot)
+    except Exception as e:
+        return getReturnArray(False, f"Error evaluating page source: {str(e)}", None)
+
+
+def get_snapshot_nodes(snapshot, xpath):
+    """
+    Looks up the nodes captured for a document-level XPath in a page snapshot.
+
+    Args:
+    snapshot (dict): Snapshot returned by snapshot_xpaths, or None.
+    xpath (str): XPath expression that was captured.
+
+    Returns:
+    list: List of {'text', 'href'} dictionaries, or None if the snapshot does not cover the XPath.
+    """
+    if not snapshot or not xpath:
+        return None
+    return snapshot.get("xpaths", {}).get(xpath)
+
+
+def get_snapshot_section_nodes(snapshot, xpath):
+    """
+    Looks up the nodes captured for a section-relative XPath in every section of a page snapshot.
+
+    Args:
+    snapshot (dict): Snapshot returned by snapshot_xpaths, or None.
+    xpath (str): Section-relative XPath expression that was captured.
+
+    Returns:
+    list: One list of {'text', 'href'} dictionaries per section, or None if the snapshot does not cover sections.
+    """
+    if not snapshot or not xpath or "sections" not in snapshot:
+        return None
+    return [section.get(xpath, []) for section in snapshot["sections"]]
 
 
 
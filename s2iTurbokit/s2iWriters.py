@@ -0,0 +1,253 @@
+##### s2iTurbokit streaming row writer module
+#
+# Writers take rows as they are produced and flush them in batches, so memory stays bounded by the
+# batch size rather than the dataset and the output can be inspected while a long scrape runs.
+# All writers share the RowWriter interface: write_rows(rows), flush(), close(). They are safe to
+# share between worker threads.
+
+from .s2iHelperFunctions import getReturnArray, checkPath
+from .s2iMetrics import observe
+import csv
+import datetime
+import decimal
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RowWriter:
+    """
+    Base class of the streaming writers. Buffers rows and hands them to _write_batch in batches.
+
+    Args:
+    path (str): Output file path.
+    columns (list): Column names, in output order.
+    batch_size (int): Rows buffered before they are written out. Default is 100.
+    flush_interval (float): Seconds after which buffered rows are written even if the batch is not full. Default is 5.
+    """
+
+    def __init__(self, path, columns, batch_size=100, flush_interval=5):
+        self.path = path
+        self.columns = list(columns)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.buffer = []
+        self.rows_written = 0
+        self.rows_failed = 0
+        self.last_flush = time.monotonic()
+        self.lock = threading.Lock()
+
+        checkPath(os.path.dirname(os.path.abspath(path)))
+
+    def write_rows(self, rows):
+        """
+        Buffers rows and writes them out once a batch is full or the flush interval has passed.
+
+        Args:
+        rows (iterable): Rows as dictionaries keyed by column name, or sequences in column order.
+        """
+        with self.lock:
+            for row in rows:
+                if isinstance(row, dict):
+                    row = [row.get(column, "") for column in self.columns]
+                self.buffer.append(row)
+            if len(self.buffer) >= self.batch_size or time.monotonic() - self.last_flush >= self.flush_interval:
+                self._flush()
+
+    def flush(self):
+        """Writes out all buffered rows."""
+        with self.lock:
+            self._flush()
+
+    def _flush(self):
+        if self.buffer:
+            rows, self.buffer = self.buffer, []
+            start = time.monotonic()
+            try:
+                self._write_batch(rows)
+            except Exception as e:
+                # Set the batch aside so later batches and close() still succeed
+                self._quarantine(rows, e)
+                raise
+            observe('stage_seconds', time.monotonic() - start, stage='write', function=type(self).__name__)
+            self.rows_written += len(rows)
+        self.last_flush = time.monotonic()
+
+    def _quarantine(self, rows, error):
+        """Appends a batch that could not be written to <path>.failed.jsonl, one object per row."""
+        self.rows_failed += len(rows)
+        failed_path = f"{self.path}.failed.jsonl"
+        logger.error(f"Could not write {len(rows)} rows to {self.path} ({type(error).__name__}: {error}); saved them to {failed_path}")
+        try:
+            with open(failed_path, 'a', encoding='utf-8') as f:
+                f.write(''.join(json.dumps(dict(zip(self.columns, row)), default=str) + '\n' for row in rows))
+        except Exception as e:
+            logger.error(f"Could not save the failed rows to {failed_path}: {str(e)}")
+
+    def _write_batch(self, rows):
+        raise NotImplementedError
+
+    def close(self):
+        """Writes out buffered rows and closes the output file, also when the last batch fails."""
+        with self.lock:
+            try:
+                self._flush()
+            finally:
+                start = time.monotonic()
+                self._close()
+                observe('stage_seconds', time.monotonic() - start, stage='write_close', function=type(self).__name__)
+
+    def _close(self):
+        pass
+
+
+class CsvRowWriter(RowWriter):
+    """Streams rows to a UTF-8 CSV file with a header row."""
+
+    def __init__(self, path, columns, batch_size=100, flush_interval=5):
+        super().__init__(path, columns, batch_size, flush_interval)
+        self.file = open(path, 'w', encoding='utf-8', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(self.columns)
+
+    def _write_batch(self, rows):
+        self.writer.writerows(rows)
+        self.file.flush()
+
+    def _close(self):
+        self.file.close()
+
+
+class JsonlRowWriter(RowWriter):
+    """Streams rows to a JSON Lines file, one object keyed by column name per row."""
+
+    def __init__(self, path, columns, batch_size=100, flush_interval=5):
+        super().__init__(path, columns, batch_size, flush_interval)
+        self.file = open(path, 'w', encoding='utf-8')
+
+    def _write_batch(self, rows):
+        self.file.write(''.join(json.dumps(dict(zip(self.columns, row)), default=str) + '\n' for row in rows))
+        self.file.flush()
+
+    def _close(self):
+        self.file.close()
+
+
+class XlsxRowWriter(RowWriter):
+    """
+    Streams rows to an Excel workbook with openpyxl's write-only mode.
+
+    openpyxl spools the rows to a temporary file, so memory stays constant, but the workbook is
+    only complete once close() has run.
+    """
+
+    def __init__(self, path, columns, batch_size=100, flush_interval=5):
+        from openpyxl import Workbook
+
+        super().__init__(path, columns, batch_size, flush_interval)
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet()
+        self.sheet.append(self.columns)
+
+    def _write_batch(self, rows):
+        # A failed append leaves the write-only sheet unusable, so the whole batch is converted first
+        cells = [[self._cell(value) for value in row] for row in rows]
+        for row in cells:
+            self.sheet.append(row)
+
+    @staticmethod
+    def _cell(value):
+        """Returns a value openpyxl accepts: other types (e.g. lists) as text, control characters removed."""
+        from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+        if value is None or isinstance(value, (int, float, decimal.Decimal, datetime.date, datetime.time, datetime.timedelta)):
+            return value
+        return ILLEGAL_CHARACTERS_RE.sub('', value if isinstance(value, str) else str(value))
+
+    def _close(self):
+        self.workbook.save(self.path)
+
+
+class ParquetRowWriter(RowWriter):
+    """
+    Streams rows to a Parquet dataset directory, one file per batch and partition.
+
+    An existing dataset at path is replaced. Every flushed batch is immediately readable with
+    pyarrow.dataset or pandas.read_parquet(path).
+
+    Args:
+    path (str): Dataset root directory.
+    columns (list): Column names of the incoming rows.
+    batch_size (int): Rows per written batch. Default is 100.
+    flush_interval (float): Seconds after which buffered rows are written even if the batch is not full. Default is 5.
+    table_builder (callable): Optional table_builder(columns, rows) returning a pyarrow.Table, e.g. to apply a
+                              typed schema. Default builds an all-string table.
+    partition_cols (list): Columns of the built table to partition the dataset by (hive layout). Default is None.
+    """
+
+    def __init__(self, path, columns, batch_size=100, flush_interval=5, table_builder=None, partition_cols=None):
+        import pyarrow  # noqa: F401 - fail at open time rather than at the first flush
+
+        super().__init__(path, columns, batch_size, flush_interval)
+        self.table_builder = table_builder
+        self.partition_cols = partition_cols
+        self.batch_number = 0
+        self.run_id = f"{int(time.time())}-{os.getpid()}"
+
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        checkPath(path)
+
+    def _write_batch(self, rows):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self.table_builder:
+            table = self.table_builder(self.columns, rows)
+        else:
+            table = pa.table({column: [None if row[i] is None else str(row[i]) for row in rows]
+                              for i, column in enumerate(self.columns)})
+
+        pq.write_to_dataset(table, root_path=self.path, partition_cols=self.partition_cols,
+                            basename_template=f"part-{self.run_id}-{self.batch_number}-{{i}}.parquet",
+                            existing_data_behavior='overwrite_or_ignore')
+        self.batch_number += 1
+
+
+ROW_WRITERS = {
+    'csv': CsvRowWriter,
+    'jsonl': JsonlRowWriter,
+    'xlsx': XlsxRowWriter,
+    'parquet': ParquetRowWriter,
+}
+
+
+def open_row_writer(path, columns, output_format=None, batch_size=100, flush_interval=5, **writer_options):
+    """
+    Opens a streaming row writer for the output format, taken from the file extension by default.
+
+    Args:
+    path (str): Output file path.
+    columns (list): Column names, in output order.
+    output_format (str): 'csv', 'jsonl', 'xlsx' or 'parquet'. Default is the extension of path.
+    batch_size (int): Rows buffered before they are written out. Default is 100.
+    flush_interval (float): Seconds after which buffered rows are written even if the batch is not full. Default is 5.
+    **writer_options: Format-specific options, e.g. table_builder and partition_cols for 'parquet'.
+
+    Returns:
+    dict: A dictionary containing 'status' (bool), 'message' (str), and 'data' (RowWriter instance).
+    """
+    output_format = (output_format or os.path.splitext(path)[1].lstrip('.')).lower()
+
+    try:
+        if output_format not in ROW_WRITERS:
+            return getReturnArray(False, f"Unsupported output format '{output_format}'. Valid values: {', '.join(ROW_WRITERS)}", None)
+        writer = ROW_WRITERS[output_format](path, columns, batch_size=batch_size, flush_interval=flush_interval, **writer_options)
+        return getReturnArray(True, f"Writing {output_format} rows to {path}", writer)
+    except Exception as e:
+        return getReturnArray(False, f"Error opening {output_format} writer for {path}: {str(e)}", None)